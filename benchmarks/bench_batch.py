@@ -0,0 +1,56 @@
+"""Benchmark of vbelts.power.belt_qty_batch against a loop of TransPower objects.
+
+Usage::
+
+    python benchmarks/bench_batch.py [drives] [repeats]
+
+Both are timed with :func:`timeit.repeat` and reported as the best of the repeats, the other processes of the
+machine only slow a run down.
+"""
+import os
+import random
+import sys
+from timeit import repeat
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy  # noqa: E402
+from vbelts import power  # noqa: E402
+
+
+def drives(size, seed=0):
+    """Valid HiPower and SuperHC drives spread over all profiles and table positions."""
+    rnd = random.Random(seed)
+    models = {'HiPower': {'a': ('A-46', 1200), 'b': ('B-60', 1565), 'c': ('C-90', 2350), 'd': ('D-120', 3130)},
+              'SuperHC': {'3v': ('3V500', 1270), '5v': ('5V1000', 2540), '8v': ('8V1600', 4065)}}
+    rows = []
+    for _ in range(size):
+        model = rnd.choice(list(models))
+        profile = rnd.choice(list(models[model]))
+        b_type, l_corr = models[model][profile]
+        diams = power._pb_index(model, profile).diams
+        min_diam = rnd.uniform(diams[0], diams[-1])
+        maj_diam = min_diam * rnd.uniform(1.1, 2.5)
+        rows.append((model, profile, b_type, rnd.uniform(1, 50), maj_diam/min_diam, l_corr, min_diam, maj_diam, rnd.uniform(200, 1700)))
+    return rows
+
+
+def main(size=100000, repeats=5):
+    rows = drives(size)
+    columns = [numpy.array(column) for column in zip(*rows)]
+    power.belt_qty_batch(*(column[:10] for column in columns))  # build the compiled arrays outside the timing
+
+    def objects():
+        for row in rows:
+            try:
+                power.TransPower(*row).belt_qty()
+            except Exception:
+                pass
+
+    loop = min(repeat(objects, repeat=repeats, number=1))
+    batch = min(repeat(lambda: power.belt_qty_batch(*columns), repeat=repeats, number=1))
+    print(f'{size} drives: loop {loop:.3f} s, batch {batch:.3f} s, speedup {loop/batch:.0f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
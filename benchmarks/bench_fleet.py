@@ -0,0 +1,72 @@
+"""Benchmark of vbelts.fleet.rerate with the number of worker processes.
+
+Reports the time of each run and the peak private and shared resident memory of the workers, sampled from
+/proc while they run. The private memory stays flat as the workers grow, since they attach the tables and the
+drives in shared memory instead of receiving copies, and the shared pages are the same for all of them.
+
+Usage::
+
+    python benchmarks/bench_fleet.py [drives]
+"""
+import os
+import sys
+import threading
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from vbelts import fleet  # noqa: E402
+
+
+def drives(size):
+    import numpy
+    rnd = numpy.random.default_rng(0)
+    min_diam = rnd.uniform(65, 400, size)
+    vbelt_profile = numpy.array(['a', 'b', 'c', 'd', '3v', '5v', '8v'])[rnd.integers(0, 7, size)]
+    vbelt_model = numpy.where(numpy.isin(vbelt_profile, ['3v', '5v', '8v']), 'SuperHC', 'HiPower')
+    return min_diam, min_diam * rnd.uniform(1, 3, size), vbelt_model, vbelt_profile, rnd.uniform(1, 50, size), rnd.uniform(500, 3000, size)
+
+
+def _children():
+    """Resident memory of the worker processes started by this one, private and shared, [MB]"""
+    parent = str(os.getpid())
+    memory = {}
+    for pid in filter(str.isdigit, os.listdir('/proc')):
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as cmdline:
+                if b'spawn_main' not in cmdline.read():  # a worker, not a fork about to exec one
+                    continue
+            with open(f'/proc/{pid}/status') as status:
+                fields = dict(line.split(':', 1) for line in status)
+        except OSError:
+            continue
+        if fields.get('PPid', '').strip() == parent and 'RssAnon' in fields:
+            memory[pid] = tuple(int(fields[key].split()[0]) / 1024 for key in ('RssAnon', 'RssShmem'))
+    return memory
+
+
+def _sample(peaks, done):
+    while not done.wait(0.02):
+        for pid, memory in _children().items():
+            peaks[pid] = tuple(map(max, peaks.get(pid, (0, 0)), memory))
+
+
+def main(size=2000000):
+    columns = drives(size)
+    print(f'{size} drives')
+    for processes in sorted({2, 4, max(2, os.cpu_count() or 1), 8}):
+        peaks, done = {}, threading.Event()
+        sampler = threading.Thread(target=_sample, args=(peaks, done))
+        sampler.start()
+        t_i = perf_counter()
+        fleet.rerate(*columns, processes=processes)
+        elapsed = perf_counter() - t_i
+        done.set()
+        sampler.join()
+        private = max((memory[0] for memory in peaks.values()), default=0)
+        shared = max((memory[1] for memory in peaks.values()), default=0)
+        print(f'{processes:>3} processes: {elapsed:.2f} s, {size/elapsed:.0f} drives/s, largest worker {private:.0f} MB private, {shared:.0f} MB shared')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""Benchmark of the startup cost of import vbelts.
+
+Reports the cumulative import time of the package from python -X importtime, with and without a
+bytecode cache, and the memory allocated by the import and by the first TransPower calculation.
+Pass the src directories of other checkouts to compare them, for example a git worktree of an
+older release.
+
+Usage::
+
+    python benchmarks/bench_import.py [src_dir ...]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+MEMORY = '''
+import tracemalloc
+tracemalloc.start()
+import vbelts
+imported = tracemalloc.get_traced_memory()[0]
+vbelts.power.TransPower('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750).belt_qty()
+print(imported, tracemalloc.get_traced_memory()[0])
+'''
+
+
+def run(src_dir, args, cache_dir):
+    env = dict(os.environ, PYTHONPATH=src_dir, PYTHONPYCACHEPREFIX=cache_dir)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return subprocess.run([sys.executable] + args, env=env, capture_output=True, text=True, check=True)
+
+
+def import_time(src_dir, cache_dir, repeat=5):
+    """Best cumulative import time of the vbelts package, [ms]"""
+    times = []
+    for _ in range(repeat):
+        stderr = run(src_dir, ['-X', 'importtime', '-c', 'import vbelts'], cache_dir).stderr
+        line = [line for line in stderr.splitlines() if line.endswith('| vbelts')][0]
+        times.append(int(line.split('|')[1]) / 1000)
+    return min(times)
+
+
+def main(src_dirs):
+    print(f'{"src":<40}{"cold [ms]":>12}{"cached [ms]":>12}{"import [kB]":>13}{"first use [kB]":>16}')
+    for src_dir in src_dirs:
+        with tempfile.TemporaryDirectory() as cold, tempfile.TemporaryDirectory() as warm:
+            cold_time = min(import_time(src_dir, os.path.join(cold, str(i)), repeat=1) for i in range(5))
+            run(src_dir, ['-c', 'import vbelts'], warm)
+            warm_time = import_time(src_dir, warm)
+            imported, used = (int(value) / 1024 for value in run(src_dir, ['-c', MEMORY], warm).stdout.split())
+        print(f'{os.path.relpath(src_dir):<40}{cold_time:>12.1f}{warm_time:>12.1f}{imported:>13.0f}{used:>16.0f}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or [SRC])
@@ -0,0 +1,51 @@
+"""Benchmark of the rating table lookups behind TransPower._basic and TransPower._additional.
+
+Compares the row by row scan of _ReIterate against the compiled bisection indexes for inputs
+matching the first, middle and last rows of the largest tables. The scan grows with the table
+position, the index lookup does not.
+
+Usage::
+
+    python benchmarks/bench_index.py
+"""
+import os
+import sys
+from timeit import repeat
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from vbelts import power  # noqa: E402
+from vbelts.util import _ReIterate  # noqa: E402
+
+
+def best_of(func, number=2000):
+    """Best time of a call, [us]"""
+    return min(repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def positions(dict_list, *columns):
+    """Table inputs matching the first, middle and last rows."""
+    rows = {'first': dict_list[0], 'middle': dict_list[len(dict_list) // 2], 'last': dict_list[-1]}
+    return {name: tuple(float(row[column]) for column in columns) for name, row in rows.items()}
+
+
+def main():
+    iterator = _ReIterate()
+    print(f'{"table":<16}{"position":<10}{"scan [us]":>12}{"index [us]":>12}')
+    for model, profile in [('HiPower', 'd'), ('SuperHC', '3v')]:
+        table_pb = getattr(power, f'{model}_{profile}_pb')
+        index_pb = power._pb_index(model, profile)
+        for name, (diam, rpm) in positions(table_pb, 'diameter', 'rpm').items():
+            scan = best_of(lambda: iterator.three_rows(table_pb, diam, rpm))
+            index = best_of(lambda: index_pb.lookup(diam, rpm))
+            print(f'{model}_{profile}_pb'.ljust(16) + f'{name:<10}{scan:>12.2f}{index:>12.2f}')
+        table_pa = getattr(power, f'{model}_{profile}_pa')
+        index_pa = power._pa_index(model, profile)
+        for name, (g_ratio, rpm) in positions(table_pa, 'gr_low', 'rpm').items():
+            scan = best_of(lambda: iterator.four_rows(table_pa, g_ratio, rpm))
+            index = best_of(lambda: index_pa.lookup(g_ratio, rpm))
+            print(f'{model}_{profile}_pa'.ljust(16) + f'{name:<10}{scan:>12.2f}{index:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of the memory taken by each kept result of the belt sizing.
+
+Sizes the same drives and keeps them as PulleyBelt and TransPower objects, as a list of
+vbelts.results.BeltResult and as a vbelts.results.ResultSet, reporting the bytes per result
+traced by tracemalloc and the time to convert the set to NumPy arrays.
+
+Usage::
+
+    python benchmarks/bench_memory.py [results]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from vbelts import length, power, results  # noqa: E402
+
+
+def drives(size):
+    """Valid HiPower drives of the a and b profiles, with distinct results."""
+    rows = []
+    for i in range(size):
+        min_diam = 130 + i % 40
+        rows.append((min_diam, min_diam * 1.85, 'HiPower', 'a' if i % 2 else 'b', 2 + i % 7 * 0.5, 1150 + i % 13 * 10))
+    return rows
+
+
+def _objects(rows):
+    kept = []
+    for min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm in rows:
+        distance = length.PulleyBelt(min_diam, maj_diam, vbelt_model, vbelt_profile)
+        distance.c_c()
+        trans_power = power.TransPower(vbelt_model, vbelt_profile, distance.b_type, est_power, maj_diam / min_diam, distance.l_corr, min_diam, maj_diam, rpm)
+        trans_power.belt_qty()
+        kept.append((distance, trans_power))
+    return kept
+
+
+def _records(rows):
+    return [results.size(*row) for row in rows]
+
+
+def measure(build, rows):
+    """Bytes allocated by the kept results of build(rows), [B]"""
+    gc.collect()
+    tracemalloc.start()
+    kept = build(rows)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return allocated
+
+
+def main(size=100000):
+    rows = drives(size)
+    results.size_many(rows[:10]).to_numpy()  # compile the indexes and import numpy outside the measure
+    print(f'{size} results')
+    for label, build in (('PulleyBelt + TransPower', _objects), ('BeltResult list', _records), ('ResultSet', results.size_many)):
+        print(f'{label:<26}{measure(build, rows) / size:>8.0f} B/result')
+    result_set = results.size_many(rows)
+    t_i = perf_counter()
+    result_set.to_numpy()
+    print(f'ResultSet.to_numpy{(perf_counter() - t_i) * 1e3:>16.2f} ms, {result_set.nbytes() / size:.0f} B/result in the columns')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
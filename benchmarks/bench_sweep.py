@@ -0,0 +1,30 @@
+"""Benchmark of the scaling of vbelts.sweep.sweep_many with the number of worker processes.
+
+Usage::
+
+    python benchmarks/bench_sweep.py [drives] [step]
+"""
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from vbelts import sweep  # noqa: E402
+
+
+def main(size=200, step=1):
+    drives = [(5 + i % 40, 1750, 500 + i * 7 % 900) for i in range(size)]
+    total = sum(1 for _ in sweep.candidates(drives, step=step))
+    print(f'{size} drives, {total} candidates')
+    base = None
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        t_i = perf_counter()
+        sweep.sweep_many(drives, step=step, processes=processes)
+        elapsed = perf_counter() - t_i
+        base = base or elapsed
+        print(f'{processes:>3} processes: {elapsed:.2f} s, {total/elapsed:.0f} candidates/s, speedup {base/elapsed:.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(float(arg) if i else int(arg) for i, arg in enumerate(sys.argv[1:])))
@@ -0,0 +1,116 @@
+"""Load test of the vbelts.server sizing service.
+
+Starts the service in a subprocess for each batching window, unless --port points to a running one, and sends
+the requests from concurrent keep-alive clients, reporting the throughput and the latency percentiles.
+
+Usage::
+
+    python benchmarks/load_server.py                             # compare the windows 0, 1, 2 and 5 ms
+    python benchmarks/load_server.py --clients 128 --requests 20000 --windows 2
+    python benchmarks/load_server.py --port 8080                 # a service already running
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+src = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+drives = [('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750),
+          ('HiPower', 'b', 'B-60', 12, 2.1, 1565, 140, 294, 1150),
+          ('HiPower', 'd', 'D-120', 80, 1.4, 3130, 355, 500, 870),
+          ('SuperHC', '3v', '3V500', 4, 1.8, 1270, 90, 162, 1160),
+          ('SuperHC', '8v', '8V1600', 150, 1.3, 4065, 400, 520, 575)]
+fields = ('vbelt_model', 'vbelt_profile', 'vbelt_type', 'est_power', 'gear_ratio', 'belt_length_corr', 'min_diam', 'maj_diam', 'rpm')
+
+
+def _request(rnd):
+    drive = dict(zip(fields, rnd.choice(drives)))
+    drive['est_power'] *= rnd.uniform(0.5, 1.5)
+    body = json.dumps(drive).encode()
+    return b'POST /belts HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+
+
+async def _client(port, count, latencies, seed):
+    rnd = random.Random(seed)
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for _ in range(count):
+        start = time.perf_counter()
+        writer.write(_request(rnd))
+        await writer.drain()
+        status = await reader.readline()
+        size = 0
+        while True:
+            line = await reader.readline()
+            if line == b'\r\n':
+                break
+            if line.lower().startswith(b'content-length:'):
+                size = int(line.split(b':')[1])
+        await reader.readexactly(size)
+        if b' 200 ' not in status:
+            raise RuntimeError(status)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def _load(port, clients, requests):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(port, requests // clients, latencies, seed) for seed in range(clients)))
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def _wait(port, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), 0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError('the service did not start')
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run(port, clients, requests, label):
+    elapsed, latencies = asyncio.run(_load(port, clients, requests))
+    done = len(latencies)
+    print(f'{label:<14}{done / elapsed:>10.0f} req/s{latencies[done // 2] * 1e3:>10.2f} ms p50{latencies[int(done * 0.99)] * 1e3:>10.2f} ms p99')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test of the vbelts.server sizing service.')
+    parser.add_argument('--port', type=int, help='port of a running service, by default one is started for each window')
+    parser.add_argument('--clients', type=int, default=64, help='concurrent keep-alive connections')
+    parser.add_argument('--requests', type=int, default=10000, help='requests in total')
+    parser.add_argument('--windows', type=float, nargs='+', default=[0, 1, 2, 5], help='batching windows to compare, in milliseconds')
+    args = parser.parse_args(argv)
+
+    print(f'{args.clients} clients, {args.requests} requests to /belts')
+    if args.port:
+        run(args.port, args.clients, args.requests, 'running')
+        return
+    for window in args.windows:
+        port = _free_port()
+        env = dict(os.environ, PYTHONPATH=src)
+        service = subprocess.Popen([sys.executable, '-m', 'vbelts', 'serve', '--port', str(port), '--window', str(window)], env=env)
+        try:
+            _wait(port)
+            run(port, args.clients, args.requests, f'window {window:g} ms')
+        finally:
+            service.terminate()
+            service.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,293 @@
+"""Benchmark suite of the public hot paths of vbelts.
+
+Each case times one entry point with representative or worst-case inputs, the worst cases being lookups near
+the end of the largest tables. The results are written as JSON and compared against a stored baseline, any case
+slower than the baseline by more than the tolerance is reported as a regression and the exit status is 1. A case
+without a baseline is reported too and also exits with 1, so a new case is recorded with --save-baseline.
+
+Usage::
+
+    python benchmarks/run.py                                 # run and compare with benchmarks/baseline.json
+    python benchmarks/run.py -o results.json                 # also write the results
+    python benchmarks/run.py --save-baseline                 # store the results as the new baseline
+    python benchmarks/run.py -k trans_power                  # run the cases matching a substring
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+from timeit import Timer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from vbelts import belt, design, length, power, pulley, util  # noqa: E402
+from vbelts.analysis import tolerance  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+cases = {}
+
+
+def case(name, batch=1):
+    """Register a benchmark case, a function returning the callable to time. batch is the rows per call."""
+    def register(setup):
+        cases[name] = (setup, batch)
+        return setup
+    return register
+
+
+# Scalar entry points
+
+@case('trans_power.representative')
+def _():
+    return lambda: power.TransPower('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750).belt_qty()
+
+
+@case('trans_power.worst')
+def _():
+    # last diameter and rpm rows of the largest basic power table, and the last gear ratio band
+    return lambda: power.TransPower('SuperHC', '3v', '3V1400', 10, 3.5, 3555, 240, 840, 2690).belt_qty()
+
+
+@case('trans_power.bilinear')
+def _():
+    return lambda: power.TransPower('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750, basic_power='bilinear').belt_qty()
+
+
+@case('pulley_belt.representative')
+def _():
+    return lambda: length.PulleyBelt(120, 240, 'HiPower', 'a').c_c()
+
+
+@case('pulley_belt.worst')
+def _():
+    # long belt of the last profile, deep in the length catalog
+    return lambda: length.PulleyBelt(500, 1200, 'HiPower', 'd').c_c()
+
+
+@case('fit_center')
+def _():
+    # retrofit with a fixed frame, the lengths within 40 mm of the center distance
+    return lambda: length.fit_center(200, 450, 'HiPower', 'c', 1000, 40)
+
+
+@case('est_power')
+def _():
+    return lambda: power.EstPower(2, 2, 4, 18).calc()
+
+
+@case('hipower')
+def _():
+    return lambda: belt.HiPower(60, 870).profile
+
+
+@case('superhc')
+def _():
+    return lambda: belt.SuperHC(150, 575).profile
+
+
+@case('driven.commercial')
+def _():
+    return lambda: pulley.Driven(245, 'a', 3, 1750, 1.846).commercial(130, 120)
+
+
+@case('motor.representative')
+def _():
+    return lambda: util.Motor('normal torque ac', 3).group
+
+
+@case('motor.worst')
+def _():
+    # the last name of the drive group data
+    return lambda: util.Motor('clutch', 3).group
+
+
+@case('machine.worst')
+def _():
+    return lambda: util.Machine('tire shop machine', 18).group
+
+
+@case('design')
+def _():
+    return lambda: design.design('normal torque ac', 'mill', 10, 5, 1750, 900, min_diam=100)
+
+
+# Batch entry points
+
+def _drives(size, seed=0):
+    rnd = random.Random(seed)
+    models = {'HiPower': {'a': ('A-46', 1200), 'b': ('B-60', 1565), 'c': ('C-90', 2350), 'd': ('D-120', 3130)},
+              'SuperHC': {'3v': ('3V500', 1270), '5v': ('5V1000', 2540), '8v': ('8V1600', 4065)}}
+    rows = []
+    for _ in range(size):
+        model = rnd.choice(list(models))
+        profile = rnd.choice(list(models[model]))
+        b_type, l_corr = models[model][profile]
+        diams = power._pb_index(model, profile).diams
+        min_diam = rnd.uniform(diams[0], diams[-1])
+        maj_diam = min_diam * rnd.uniform(1.1, 2.5)
+        rows.append((model, profile, b_type, rnd.uniform(1, 50), maj_diam/min_diam, l_corr, min_diam, maj_diam, rnd.uniform(200, 1700)))
+    return rows
+
+
+def _batch_case(size):
+    def setup():
+        import numpy
+        columns = [numpy.array(column) for column in zip(*_drives(size))]
+        power.belt_qty_batch(*columns)
+        return lambda: power.belt_qty_batch(*columns)
+    return setup
+
+
+def _bilinear_case(size):
+    def setup():
+        import numpy
+        columns = [numpy.array(column) for column in zip(*_drives(size))]
+        power.belt_qty_batch(*columns, basic_power='bilinear')
+        return lambda: power.belt_qty_batch(*columns, basic_power='bilinear')
+    return setup
+
+
+for size in (1000, 100000):
+    case(f'belt_qty_batch.{size}', batch=size)(_batch_case(size))
+case('belt_qty_batch.bilinear.100000', batch=100000)(_bilinear_case(100000))
+
+
+@case('commercial_batch.100000', batch=100000)
+def _():
+    import numpy
+    rnd = numpy.random.default_rng(0)
+    driving, ratio = rnd.uniform(65, 600, 100000), rnd.uniform(1, 4, 100000)
+    return lambda: pulley.commercial_batch(driving, ratio, 1750, driving)
+
+
+@case('l_c_batch.100000', batch=100000)
+def _():
+    import numpy
+    rnd = numpy.random.default_rng(0)
+    min_diam = rnd.uniform(65, 600, 100000)
+    maj_diam = min_diam * rnd.uniform(1, 4, 100000)
+    profile = numpy.array(['a', 'b', 'c', 'd'])[rnd.integers(0, 4, 100000)]
+    return lambda: length.l_c_batch(min_diam, maj_diam, 'HiPower', profile)
+
+
+@case('corrected_center_distance.100000', batch=100000)
+def _():
+    import numpy
+    rnd = numpy.random.default_rng(0)
+    min_diam = rnd.uniform(65, 600, 100000)
+    maj_diam = min_diam * rnd.uniform(1, 4, 100000)
+    l_corr = length.l_c_batch(min_diam, maj_diam, 'HiPower', 'b')[0]
+    return lambda: length.corrected_center_distance(min_diam, maj_diam, l_corr)
+
+
+@case('select_profiles.1000000', batch=1000000)
+def _():
+    import numpy
+    rnd = numpy.random.default_rng(0)
+    est_power, rpm = rnd.uniform(1, 500, 1000000), rnd.uniform(100, 5000, 1000000)
+    return lambda: belt.select_profiles('HiPower', est_power, rpm)
+
+
+@case('tolerance.100000', batch=100000)
+def _():
+    return lambda: tolerance.monte_carlo(140, 294, 'HiPower', 'b', 12, 1150, reselect=True, seed=0)
+
+
+@case('est_power_batch.100000', batch=100000)
+def _():
+    import numpy
+    rnd = numpy.random.default_rng(0)
+    engine_power, drive_group, machine_group, hours = rnd.uniform(1, 100, 100000), rnd.integers(1, 3, 100000), rnd.integers(1, 5, 100000), rnd.uniform(1, 24, 100000)
+    return lambda: power.est_power_batch(engine_power, drive_group, machine_group, hours)
+
+
+@case('classify_machines.100000', batch=100000)
+def _():
+    names = [util.mach_group_data[i % len(util.mach_group_data)][0][i % 5:] for i in range(100000)]
+    util.classify_machines(names)
+    return lambda: util.classify_machines(names)
+
+
+@case('design_batch.1000', batch=1000)
+def _():
+    specs = [('normal torque ac', 'mill', 10, 5 + i % 20, 1750, 900 + i % 300) for i in range(1000)]
+    return lambda: design.design_batch(specs)
+
+
+def measure(func, repeat=5):
+    """Best time of one call, [s]"""
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(selected):
+    results = {}
+    for name, (setup, batch) in cases.items():
+        if not any(pattern in name for pattern in selected):
+            continue
+        try:
+            func = setup()
+        except ImportError as error:
+            print(f'{name:<32} skipped: {error}')
+            continue
+        seconds = measure(func)
+        results[name] = {'seconds': seconds, 'rows': batch}
+        print(f'{name:<32}{seconds * 1e6:>14.2f} us{seconds * 1e6 / batch:>12.3f} us/row')
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print the ratio to the baseline of each case, returning the names of the regressions and of the cases without a baseline."""
+    regressions = []
+    missing = []
+    print(f'\n{"case":<32}{"baseline [us]":>14}{"now [us]":>12}{"ratio":>8}')
+    for name, result in results.items():
+        if name not in baseline:
+            missing.append(name)
+            print(f'{name:<32}{"-":>14}{result["seconds"] * 1e6:>12.2f}{"-":>8}  NO BASELINE')
+            continue
+        ratio = result['seconds'] / baseline[name]['seconds']
+        flag = ''
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f'{name:<32}{baseline[name]["seconds"] * 1e6:>14.2f}{result["seconds"] * 1e6:>12.2f}{ratio:>8.2f}{flag}')
+    return regressions, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark suite of the public hot paths of vbelts.')
+    parser.add_argument('-o', '--output', help='write the results to this JSON file')
+    parser.add_argument('-b', '--baseline', default=BASELINE, help='baseline JSON file to compare with')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.25, help='allowed slowdown before a regression, 0.25 is 25 %%')
+    parser.add_argument('-k', dest='selected', action='append', default=[], help='run only the cases containing this substring')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    args = parser.parse_args(argv)
+
+    results = run(args.selected or [''])
+    report = {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as output:
+            json.dump(report, output, indent=2)
+        return 0
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as baseline:
+            regressions, missing = compare(results, json.load(baseline)['results'], args.tolerance)
+        if regressions:
+            print(f'\n{len(regressions)} regression(s): {", ".join(regressions)}')
+        if missing:
+            print(f'\n{len(missing)} case(s) without a baseline, record them with --save-baseline: {", ".join(missing)}')
+        if regressions or missing:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
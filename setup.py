@@ -12,7 +12,7 @@ setup(
     long_description_content_type="text/markdown",
     package_dir={'': 'src'},
     packages=find_packages(where='src'),
-    # package_data={'':["data/*.csv"]},
+    package_data={'vbelts': ['data/*.vbt']},
     # include_package_data=True,
     author='Glademir Karpinski Junior, Hector Balke Nodari',
     author_email='gkarpinskijr@gmail.com, hectornodari@gmail.com',
@@ -30,5 +30,5 @@ setup(
         'License :: OSI Approved :: BSD License',
         'Operating System :: OS Independent',
         ],
-    extras_require = {"dev": ["pytest==6.0.1","check-manifest==0.42","sphinx==3.2.1","autodoc==0.5.0","sphinx-rtd-theme==0.5.0"]},
+    extras_require = {"numpy": ["numpy"], "dev": ["pytest==6.0.1","check-manifest==0.42","sphinx==3.2.1","autodoc==0.5.0","sphinx-rtd-theme==0.5.0"]},
 )
@@ -26,26 +26,20 @@ EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 vbelts provides functions that allow the computation of complex factors in v-belt dimensioning."""
 
-# import os
-
-# import belt
-# import length
-# import util
-# import power
-# import speed
-# import pulley
-
-from vbelts import belt
-from vbelts import length
-from vbelts import util
-from vbelts import power
-from vbelts import speed
-from vbelts import pulley
-
-__all__ = ['belt', 'length', 'util', 'power', 'speed', 'pulley']
-
-# try:
-#     vbelts_dir = os.path.dirname(__file__)
-#     vbelts_data_dir = os.path.join(vbelts_dir, 'data')
-# except:
-#     pass
+import importlib
+
+# The submodules are imported on first access, so import vbelts loads none of the rating data, see PEP 562
+_submodules = ('analysis', 'belt', 'cache', 'cli', 'design', 'fleet', 'instrument', 'length', 'memo', 'power', 'pulley', 'registry',
+               'results', 'server', 'speed', 'sweep', 'tables', 'util')
+
+__all__ = list(_submodules)
+
+
+def __getattr__(name:str):
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')  # also sets it as an attribute of the package
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted({*globals(), *_submodules})
@@ -0,0 +1,5 @@
+import sys
+
+from vbelts.cli import main
+
+sys.exit(main())
@@ -0,0 +1,17 @@
+"""Analyses of v-belt drives built on the vectorized calculations, see :mod:`vbelts.analysis.tolerance`."""
+import importlib
+
+# imported on first access, as the submodules of vbelts
+_submodules = ('tolerance',)
+
+__all__ = list(_submodules)
+
+
+def __getattr__(name:str):
+    if name in _submodules:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted({*globals(), *_submodules})
@@ -0,0 +1,145 @@
+"""Monte Carlo tolerance analysis of a v-belt drive.
+
+The pulleys wear and are made to a tolerance, and the motor speed and the power drawn vary with the load, so an
+installed drive runs around its nominal design rather than on it. :func:`monte_carlo` samples perturbed pulleys,
+speeds and powers around a nominal drive and sizes all of them at once with the vectorized calculations,
+:func:`vbelts.length.l_c_batch`, :func:`vbelts.length.corrected_center_distance` and
+:func:`vbelts.power.belt_qty_batch`, reporting how often the drive needs more belts than the ones installed and the
+distributions of the belt quantity and of the center distance.
+
+Examples
+--------
+>>> report = vbelts.analysis.tolerance.monte_carlo(130, 240, 'HiPower', 'a', 2, 1750, seed=0)
+>>> report.belts, report.shortfall
+(1, 0.0)
+"""
+from math import ceil
+from typing import NamedTuple
+
+from vbelts import length, power
+from vbelts.util import _NotValidError, _numpy
+
+percentiles = (5, 50, 95)
+
+
+class ToleranceReport(NamedTuple):
+    r"""Result of a tolerance analysis.
+
+    Attributes
+    ----------
+    belts : int
+        Quantity of v-belts installed, [-]
+    samples : int
+        Perturbed drives sized, [-]
+    shortfall : float
+        Fraction of the samples needing more v-belts than the installed ones, [-]
+    out_of_range : float
+        Fraction of the samples out of the length or rating tables, [-]
+    belt_counts : dict
+        Fraction of the samples needing each quantity of v-belts, [-]
+    belt_qty_pct : dict
+        Calculated quantity of v-belts at the 5th, 50th and 95th percentiles, [-]
+    c_corr_pct : dict
+        Pulley corrected center distance at the 5th, 50th and 95th percentiles, [mm]
+    belt_qty : numpy.ndarray
+        Calculated quantity of v-belts of each sample, nan when out of range, [-]
+    c_corr : numpy.ndarray
+        Pulley corrected center distance of each sample, nan when out of range, [mm]
+    """
+    belts: int
+    samples: int
+    shortfall: float
+    out_of_range: float
+    belt_counts: dict
+    belt_qty_pct: dict
+    c_corr_pct: dict
+    belt_qty: object
+    c_corr: object
+
+
+def _percentiles(values):
+    """Percentiles of the valid values, nan when there is none."""
+    np = _numpy()
+    valid = values[~np.isnan(values)]
+    if not len(valid):
+        return {q: float('nan') for q in percentiles}
+    return dict(zip(percentiles, np.percentile(valid, percentiles).tolist()))
+
+
+def monte_carlo(min_diam:float, maj_diam:float, vbelt_model:str, vbelt_profile:str, est_power:float, rpm:float, samples:int=100000,
+                diam_tol:float=0.005, wear:float=0, rpm_tol:float=0.02, power_tol:float=0.05, belts:int=None, reselect:bool=False, seed=None):
+    r"""Sample perturbed drives around a nominal drive and report the distributions of the v-belt quantity and center distance.
+
+    Each sample draws its pulleys, speed and power from normal distributions of relative standard deviations around
+    the nominal values, the pulleys reduced by the mean wear.
+
+    Parameters
+    ----------
+    min_diam : float
+        Nominal smallest pulley, [mm]
+    maj_diam : float
+        Nominal largest pulley, [mm]
+    vbelt_model : str
+        Model of the v-belt, [-]
+    vbelt_profile : str
+        Profile of the v-belt, [-]
+    est_power : float
+        Nominal estimated power, [hp]
+    rpm : float
+        Nominal fastest axle rotation speed, [rpm]
+    samples : int
+        Perturbed drives to size, [-]
+    diam_tol : float
+        Relative standard deviation of the pulley diameters, [-]
+    wear : float
+        Mean relative loss of the pulley diameters, [-]
+    rpm_tol : float
+        Relative standard deviation of the fastest axle speed, [-]
+    power_tol : float
+        Relative standard deviation of the estimated power, [-]
+    belts : int, optional
+        Quantity of v-belts installed, by default the one of the nominal drive, [-]
+    reselect : bool
+        Select the commercial belt of each sample, as when the drive is designed from the worn pulleys, instead of keeping the belt of the nominal drive, [-]
+    seed : int, optional
+        Seed of the random generator, for repeatable reports, [-]
+
+    Returns
+    -------
+    report : ToleranceReport
+        Shortfall, out of range fraction and distributions of the samples, [-]
+
+    Notes
+    -----
+    Requires numpy. The nominal drive is sized with :class:`vbelts.length.PulleyBelt` and
+    :class:`vbelts.power.TransPower`, so it raises as they do, while the samples out of the tables are counted as
+    out of range. The gear ratio of each sample is the ratio of its pulleys.
+    """
+    np = _numpy()
+    if not (isinstance(samples, int) and samples > 0):
+        raise _NotValidError('The quantity of samples has to be a positive integer.')
+    if not all(value >= 0 for value in (diam_tol, wear, rpm_tol, power_tol)):
+        raise _NotValidError('The tolerances and the wear have to be zero or positive.')
+    distance = length.PulleyBelt(min_diam, maj_diam, vbelt_model, vbelt_profile)
+    if belts is None:
+        belts = ceil(power.TransPower(vbelt_model, vbelt_profile, distance.b_type, est_power, maj_diam / min_diam, distance.l_corr,
+                                      min_diam, maj_diam, rpm).belt_qty())
+    rng = np.random.default_rng(seed)
+    min_s = min_diam * (1 - wear + diam_tol * rng.standard_normal(samples))
+    maj_s = maj_diam * (1 - wear + diam_tol * rng.standard_normal(samples))
+    rpm_s = rpm * (1 + rpm_tol * rng.standard_normal(samples))
+    power_s = est_power * (1 + power_tol * rng.standard_normal(samples))
+    if reselect:
+        l_corr, b_type = length.l_c_batch(min_s, maj_s, vbelt_model, vbelt_profile)
+    else:
+        l_corr, b_type = distance.l_corr, distance.b_type
+    c_corr = length.corrected_center_distance(min_s, maj_s, l_corr)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gear_ratio = maj_s / min_s
+    belt_qty = power.belt_qty_batch(vbelt_model, vbelt_profile, b_type, power_s, gear_ratio, l_corr, min_s, maj_s, rpm_s)
+    invalid = np.isnan(belt_qty) | np.isnan(c_corr)
+    belt_qty[invalid] = c_corr[invalid] = np.nan
+    needed = np.ceil(belt_qty[~invalid]).astype(np.int64)
+    counts, frequency = np.unique(needed, return_counts=True)
+    return ToleranceReport(belts, samples, float(np.count_nonzero(needed > belts)) / samples, float(np.count_nonzero(invalid)) / samples,
+                           dict(zip(counts.tolist(), (frequency / samples).tolist())), _percentiles(belt_qty), _percentiles(c_corr), belt_qty, c_corr)
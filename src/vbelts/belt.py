@@ -1,6 +1,111 @@
-from vbelts.util import _Belt, _OutOfRangeError
+from vbelts import instrument, registry
+from vbelts.util import _Belt, _OutOfRangeError, _numpy
 
-class HiPower(_Belt):
+
+class Registered(_Belt):
+    r"""Registered class checks the conditions and selects the v-belt profile for a model of :mod:`vbelts.registry`.
+
+    Parameters
+    ----------
+    vbelt_model : str
+        Model of the v-belt, [-]
+    est_power : float
+        estimated power of the system, [hp]
+    rpm_fastest : float
+        fastest rotational speed of the system, [rpm]
+
+
+    Attributes
+    ----------
+    profile : str
+        Selected v-belt profile, [-]
+
+
+    Examples
+    --------
+    >>> belt = vbelts.belt.Registered('HiPower', 3, 500)
+    >>> belt.profile
+    'a'
+    """
+    def __init__(self, vbelt_model:str, est_power:float, rpm_fastest:float):
+        super().__init__(est_power, rpm_fastest)
+        self.model = registry.get(vbelt_model)
+        self._belt_profile()
+
+
+    @instrument.stage('belt.profile')
+    def _belt_profile(self):
+        r"""Method selects the appropriate profile based on the region limits.
+         """
+        # Define the maximum range
+        rpm_min, rpm_max, power_min, power_max = self.model.limits
+        if self.rpm_fastest > rpm_max or self.est_power > power_max:
+            raise _OutOfRangeError(f'Values out of range for the {self.model.name} model: rpm > {rpm_max:g} or est_power > {power_max:g}')
+        elif not (self.rpm_fastest >= rpm_min and self.est_power >= power_min):  # nan included
+            raise _OutOfRangeError(f'Values out of range for the {self.model.name} model: rpm < {rpm_min:g} or est_power < {power_min:g}')
+
+        # the first profile whose boundary, its lowest rpm for the estimated power, is below the speed
+        est_power, rpm_fastest = self.est_power, self.rpm_fastest
+        for profile, a, b, c, upper in self.model.selection:
+            if rpm_fastest >= (abs(a * est_power + b) if est_power < upper else c):  # as _fun_val
+                break
+        else:
+            profile = self.model.profiles[-1]
+        self.profile = profile
+
+
+def select_profiles(vbelt_model:str, est_power, rpm_fastest):
+    r"""Vectorized profile selection for many operating points at once.
+
+    Evaluates the boundary curves of the model, a * est_power + b below `upper` hp and c from it on, over whole
+    arrays, picking for each point the first profile whose boundary is not above the speed, as :class:`Registered`.
+
+    Parameters
+    ----------
+    vbelt_model : str
+        Model of the v-belt, [-]
+    est_power : array_like
+        Estimated power of each point, [hp]
+    rpm_fastest : array_like
+        Fastest rotational speed of each point, [rpm]
+
+    Returns
+    -------
+    result : tuple
+        Contains the codes and out_of_range arrays, [-]
+    codes : numpy.ndarray
+        Position of the selected profile in the profiles of the model, -1 where it is out of range, [-]
+    out_of_range : numpy.ndarray
+        True where the point is outside the limits of the model or nan, where Registered raises _OutOfRangeError, [-]
+
+    Examples
+    --------
+    >>> codes, out_of_range = vbelts.belt.select_profiles('HiPower', [3, 9, 60, 600], [500, 400, 870, 1750])
+    >>> codes, out_of_range
+    (array([ 0,  1,  2, -1], dtype=int8), array([False, False, False,  True]))
+    >>> [vbelts.registry.get('HiPower').profiles[code] for code in codes[~out_of_range]]
+    ['a', 'b', 'c']
+
+    Notes
+    -----
+    Requires numpy.
+    """
+    np = _numpy()
+    model = registry.get(vbelt_model)
+    est_power, rpm_fastest = np.broadcast_arrays(np.asarray(est_power, dtype=float), np.asarray(rpm_fastest, dtype=float))
+    rpm_min, rpm_max, power_min, power_max = model.limits
+    out_of_range = ~((rpm_min <= rpm_fastest) & (rpm_fastest <= rpm_max) & (power_min <= est_power) & (est_power <= power_max))
+    codes = np.full(est_power.shape, len(model.profiles) - 1, dtype=np.int8)
+    pending = ~out_of_range
+    for code, (_, a, b, c, upper) in enumerate(model.selection):
+        chosen = pending & (rpm_fastest >= np.where(est_power < upper, np.abs(a * est_power + b), c))
+        codes[chosen] = code
+        pending &= ~chosen
+    codes[out_of_range] = -1
+    return (codes, out_of_range)
+
+
+class HiPower(Registered):
     r"""HiPower class checks the conditions and selects the v-belt profile for this model.
 
     Parameters
@@ -37,34 +142,10 @@ class HiPower(_Belt):
     .. [#] "CLASSICAL," V-Belts, BestTORQ, accessed September 21, 2020,  https://www.bestorq.com/Library/media/CLASSICAL_xselect.gif
     """
     def __init__(self, est_power:float, rpm_fastest:float):
-        super().__init__(est_power, rpm_fastest)
-        self._boundary_a = super(HiPower, self)._fun_val(74.1950272674027, 47.215442190042, 3322, self.est_power, 50.7)
-        self._boundary_b = super(HiPower, self)._fun_val(19.3889694765281, 32.2532889843209, 2151.4, self.est_power, 122.3)
-        self._boundary_c = super(HiPower, self)._fun_val(4.94622293507244, 19.7301462298106, 1335.9, self.est_power, 277.35)
-        self._belt_profile()
-    
-    
-    def _belt_profile(self):
-        r"""Method selects the appropriate profile based on the region limits.
-         """
-        # Define the maximum range
-        if self.rpm_fastest > 5000 or self.est_power > 500:
-            return _OutOfRangeError('Values out of range for the HiPower model: rpm > 5000 or est_power > 500')
-        elif self.rpm_fastest < 100 or self.est_power < 1:
-            return _OutOfRangeError('Values out of range for the HiPower model: rpm < 100 or est_power < 1')
-
-        if self.rpm_fastest >= self._boundary_a:
-            profile = 'a'
-        elif self._boundary_b <= self.rpm_fastest < self._boundary_a:
-            profile = 'b'
-        elif self._boundary_c <= self.rpm_fastest < self._boundary_b:
-            profile = 'c'
-        elif self._boundary_c > self.rpm_fastest:
-            profile = 'd'
-        self.profile = profile
+        super().__init__('HiPower', est_power, rpm_fastest)
 
 
-class SuperHC(_Belt):
+class SuperHC(Registered):
     r"""SuperHC class calculates checks the conditions and selects the v-belt profile for this model.
 
     Parameters
@@ -101,25 +182,4 @@ class SuperHC(_Belt):
     .. [#] "WEDGE," V-Belts, BestTORQ, accessed September 21, 2020,  https://www.bestorq.com/Library/media/wedge_xselect358.gif
     """
     def __init__(self, est_power:float, rpm_fastest:float):
-        super().__init__(est_power, rpm_fastest)
-        self._boundary_3v = super(SuperHC, self)._fun_val(40.6961726224751, 11.8866879052094, 3316.25, self.est_power, 91)
-        self._boundary_5v = super(SuperHC, self)._fun_val(4.30114168431602, 3.84423100031302, 1332.74, self.est_power, 309)
-        self._belt_profile()
-
-    
-    def _belt_profile(self):
-        r"""Method selects the appropriate profile based on the region limits.
-         """
-        # Define the maximum range
-        if self.rpm_fastest > 5000 or self.est_power > 1000:
-            return _OutOfRangeError('Values out of range for the SuperHC model: rpm > 5000 or est_power > 1000')
-        elif self.rpm_fastest < 100 or self.est_power < 1:
-            return _OutOfRangeError('Values out of range for the SuperHC model: rpm < 100 or est_power < 1')
-        
-        if self.rpm_fastest >= self._boundary_3v:
-            profile = '3v'
-        elif self._boundary_5v <= self.rpm_fastest < self._boundary_3v:
-            profile = '5v'
-        elif self._boundary_5v > self.rpm_fastest:
-            profile = '8v'
-        self.profile = profile
+        super().__init__('SuperHC', est_power, rpm_fastest)
@@ -0,0 +1,274 @@
+"""Persistent cache of drive designs in a SQLite file, shared by processes and runs.
+
+:class:`ResultCache` stores the :class:`vbelts.design.DriveDesign` of the full chain, :class:`vbelts.power.EstPower`,
+:class:`vbelts.length.PulleyBelt` and :class:`vbelts.power.TransPower`, under a key of the normalized inputs, the
+motor and machine as their groups and the numbers as floats, and of the :func:`fingerprint` of the tables of the
+v-belt model. A change of the rating, length or factor tables changes the fingerprint, so the entries of the old
+tables are never returned. They are stale, the entries of a model registered in the process with another
+fingerprint, and are removed by :meth:`ResultCache.prune`; the entries of models registered only by other processes
+are kept. The file is in write-ahead logging mode, the readers of many processes do not block each other nor the
+writer. The least recently used entries are evicted beyond the maximum number of entries, counted by triggers of
+the table so a store does not count them. A file of another version of the cache is emptied when opened.
+
+Inspect and prune the file from the command line::
+
+    python -m vbelts cache stats
+    python -m vbelts cache prune --max-entries 10000
+    python -m vbelts batch specs.csv results.csv --cache results.sqlite
+
+Examples
+--------
+>>> cache = vbelts.cache.ResultCache('results.sqlite')
+>>> cache.design('normal torque ac', 'mill', 10, 5, 1750, 900, min_diam=100).belts
+3
+>>> cache.stats()['hits'], cache.stats()['misses']
+(0, 1)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from vbelts import design, length, power, registry, util
+
+_version = 2  # of the key, the stored values and the tables of the file, changed with them to drop the old entries
+_touch = 60  # seconds before a hit updates the access time of the entry, so most hits are only reads
+_fingerprints = {}
+
+
+def default_path():
+    """Cache file of the VBELTS_CACHE environment variable, by default results.sqlite in the user cache directory."""
+    return os.environ.get('VBELTS_CACHE') or os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                                          'vbelts', 'results.sqlite')
+
+
+def fingerprint(vbelt_model:str):
+    r"""Content hash of the tables a design of the v-belt model depends on.
+
+    Parameters
+    ----------
+    vbelt_model : str
+        Model of the v-belt, [-]
+
+    Returns
+    -------
+    digest : str
+        SHA-256 of the selection boundaries, the length, fcc, basic and additional power tables of the model and of
+        the contact arc, service factor and h factor tables, [-]
+    """
+    model = registry.get(vbelt_model)
+    try:
+        cached, digest = _fingerprints[vbelt_model]
+        if cached is model:  # the same registration
+            return digest
+    except KeyError:
+        pass
+    content = (_version, model.profiles, model.boundaries, model.limits, model.length, sorted(model.fcc.items()), model.pb, model.pa,
+               power.fcac_contact_arc, sorted(power.service_factor.items()), power.hours_bands, sorted(length.h_factor.items()))
+    digest = hashlib.sha256(repr(content).encode()).hexdigest()
+    _fingerprints[vbelt_model] = (model, digest)
+    return digest
+
+
+def _stale():
+    """SQL condition of the stale entries, of a registered model with another fingerprint, and its parameters."""
+    names = registry.names()
+    return ' OR '.join(['(model = ? AND fingerprint != ?)'] * len(names)), [value for name in names for value in (name, fingerprint(name))]
+
+
+class ResultCache():
+    r"""ResultCache class is a persistent, size-bounded cache of drive designs in a SQLite file.
+
+    Parameters
+    ----------
+    path : str, optional
+        Cache file, created with its directory when missing, by default :func:`default_path`, [-]
+    max_entries : int
+        Maximum number of entries, the least recently used ones are evicted beyond it, [-]
+    timeout : float
+        Time to wait for the lock of another writer, [s]
+
+    Examples
+    --------
+    >>> with vbelts.cache.ResultCache('results.sqlite', max_entries=1000) as cache:
+    ...     cache.design('normal torque ac', 'mill', 10, 5, 1750, 900).vbelt_type
+    'A-47'
+    """
+    def __init__(self, path:str=None, max_entries:int=100000, timeout:float=10):
+        if not (isinstance(max_entries, int) and max_entries > 0):
+            raise ValueError('max_entries has to be a positive integer')
+        self.path = os.fspath(path) if path is not None else default_path()
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()  # a connection per thread
+        self._connections = []
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connect()
+        connection.execute('BEGIN IMMEDIATE')  # a single process creates or replaces the tables
+        try:
+            if connection.execute('PRAGMA user_version').fetchone()[0] != _version:
+                for table in ('results', 'counts'):
+                    connection.execute(f'DROP TABLE IF EXISTS {table}')
+                connection.execute('CREATE TABLE results (key TEXT PRIMARY KEY, model TEXT NOT NULL, fingerprint TEXT NOT NULL, value TEXT NOT NULL, '
+                                   'accessed REAL NOT NULL)')
+                connection.execute('CREATE INDEX results_accessed ON results (accessed)')
+                # the running count of the entries, the upsert of put updates an entry without firing the insert trigger
+                connection.execute('CREATE TABLE counts (entries INTEGER NOT NULL)')
+                connection.execute('INSERT INTO counts VALUES (0)')
+                connection.execute('CREATE TRIGGER results_insert AFTER INSERT ON results BEGIN UPDATE counts SET entries = entries + 1; END')
+                connection.execute('CREATE TRIGGER results_delete AFTER DELETE ON results BEGIN UPDATE counts SET entries = entries - 1; END')
+                connection.execute(f'PRAGMA user_version = {_version}')
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+
+
+    def _connect(self):
+        """Connection of the calling thread, opened on first use."""
+        try:
+            return self._local.connection
+        except AttributeError:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+            return connection
+
+
+    def get(self, key:str):
+        """Stored value of the key, None when there is none."""
+        connection = self._connect()
+        row = connection.execute('SELECT value, accessed FROM results WHERE key = ?', (key,)).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        now = time.time()
+        if now - row[1] > _touch:
+            with connection:
+                connection.execute('UPDATE results SET accessed = ? WHERE key = ?', (now, key))
+        return json.loads(row[0])
+
+
+    def put(self, key:str, vbelt_model:str, fingerprint:str, value):
+        """Store a JSON serializable value of the model under the key, evicting the least recently used entries beyond the maximum."""
+        connection = self._connect()
+        with connection:
+            connection.execute('INSERT INTO results VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET model = excluded.model, '
+                               'fingerprint = excluded.fingerprint, value = excluded.value, accessed = excluded.accessed',
+                               (key, vbelt_model, fingerprint, json.dumps(value), time.time()))
+            excess = connection.execute('SELECT entries FROM counts').fetchone()[0] - self.max_entries
+            if excess > 0:
+                connection.execute('DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)', (excess,))
+        if excess > 0:
+            with self._lock:
+                self.evictions += excess
+
+
+    def design(self, motor:str, machine:str, hours_service:float, engine_power:float, rpm_input:float, rpm_output:float, vbelt_model:str='HiPower', min_diam:float=None):
+        r"""Cached :func:`vbelts.design.design`, computed and stored on a miss.
+
+        Takes the parameters of :func:`vbelts.design.design`. The errors are raised as it does and are not stored.
+
+        Returns
+        -------
+        result : DriveDesign
+            Drive design result, [-]
+        """
+        drive_group = util.Motor(motor, engine_power).group
+        machine_group = util.Machine(machine, hours_service).group
+        if drive_group is None or machine_group is None:  # a name out of the group data, raised by the design
+            return design.design(motor, machine, hours_service, engine_power, rpm_input, rpm_output, vbelt_model, min_diam)
+        digest = fingerprint(vbelt_model)
+        inputs = (vbelt_model, drive_group, machine_group, float(hours_service), float(engine_power), float(rpm_input), float(rpm_output),
+                  None if min_diam is None else float(min_diam))
+        key = hashlib.sha256(json.dumps([_version, digest, *inputs]).encode()).hexdigest()
+        value = self.get(key)
+        if value is not None:
+            return design.DriveDesign(*value)
+        result = design.design(motor, machine, hours_service, engine_power, rpm_input, rpm_output, vbelt_model, min_diam)
+        self.put(key, vbelt_model, digest, list(result))
+        return result
+
+
+    def prune(self, max_entries:int=None, stale:bool=True):
+        r"""Remove the entries of tables that changed and the least recently used ones beyond a number of entries.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Entries to keep, by default the maximum of the cache, [-]
+        stale : bool
+            Remove the entries of a registered model whose fingerprint is not the one of its tables, [-]
+
+        Returns
+        -------
+        removed : int
+            Removed entries, [-]
+        """
+        max_entries = self.max_entries if max_entries is None else max_entries
+        connection = self._connect()
+        removed = 0
+        with connection:
+            if stale:
+                condition, params = _stale()
+                removed += connection.execute(f'DELETE FROM results WHERE {condition}', params).rowcount
+            excess = connection.execute('SELECT entries FROM counts').fetchone()[0] - max_entries
+            if excess > 0:
+                removed += connection.execute('DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)', (excess,)).rowcount
+        connection.execute('VACUUM')
+        return removed
+
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        connection = self._connect()
+        with connection:
+            connection.execute('DELETE FROM results')
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+
+    def stats(self):
+        """Counters of the cache, its entries, the stale ones and the size of the file in bytes."""
+        connection = self._connect()
+        condition, params = _stale()
+        entries, = connection.execute('SELECT entries FROM counts').fetchone()
+        stale, = connection.execute(f'SELECT COUNT(*) FROM results WHERE {condition}', params).fetchone()
+        page_count, = connection.execute('PRAGMA page_count').fetchone()
+        page_size, = connection.execute('PRAGMA page_size').fetchone()
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': entries, 'stale': stale,
+                    'max_entries': self.max_entries, 'bytes': page_count * page_size}
+
+
+    def close(self):
+        """Close the connections of all the threads."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
+    def __len__(self):
+        return self._connect().execute('SELECT entries FROM counts').fetchone()[0]
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        self.close()
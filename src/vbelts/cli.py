@@ -0,0 +1,232 @@
+"""Command line interface of vbelts, run as ``python -m vbelts``.
+
+The batch command designs the drives of a spec file row by row, in chunks, so the memory stays constant for
+any input size. The result has the spec columns followed by the :class:`vbelts.design.DriveDesign` fields, which
+replace the spec columns of the same name, so rpm_output becomes the speed of the commercial pulleys. A row that
+fails, or a JSON line that is not an object, keeps its spec values and gets its error in the ``error`` column
+instead of stopping the run. The CSV columns are the spec fields, vbelt_model and min_diam, the other columns of
+the first chunk and the result fields, whatever the rows that come first.
+
+Usage::
+
+    python -m vbelts batch specs.csv results.csv
+    python -m vbelts batch specs.jsonl results.jsonl --chunk-size 500
+    python -m vbelts batch - - --input-format csv < specs.csv > results.csv
+    python -m vbelts serve --port 8080 --window 2
+    python -m vbelts compile acme_a_pb.csv catalogs/Acme_a_pb.vbt --schema pb
+    python -m vbelts batch specs.csv results.csv --cache results.sqlite
+    python -m vbelts cache stats --path results.sqlite
+    python -m vbelts cache prune --max-entries 10000
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+from vbelts import design, registry
+
+spec_fields = ('motor', 'machine', 'hours_service', 'engine_power', 'rpm_input', 'rpm_output')
+optional_fields = ('vbelt_model', 'min_diam')
+result_fields = design.DriveDesign._fields + ('error',)
+
+
+def _format(path:str, fmt:str):
+    """Format of a file from the option or the extension, csv or jsonl."""
+    if fmt:
+        return fmt
+    return 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def _open(path:str, mode:str):
+    """Open a file, - being stdin or stdout."""
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    return open(path, mode, newline='', encoding='utf-8')
+
+
+def _reader(stream, fmt:str):
+    """Generator of the spec rows of a stream, as dicts for CSV and as the lines for JSON Lines, parsed with their row."""
+    if fmt == 'csv':
+        yield from csv.DictReader(stream)
+    else:
+        for line in stream:
+            if line.strip():
+                yield line
+
+
+def _spec(spec):
+    """Spec row of a dict or of a JSON line of an object."""
+    if isinstance(spec, str):
+        spec = json.loads(spec)
+    if not isinstance(spec, dict):
+        raise TypeError(f'the spec row is a {type(spec).__name__}, not an object')
+    return spec
+
+
+def _run_row(spec:dict, vbelt_model:str, cache=None):
+    """Design the drive of a spec row, returning the result fields or the error."""
+    try:
+        motor, machine = spec['motor'], spec['machine']
+        hours_service, engine_power, rpm_input, rpm_output = (float(spec[field]) for field in spec_fields[2:])
+        min_diam = float(spec['min_diam']) if spec.get('min_diam') not in (None, '') else None
+        drive = (cache.design if cache is not None else design.design)(motor, machine, hours_service, engine_power, rpm_input, rpm_output,
+                                                                        spec.get('vbelt_model') or vbelt_model, min_diam)
+    except KeyError as error:
+        return {'error': f'missing field {error}'}
+    except Exception as error:
+        return {'error': f'{type(error).__name__}: {error}'}
+    return drive._asdict()
+
+
+def batch(specs, vbelt_model:str='HiPower', chunk_size:int=1000, cache=None):
+    r"""Design the drives of the spec rows, lazily and chunk by chunk.
+
+    Parameters
+    ----------
+    specs : iterable
+        Dicts or JSON lines of objects with the :func:`vbelts.design.design` parameters motor, machine, hours_service, engine_power, rpm_input, rpm_output and optionally vbelt_model and min_diam, [-]
+    vbelt_model : str
+        Model of the v-belt of the rows without one, [-]
+    chunk_size : int
+        Rows designed at once, [-]
+    cache : vbelts.cache.ResultCache, optional
+        Persistent cache of the designs, [-]
+
+    Returns
+    -------
+    chunks : generator
+        Lists of the spec rows updated with the result fields and the error, empty when the row succeeded, [-]
+    """
+    specs = iter(specs)
+    while True:
+        chunk = list(islice(specs, chunk_size))
+        if not chunk:
+            return
+        results = []
+        for spec in chunk:
+            try:
+                spec = _spec(spec)
+            except (ValueError, TypeError) as error:  # a JSONDecodeError is a ValueError
+                spec, fields = {}, {'error': f'{type(error).__name__}: {error}'}
+            else:
+                fields = _run_row(spec, vbelt_model, cache)
+            result = dict(spec)
+            for field in result_fields:
+                result.setdefault(field, '')
+            result.update(fields)
+            results.append(result)
+        yield results
+
+
+def _fieldnames(chunk:list):
+    """CSV columns of the results, the spec fields, the other columns of the chunk and the result fields."""
+    names = dict.fromkeys(spec_fields + optional_fields)
+    for result in chunk:
+        names.update(dict.fromkeys(name for name in result if name not in result_fields))
+    names.update(dict.fromkeys(result_fields))
+    return list(names)
+
+
+def _batch_command(args):
+    input_format = _format(args.input, args.input_format)
+    output_format = _format(args.output, args.output_format)
+    rows = errors = 0
+    start = time.perf_counter()
+    cache = None
+    if args.cache:
+        from vbelts.cache import ResultCache
+        cache = ResultCache(args.cache)
+    source, target = _open(args.input, 'r'), _open(args.output, 'w')
+    try:
+        specs = _reader(source, input_format)
+        writer = None
+        for chunk in batch(specs, args.model, args.chunk_size, cache):
+            if output_format == 'csv':
+                if writer is None:
+                    writer = csv.DictWriter(target, fieldnames=_fieldnames(chunk), extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerows(chunk)
+            else:
+                target.writelines(json.dumps(result) + '\n' for result in chunk)
+            rows += len(chunk)
+            errors += sum(1 for result in chunk if result['error'])
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+        if cache is not None:
+            cache.close()
+    seconds = time.perf_counter() - start
+    print(f'{rows} rows, {errors} errors in {seconds:.2f} s ({rows / seconds if seconds else 0:.0f} rows/s)', file=sys.stderr)
+    return 0
+
+
+def _serve_command(args):
+    from vbelts import server
+    server.serve(args.host, args.port, args.window / 1000, args.max_batch, args.max_body)
+    return 0
+
+
+def _compile_command(args):
+    from vbelts import tables
+    schema = args.schema or os.path.splitext(os.path.basename(args.output))[0].rsplit('_', 1)[-1]
+    if schema not in tables.schemas:
+        print('the schema is not in the output name, use --schema', file=sys.stderr)
+        return 2
+    try:
+        tables.compile_csv(args.input, args.output, schema)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _cache_command(args):
+    from vbelts.cache import ResultCache
+    with ResultCache(args.path) as cache:
+        if args.action == 'prune':
+            print(f'{cache.prune(args.max_entries, not args.keep_stale)} entries removed', file=sys.stderr)
+        elif args.action == 'clear':
+            cache.clear()
+        stats = cache.stats()
+        print(f'{cache.path}: {stats["entries"]} entries, {stats["stale"]} stale, {stats["bytes"]} bytes')
+    return 0
+
+
+def main(argv=None):
+    """Entry point of ``python -m vbelts``, returning the exit status."""
+    parser = argparse.ArgumentParser(prog='python -m vbelts', description='Utilities for v-belt dimensioning.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    batch_parser = commands.add_parser('batch', help='design the drives of a spec file, CSV or JSON Lines')
+    batch_parser.add_argument('input', help='spec file, - for stdin')
+    batch_parser.add_argument('output', help='result file, - for stdout')
+    batch_parser.add_argument('--input-format', choices=('csv', 'jsonl'), help='by default from the extension, .jsonl or .ndjson are JSON Lines')
+    batch_parser.add_argument('--output-format', choices=('csv', 'jsonl'), help='by default from the extension')
+    batch_parser.add_argument('--model', default='HiPower', choices=registry.names(), help='v-belt model of the rows without a vbelt_model column')
+    batch_parser.add_argument('--chunk-size', type=int, default=1000, help='rows designed at once')
+    batch_parser.add_argument('--cache', help='persistent cache file of the designs, see vbelts.cache')
+    batch_parser.set_defaults(func=_batch_command)
+    serve_parser = commands.add_parser('serve', help='run the local HTTP/JSON sizing service, see vbelts.server')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    serve_parser.add_argument('--port', type=int, default=8080, help='port to listen on')
+    serve_parser.add_argument('--window', type=float, default=2, help='batching window, in milliseconds')
+    serve_parser.add_argument('--max-batch', type=int, default=1024, help='requests that flush a batch before the window ends')
+    serve_parser.add_argument('--max-body', type=int, default=65536, help='largest request body, in bytes')
+    serve_parser.set_defaults(func=_serve_command)
+    compile_parser = commands.add_parser('compile', help='compile a CSV catalog into a table file, see vbelts.tables')
+    compile_parser.add_argument('input', help='CSV file with a header row of the column names')
+    compile_parser.add_argument('output', help='table file, named as <model>_<profile>_pb.vbt, <model>_<profile>_pa.vbt, <model>_fcc.vbt or <model>_length.vbt')
+    compile_parser.add_argument('--schema', choices=('pb', 'pa', 'fcc', 'length'), help='kind of the table, by default from the output name')
+    compile_parser.set_defaults(func=_compile_command)
+    cache_parser = commands.add_parser('cache', help='inspect, prune or clear the persistent cache of the designs, see vbelts.cache')
+    cache_parser.add_argument('action', choices=('stats', 'prune', 'clear'), help='prune removes the stale entries and the least recently used ones beyond --max-entries')
+    cache_parser.add_argument('--path', help='cache file, by default VBELTS_CACHE or results.sqlite in the user cache directory')
+    cache_parser.add_argument('--max-entries', type=int, help='entries to keep when pruning, by default 100000')
+    cache_parser.add_argument('--keep-stale', action='store_true', help='keep the entries of tables that changed when pruning')
+    cache_parser.set_defaults(func=_cache_command)
+    args = parser.parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,165 @@
+"""Complete v-belt drive design, from the motor and machine to the quantity of belts."""
+from math import ceil
+from typing import NamedTuple
+
+from vbelts import belt, instrument, length, power, pulley, registry, util
+from vbelts.util import _NotValidError
+
+
+class DriveDesign(NamedTuple):
+    r"""Result of a drive design.
+
+    Attributes
+    ----------
+    est_power : float
+        Estimated power with the service factor, [hp]
+    vbelt_model : str
+        Model of the v-belt, [-]
+    vbelt_profile : str
+        Selected v-belt profile, [-]
+    vbelt_type : str
+        Selected v-belt type, [-]
+    min_diam : float
+        Smallest pulley, on the fastest axle, [mm]
+    maj_diam : float
+        Largest commercial pulley, [mm]
+    gear_ratio : float
+        Gear ratio of the commercial pulleys, [-]
+    rpm_output : float
+        Output axle speed with the commercial pulleys, [rpm]
+    l_corr : float
+        V-Belt corrected length, [mm]
+    c_corr : float
+        Pulley corrected center distance, [mm]
+    belt_qty : float
+        Calculated quantity of v-belts, [-]
+    belts : int
+        Quantity of v-belts to install, [-]
+    """
+    est_power: float
+    vbelt_model: str
+    vbelt_profile: str
+    vbelt_type: str
+    min_diam: float
+    maj_diam: float
+    gear_ratio: float
+    rpm_output: float
+    l_corr: float
+    c_corr: float
+    belt_qty: float
+    belts: int
+
+
+def _group(device:util._Device):
+    """Group of the device, raising when the name is not in the group data."""
+    if device.group is None:
+        raise _NotValidError(f'The name {device.name} is not a valid {type(device).__name__.lower()}.')
+    return device.group
+
+
+@instrument.stage('design')
+def _design(drive_group:int, machine_group:int, hours_service:float, engine_power:float, rpm_input:float, rpm_output:float, vbelt_model:str, min_diam:float):
+    """Drive design from the classified motor and machine groups."""
+    model = registry.get(vbelt_model)
+    if not (rpm_input > 0 and rpm_output > 0):
+        raise _NotValidError('The input and output rpm have to be positive.')
+    est_power = power.EstPower(engine_power, drive_group, machine_group, hours_service).calc()
+    rpm_fastest = max(rpm_input, rpm_output)
+    profile = belt.Registered(vbelt_model, est_power, rpm_fastest).profile
+    if min_diam is None:
+        min_diam = model.basic[profile].diams[0]  # smallest rated pulley of the profile
+    # the smallest pulley is on the fastest axle, the ratio of the pulleys is always above one
+    ratio = util.gear_ratio(rpm_input, rpm_output)
+    ratio = ratio if ratio >= 1 else 1 / ratio
+    maj_diam = pulley.Driving(min_diam, profile, engine_power, rpm_fastest, ratio).driven_pulley()
+    maj_diam, gear_ratio, _, rpm_out = pulley.Driven(maj_diam, profile, engine_power, rpm_fastest, ratio).commercial(min_diam, maj_diam)
+    if rpm_input < rpm_output:
+        gear_ratio, rpm_out = 1 / gear_ratio, rpm_input * gear_ratio
+    distance = length.PulleyBelt(min_diam, maj_diam, vbelt_model, profile)
+    c_corr = distance.c_c()
+    belt_qty = power.TransPower(vbelt_model, profile, distance.b_type, est_power, gear_ratio, distance.l_corr, min_diam, maj_diam, rpm_fastest).belt_qty()
+    return DriveDesign(est_power, vbelt_model, profile, distance.b_type, min_diam, maj_diam, gear_ratio, rpm_out, distance.l_corr, c_corr, belt_qty, ceil(belt_qty))
+
+
+def design(motor:str, machine:str, hours_service:float, engine_power:float, rpm_input:float, rpm_output:float, vbelt_model:str='HiPower', min_diam:float=None):
+    r"""Design a v-belt drive in one call, running the power estimation, profile selection, pulleys, length and belt quantity.
+
+    Parameters
+    ----------
+    motor : str
+        Motor name, see the :ref:`Data <motor_machine_data>` section, [-]
+    machine : str
+        Machine name, see the :ref:`Data <motor_machine_data>` section, [-]
+    hours_service : float
+        Hours of service per day, [h/day]
+    engine_power : float
+        Motor power, [hp]
+    rpm_input : float
+        Input (driving) axle speed, [rpm]
+    rpm_output : float
+        Desired output (driven) axle speed, [rpm]
+    vbelt_model : str
+        Model of the v-belt, HiPower, SuperHC or one added to vbelts.registry, [-]
+    min_diam : float, optional
+        Smallest pulley, by default the smallest rated diameter of the selected profile, [mm]
+
+    Returns
+    -------
+    result : DriveDesign
+        Drive design result, [-]
+
+    Examples
+    --------
+    >>> drive = vbelts.design.design('normal torque ac', 'mill', 10, 5, 1750, 900, min_diam=100)
+    >>> drive.vbelt_type, drive.maj_diam, drive.belts
+    ('A-37', 190, 3)
+
+    Notes
+    -----
+    The rating tables are compiled once per process and shared by all the stages, see :func:`design_batch` to design many drives.
+    """
+    drive_group = _group(util.Motor(motor, engine_power))
+    machine_group = _group(util.Machine(machine, hours_service))
+    return _design(drive_group, machine_group, hours_service, engine_power, rpm_input, rpm_output, vbelt_model, min_diam)
+
+
+def design_batch(specs, vbelt_model:str='HiPower', errors:str='raise'):
+    r"""Design many v-belt drives, classifying each motor and machine name only once.
+
+    Parameters
+    ----------
+    specs : iterable
+        Tuples of the :func:`design` parameters motor, machine, hours_service, engine_power, rpm_input and rpm_output, [-]
+    vbelt_model : str
+        Model of the v-belt, HiPower, SuperHC or one added to vbelts.registry, [-]
+    errors : str
+        'raise' to raise the error of the first spec :func:`design` raises for, stopping the batch, or 'return' to put the error in the place of its DriveDesign and go on, [-]
+
+    Returns
+    -------
+    results : list
+        DriveDesign of each spec, or its error with errors='return', in order, [-]
+
+    Examples
+    --------
+    >>> results = vbelts.design.design_batch([('normal torque ac', 'mill', 10, 5, 1750, 900), ('normal torque ac', 'oven', 10, 5, 1750, 900)], errors='return')
+    >>> results[0].belts, type(results[1]).__name__
+    (9, '_NotValidError')
+    """
+    if errors not in ('raise', 'return'):
+        raise _NotValidError(f'The value {errors} is not a valid errors handling.')
+    motors = {}
+    machines = {}
+    results = []
+    for motor, machine, hours_service, engine_power, rpm_input, rpm_output in specs:
+        try:
+            if motor not in motors:
+                motors[motor] = _group(util.Motor(motor, engine_power))
+            if machine not in machines:
+                machines[machine] = _group(util.Machine(machine, hours_service))
+            results.append(_design(motors[motor], machines[machine], hours_service, engine_power, rpm_input, rpm_output, vbelt_model, None))
+        except Exception as error:
+            if errors == 'raise':
+                raise
+            results.append(error)
+    return results
@@ -0,0 +1,199 @@
+"""Parallel re-rating of large fleets of installed drives.
+
+The fleet is split in chunks that a process pool rates with the vectorized functions, the commercial length and
+type, the corrected center distance and the quantity of v-belts of each drive. The numpy arrays of the compiled
+tables, rating, length and fcac, are exported once to a shared memory block and every worker installs the views of
+the block in its indexes instead of building its own arrays. The registry being per process, a worker registers
+again the models registered in the caller, those registered at run time included, so it reads their tables and
+compiles the python indexes the arrays are built from, but none of the arrays. The drive columns and the results
+are shared the same way, each worker reads and writes only the rows of its chunks, so nothing is pickled per chunk,
+the results are in input order and the private memory of a worker does not grow with the fleet nor with the number
+of workers.
+
+Examples
+--------
+>>> results = vbelts.fleet.rerate([130, 140], [240, 294], 'HiPower', ['a', 'b'], [2, 12], [1750, 1150])
+>>> results['vbelt_type'], results['belt_qty']
+(array(['A-47', 'B-55'], dtype='<U4'), array([0.4466848 , 2.76055506]))
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from vbelts import length, power, registry
+from vbelts.util import _numpy
+
+_state = {}  # shared blocks and views attached by a worker
+
+
+def _caches(vbelt_models):
+    """Compiled indexes of the models with the method building their numpy arrays and the attribute caching them."""
+    for vbelt_model in vbelt_models:
+        model = registry.get(vbelt_model)
+        for profile in model.profiles:
+            yield f'{vbelt_model}_{profile}_pb', model.basic[profile], 'arrays', '_arrays'
+            yield f'{vbelt_model}_{profile}_pa', model.additional[profile], 'arrays', '_arrays'
+        for profile, index in model.catalog.items():
+            yield f'{vbelt_model}_{profile}_length', index, 'arrays', '_arrays'
+    yield 'fcac', power._fcac_index(), 'arrays', '_arrays'
+
+
+def _share(arrays:dict):
+    """Copy named arrays to a new shared memory block, returning it and the layout to attach them."""
+    np = _numpy()
+    layout = {}
+    size = 0
+    for key, array in arrays.items():
+        layout[key] = (size, array.dtype.str, array.shape)
+        size += -(-array.nbytes // 8) * 8  # aligned to 8 bytes
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for key, array in arrays.items():
+        offset, dtype, shape = layout[key]
+        np.ndarray(shape, dtype, block.buf, offset)[...] = array
+    return block, layout
+
+
+def _views(buffer, layout:dict):
+    """View of each array of a shared memory buffer."""
+    np = _numpy()
+    return {key: np.ndarray(shape, dtype, buffer, offset) for key, (offset, dtype, shape) in layout.items()}
+
+
+def _attach(name:str, layout:dict):
+    """Attach a shared memory block, returning it and the views of its arrays."""
+    block = shared_memory.SharedMemory(name=name)
+    return block, _views(block.buf, layout)
+
+
+def _export(vbelt_models):
+    """Shared memory block with the numpy arrays of the compiled tables of the models."""
+    arrays = {}
+    for key, cached, build, _ in _caches(vbelt_models):
+        for i, array in enumerate(getattr(cached, build)()):
+            arrays[(key, i)] = array
+    return _share(arrays)
+
+
+def _definitions():
+    """Arguments of :func:`vbelts.registry.register` for the models registered in the calling process, in their order."""
+    return [(model.name, model.profiles, model.boundaries, model.limits, model.length, {'type': list(model.fcc), 'fcc': list(model.fcc.values())},
+             model.pb, model.pa) for model in registry._models.values()]
+
+
+def _init(tables:tuple, drives:tuple, definitions:list, vbelt_models:list, models:list, profiles:list, types:list):
+    """Worker initializer, register the models of the caller, install the shared table arrays in the compiled indexes and attach the drives."""
+    np = _numpy()
+    for definition in definitions:
+        registry.register(*definition)
+    block, views = _attach(*tables)
+    arrays = {}
+    for (key, _), view in views.items():
+        arrays.setdefault(key, []).append(view)
+    for key, cached, _, attr in _caches(vbelt_models):
+        setattr(cached, attr, tuple(arrays[key]))
+    _state['tables'] = block
+    _state['drives'], _state['columns'] = _attach(*drives)
+    _state['models'] = np.array(models, dtype=str)
+    _state['profiles'] = np.array(profiles, dtype=str)
+    _state['types'] = np.array(types, dtype=str)
+
+
+def _rate(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm):
+    """Commercial length, type, corrected center distance and quantity of v-belts of arrays of drives."""
+    np = _numpy()
+    l_corr, b_type = length.l_c_batch(min_diam, maj_diam, vbelt_model, vbelt_profile)
+    c_corr = length.corrected_center_distance(min_diam, maj_diam, l_corr)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gear_ratio = maj_diam / min_diam
+    belt_qty = power.belt_qty_batch(vbelt_model, vbelt_profile, b_type, est_power, gear_ratio, l_corr, min_diam, maj_diam, rpm)
+    return l_corr, b_type, c_corr, belt_qty
+
+
+def _rate_chunk(bounds:tuple):
+    """Rate the rows of a chunk of the shared drives, writing the results in their rows."""
+    np = _numpy()
+    start, stop = bounds
+    columns = _state['columns']
+    vbelt_model, vbelt_profile = _state['models'][columns['model'][start:stop]], _state['profiles'][columns['profile'][start:stop]]
+    l_corr, b_type, c_corr, belt_qty = _rate(columns['min_diam'][start:stop], columns['maj_diam'][start:stop], vbelt_model, vbelt_profile,
+                                             columns['est_power'][start:stop], columns['rpm'][start:stop])
+    types = _state['types']
+    code = np.minimum(np.searchsorted(types, b_type), len(types) - 1)
+    columns['type_code'][start:stop] = np.where(types[code] == b_type, code, -1)
+    columns['l_corr'][start:stop] = l_corr
+    columns['c_corr'][start:stop] = c_corr
+    columns['belt_qty'][start:stop] = belt_qty
+    return stop - start
+
+
+def rerate(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm, processes:int=None, chunksize:int=65536):
+    r"""Re-rate a fleet of installed drives across a process pool, with the tables and the drives in shared memory.
+
+    Parameters
+    ----------
+    min_diam : array_like
+        Smallest pulley of each drive, [mm]
+    maj_diam : array_like
+        Largest pulley of each drive, [mm]
+    vbelt_model : array_like
+        Model of the v-belt, [-]
+    vbelt_profile : array_like
+        Profile of the v-belt, [-]
+    est_power : array_like
+        Estimated power, [hp]
+    rpm : array_like
+        Fastest axle rotation speed, [rpm]
+    processes : int, optional
+        Worker processes, by default the number of cores, 1 rates in the calling process, [-]
+    chunksize : int
+        Drives rated by a worker at once, [-]
+
+    Returns
+    -------
+    results : dict
+        Arrays of the drives in input order, l_corr and vbelt_type from :func:`vbelts.length.l_c_batch`, c_corr from
+        :func:`vbelts.length.corrected_center_distance` and belt_qty from :func:`vbelts.power.belt_qty_batch`,
+        nan or empty where the drive is out of range, [-]
+
+    Notes
+    -----
+    Requires numpy. The gear ratio of each drive is the ratio of its pulleys. The workers are spawned, so a script
+    calling it with more than one process needs the ``if __name__ == '__main__':`` guard.
+    """
+    np = _numpy()
+    vbelt_model, vbelt_profile = (np.asarray(x, dtype=str) for x in (vbelt_model, vbelt_profile))
+    min_diam, maj_diam, est_power, rpm = (np.asarray(x, dtype=float) for x in (min_diam, maj_diam, est_power, rpm))
+    min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm = (
+        np.ravel(x) for x in np.broadcast_arrays(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm))
+    size = len(min_diam)
+    chunks = [(start, min(start + chunksize, size)) for start in range(0, size, chunksize)]
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(chunks) <= 1:
+        l_corr, b_type, c_corr, belt_qty = _rate(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm)
+        return {'l_corr': l_corr, 'vbelt_type': b_type, 'c_corr': c_corr, 'belt_qty': belt_qty}
+    # the models and profiles as codes, the unknown models are rated as such by the workers
+    models, model_code = np.unique(vbelt_model, return_inverse=True)
+    profiles, profile_code = np.unique(vbelt_profile, return_inverse=True)
+    vbelt_models = [name for name in models.tolist() if name in registry.names()]
+    types = sorted({b_type for name in vbelt_models for index in registry.get(name).catalog.values() for b_type in index.b_type})
+    columns = {'min_diam': min_diam, 'maj_diam': maj_diam, 'est_power': est_power, 'rpm': rpm, 'model': model_code.ravel(), 'profile': profile_code.ravel(),
+               'l_corr': np.empty(size), 'c_corr': np.empty(size), 'belt_qty': np.empty(size), 'type_code': np.empty(size, dtype=np.int32)}
+    tables, tables_layout = _export(vbelt_models)
+    drives, drives_layout = _share(columns)
+    try:
+        initargs = ((tables.name, tables_layout), (drives.name, drives_layout), _definitions(), vbelt_models, models.tolist(), profiles.tolist(), types)
+        # spawned workers start without a copy of the memory of the caller
+        with ProcessPoolExecutor(processes, multiprocessing.get_context('spawn'), _init, initargs) as executor:
+            for _ in executor.map(_rate_chunk, chunks):
+                pass
+        views = _views(drives.buf, drives_layout)
+        code = views['type_code']
+        results = {'l_corr': views['l_corr'].copy(), 'vbelt_type': np.where(code >= 0, np.asarray(types or [''], dtype=str)[np.maximum(code, 0)], ''),
+                   'c_corr': views['c_corr'].copy(), 'belt_qty': views['belt_qty'].copy()}
+        del views, code
+    finally:
+        for block in (tables, drives):
+            block.close()
+            block.unlink()
+    return results
@@ -0,0 +1,184 @@
+"""Opt-in instrumentation of the stages of the sizing chain.
+
+Each stage, as the belt length selection or the basic power lookup, reports to the registered hooks its wall time,
+the table rows it compared and the interpolations it did. The stages are replaced by their measured form only while
+a hook is registered, so they cost nothing otherwise.
+
+Usage::
+
+    with vbelts.instrument.recording() as recorder:
+        vbelts.design.design('normal torque ac', 'mill', 10, 5, 1750, 900)
+    print(recorder.report())
+
+Notes
+-----
+The rows and interpolations of a stage include those of the stages it calls. The counters are shared by the
+threads of the process, so measure one thread at a time.
+"""
+import sys
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+_hooks = []
+_stages = []
+_tally = None  # rows and interpolations of the running stage, None while no stage is measured
+
+# upper edges of the time histogram buckets, 1-2-5 steps from 1 us to 1 s, [s]
+edges = tuple(step * 10.0**exponent for exponent in range(-6, 0) for step in (1, 2, 5)) + (1.0,)
+
+
+def add_hook(callback):
+    """Register a callback called as callback(stage, seconds, rows, interpolations) at the end of each stage."""
+    if not _hooks:
+        for target in _stages:
+            target.install()
+    _hooks.append(callback)
+
+
+def remove_hook(callback):
+    """Unregister a callback."""
+    _hooks.remove(callback)
+    if not _hooks:
+        for target in _stages:
+            target.uninstall()
+
+
+def count(rows:int=0, interpolations:int=0):
+    """Add to the counters of the running stage, if one is measured."""
+    if _tally is not None:
+        _tally[0] += rows
+        _tally[1] += interpolations
+
+
+class _Stage():
+    """Stage class replaces a function or method by its measured wrapper while a hook is registered, so the stages cost nothing otherwise.
+
+    Parameters
+    ----------
+    name : str
+        Stage name, [-]
+    func : callable
+        Function or method of the stage, [-]
+    """
+    def __init__(self, name:str, func):
+        self.name = name
+        self.func = func
+        self.owner = None
+
+        @wraps(func)
+        def measured(*args, **kwargs):
+            return _measure(name, func, args, kwargs)
+        self.measured = measured
+
+
+    def __set_name__(self, owner, attr):
+        """Called for a method, put the plain method in the class."""
+        self.owner, self.attr = owner, attr
+        setattr(owner, attr, self.func)
+        _stages.append(self)
+        if _hooks:
+            self.install()
+
+
+    def install(self):
+        setattr(self.owner, self.attr, self.measured)
+
+
+    def uninstall(self):
+        setattr(self.owner, self.attr, self.func)
+
+
+def stage(name:str):
+    """Decorator reporting the calls of a method, or of a module function, as the stage name."""
+    def decorate(func):
+        target = _Stage(name, func)
+        if '.' in func.__qualname__:  # a method, registered by __set_name__ once the class is created
+            return target
+        target.owner, target.attr = sys.modules[func.__module__], func.__name__
+        _stages.append(target)
+        if _hooks:
+            return target.measured
+        return func
+    return decorate
+
+
+def _measure(name:str, func, args, kwargs):
+    global _tally
+    outer, _tally = _tally, [0, 0]
+    start = perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        seconds = perf_counter() - start
+        rows, interpolations = _tally
+        if outer is not None:
+            outer[0] += rows
+            outer[1] += interpolations
+        _tally = outer
+        for callback in list(_hooks):
+            callback(name, seconds, rows, interpolations)
+
+
+class Recorder():
+    r"""Recorder class aggregates the stage reports into totals and a histogram of the wall time of each stage.
+
+    Examples
+    --------
+    >>> recorder = vbelts.instrument.Recorder()
+    >>> vbelts.instrument.add_hook(recorder)
+    >>> vbelts.power.TransPower('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750).belt_qty()
+    0.5060451558976288
+    >>> vbelts.instrument.remove_hook(recorder)
+    >>> recorder.stats['power.basic']['calls']
+    1
+    """
+    def __init__(self):
+        self.stats = {}
+
+
+    def __call__(self, name:str, seconds:float, rows:int, interpolations:int):
+        try:
+            stats = self.stats[name]
+        except KeyError:
+            stats = self.stats[name] = {'calls': 0, 'seconds': 0.0, 'max': 0.0, 'rows': 0, 'interpolations': 0, 'histogram': [0] * (len(edges) + 1)}
+        stats['calls'] += 1
+        stats['seconds'] += seconds
+        stats['max'] = max(stats['max'], seconds)
+        stats['rows'] += rows
+        stats['interpolations'] += interpolations
+        stats['histogram'][bisect_left(edges, seconds)] += 1
+
+
+    def percentile(self, name:str, q:float):
+        """Upper edge of the histogram bucket holding the q percentile (0 to 100) of the wall time of the stage, [s]"""
+        stats = self.stats[name]
+        target = q / 100 * stats['calls']
+        seen = 0
+        for bucket, calls in enumerate(stats['histogram']):
+            seen += calls
+            if calls and seen >= target:
+                return edges[bucket] if bucket < len(edges) else stats['max']
+        return stats['max']
+
+
+    def report(self):
+        """Table of the stages, ordered by total wall time."""
+        lines = [f'{"stage":<22}{"calls":>8}{"total [ms]":>12}{"mean [us]":>11}{"p50 [us]":>10}{"p99 [us]":>10}{"rows/call":>11}{"interp/call":>13}']
+        for name, stats in sorted(self.stats.items(), key=lambda item: -item[1]['seconds']):
+            calls = stats['calls']
+            lines.append(f'{name:<22}{calls:>8}{stats["seconds"] * 1e3:>12.3f}{stats["seconds"] / calls * 1e6:>11.2f}{self.percentile(name, 50) * 1e6:>10.0f}'
+                         f'{self.percentile(name, 99) * 1e6:>10.0f}{stats["rows"] / calls:>11.1f}{stats["interpolations"] / calls:>13.2f}')
+        return '\n'.join(lines)
+
+
+@contextmanager
+def recording(recorder:Recorder=None):
+    """Context manager registering a Recorder, new by default, for the calls inside the block."""
+    recorder = Recorder() if recorder is None else recorder
+    add_hook(recorder)
+    try:
+        yield recorder
+    finally:
+        remove_hook(recorder)
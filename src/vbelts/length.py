@@ -1,5 +1,8 @@
-from vbelts.util import _Interpolate, _Iterate, _ReIterate, _OutOfRangeError
+from vbelts import instrument, registry
+from vbelts.util import _ChooseIndex, _Interpolate, _ReIterate, _OutOfRangeError, _NotValidError, _numpy
 from abc import ABC
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
 
 h_factor = {0:0, 0.02:0.01, 0.04:0.02, 0.06:0.03, 0.08:0.04, 0.1:0.05, 0.12:0.06, 0.14:0.07, 0.16:0.08, 0.18:0.09, 0.2:0.1, 0.21:0.11, 0.23:0.12, 0.25:0.13, 0.27:0.14, 0.29:0.15, 0.3:0.16, 0.32:0.17, 0.34:0.18, 0.35:0.19, 0.37:0.2, 0.39:0.21, 0.4:0.22, 0.41:0.23, 0.43:0.24, 0.44:0.25, 0.46:0.26, 0.47:0.27, 0.48:0.28, 0.5:0.29, 0.51:0.3}
 
@@ -8,6 +11,19 @@ HiPower_length = ({'profile': 'a', 'length': '695', 'type': 'A-26'}, {'profile':
 SuperHC_length = [{'profile': '3v', 'length': '635', 'type': '3V250'}, {'profile': '3v', 'length': '675', 'type': '3V265'}, {'profile': '3v', 'length': '710', 'type': '3V280'}, {'profile': '3v', 'length': '760', 'type': '3V300'}, {'profile': '3v', 'length': '800', 'type': '3V315'}, {'profile': '3v', 'length': '850', 'type': '3V335'}, {'profile': '3v', 'length': '900', 'type': '3V355'}, {'profile': '3v', 'length': '955', 'type': '3V375'}, {'profile': '3v', 'length': '1015', 'type': '3V400'}, {'profile': '3v', 'length': '1080', 'type': '3V425'}, {'profile': '3v', 'length': '1145', 'type': '3V450'}, {'profile': '3v', 'length': '1205', 'type': '3V475'}, {'profile': '3v', 'length': '1270', 'type': '3V500'}, {'profile': '3v', 'length': '1345', 'type': '3V530'}, {'profile': '3v', 'length': '1420', 'type': '3V560'}, {'profile': '3v', 'length': '1525', 'type': '3V600'}, {'profile': '3v', 'length': '1600', 'type': '3V630'}, {'profile': '3v', 'length': '1700', 'type': '3V670'}, {'profile': '3v', 'length': '1805', 'type': '3V710'}, {'profile': '3v', 'length': '1905', 'type': '3V750'}, {'profile': '3v', 'length': '2030', 'type': '3V800'}, {'profile': '3v', 'length': '2160', 'type': '3V850'}, {'profile': '3v', 'length': '2285', 'type': '3V900'}, {'profile': '3v', 'length': '2415', 'type': '3V950'}, {'profile': '3v', 'length': '2540', 'type': '3V1000'}, {'profile': '3v', 'length': '2690', 'type': '3V1060'}, {'profile': '3v', 'length': '2845', 'type': '3V1120'}, {'profile': '3v', 'length': '2995', 'type': '3V1180'}, {'profile': '3v', 'length': '3175', 'type': '3V1250'}, {'profile': '3v', 'length': '3355', 'type': '3V1320'}, {'profile': '3v', 'length': '3555', 'type': '3V1400'}, {'profile': '5v', 'length': '1270', 'type': '5V500'}, {'profile': '5v', 'length': '1345', 'type': '5V530'}, {'profile': '5v', 'length': '1420', 'type': '5V560'}, {'profile': '5v', 'length': '1525', 'type': '5V600'}, {'profile': '5v', 'length': '1600', 'type': '5V630'}, {'profile': '5v', 'length': '1700', 'type': '5V670'}, {'profile': '5v', 'length': '1805', 'type': '5V710'}, {'profile': '5v', 'length': '1905', 'type': '5V750'}, {'profile': '5v', 'length': '2030', 'type': '5V800'}, {'profile': '5v', 'length': '2160', 'type': '5V850'}, {'profile': '5v', 'length': '2285', 'type': '5V900'}, {'profile': '5v', 'length': '2415', 'type': '5V950'}, {'profile': '5v', 'length': '2540', 'type': '5V1000'}, {'profile': '5v', 'length': '2690', 'type': '5V1060'}, {'profile': '5v', 'length': '2845', 'type': '5V1120'}, {'profile': '5v', 'length': '2995', 'type': '5V1180'}, {'profile': '5v', 'length': '3175', 'type': '5V1250'}, {'profile': '5v', 'length': '3355', 'type': '5V1320'}, {'profile': '5v', 'length': '3555', 'type': '5V1400'}, {'profile': '5v', 'length': '3810', 'type': '5V1500'}, {'profile': '5v', 'length': '4065', 'type': '5V1600'}, {'profile': '5v', 'length': '4320', 'type': '5V1700'}, {'profile': '5v', 'length': '4570', 'type': '5V1800'}, {'profile': '5v', 'length': '4825', 'type': '5V1900'}, {'profile': '5v', 'length': '5080', 'type': '5V2000'}, {'profile': '5v', 'length': '5385', 'type': '5V2120'}, {'profile': '5v', 'length': '5690', 'type': '5V2240'}, {'profile': '5v', 'length': '5995', 'type': '5V2360'}, {'profile': '5v', 'length': '6350', 'type': '5V2500'}, {'profile': '5v', 'length': '6730', 'type': '5V2650'}, {'profile': '5v', 'length': '7110', 'type': '5V2800'}, {'profile': '5v', 'length': '7620', 'type': '5V3000'}, {'profile': '5v', 'length': '8000', 'type': '5V3150'}, {'profile': '5v', 'length': '8510', 'type': '5V3350'}, {'profile': '5v', 'length': '9015', 'type': '5V3550'}, {'profile': '8v', 'length': '2540', 'type': '8V1000'}, {'profile': '8v', 'length': '2690', 'type': '8V1060'}, {'profile': '8v', 'length': '2845', 'type': '8V1120'}, {'profile': '8v', 'length': '2995', 'type': '8V1180'}, {'profile': '8v', 'length': '3175', 'type': '8V1250'}, {'profile': '8v', 'length': '3355', 'type': '8V1320'}, {'profile': '8v', 'length': '3555', 'type': '8V1400'}, {'profile': '8v', 'length': '3810', 'type': '8V1500'}, {'profile': '8v', 'length': '4065', 'type': '8V1600'}, {'profile': '8v', 'length': '4320', 'type': '8V1700'}, {'profile': '8v', 'length': '4570', 'type': '8V1800'}, {'profile': '8v', 'length': '4825', 'type': '8V1900'}, {'profile': '8v', 'length': '5080', 'type': '8V2000'}, {'profile': '8v', 'length': '5385', 'type': '8V2120'}, {'profile': '8v', 'length': '5690', 'type': '8V2240'}, {'profile': '8v', 'length': '5995', 'type': '8V2360'}, {'profile': '8v', 'length': '6350', 'type': '8V2500'}, {'profile': '8v', 'length': '6730', 'type': '8V2650'}, {'profile': '8v', 'length': '7110', 'type': '8V2800'}, {'profile': '8v', 'length': '7620', 'type': '8V3000'}, {'profile': '8v', 'length': '8000', 'type': '8V3150'}, {'profile': '8v', 'length': '8510', 'type': '8V3350'}, {'profile': '8v', 'length': '9017', 'type': '8V3550'}, {'profile': '8v', 'length': '9525', 'type': '8V3750'}, {'profile': '8v', 'length': '10160', 'type': '8V4000'}, {'profile': '8v', 'length': '10795', 'type': '8V4250'}, {'profile': '8v', 'length': '11430', 'type': '8V4500'}, {'profile': '8v', 'length': '12065', 'type': '8V4750'}, {'profile': '8v', 'length': '12700', 'type': '8V5000'}, {'profile': '8v', 'length': '14225', 'type': '8V5600'}]
 
 
+# Compiled indexes of the tables of the module, built once per process on first use
+_indexes = {}
+
+
+def _h_index():
+    """Compiled index of the center distance correction factor, by (D - d)/l_a."""
+    try:
+        return _indexes['h_factor']
+    except KeyError:
+        factors = sorted(h_factor)
+        index = _indexes['h_factor'] = _ChooseIndex(factors, [h_factor[factor] for factor in factors])
+        return index
+
 
 class _Dist(ABC):
     """Abstract class holding private methods to calculate distance properties"""
@@ -62,7 +78,7 @@ class PulleyBelt(_Dist):
     >>> dist.l_c()
     (1200, 'A-46')
     >>> dist.c_c()
-    310.72814411208714
+    311.7289224952741
 
     References
     ----------
@@ -81,10 +97,14 @@ class PulleyBelt(_Dist):
         self._h_factor()
 
 
+    @instrument.stage('length.belt_type')
     def _l_c(self):
         """Calculates the corrected v-belt length and type."""
-        listname = f'{self.belt}_length'
-        self.l_corr, self.b_type = self.iterator(globals()[listname]).belt_type(globals()[listname], self.b_profile, self.l_uncorr)
+        try:
+            index = registry.get(self.belt).catalog[self.b_profile]
+        except (KeyError, TypeError):  # no lengths of the profile
+            raise _OutOfRangeError('Value out of range for these') from None
+        self.l_corr, self.b_type = index.lookup(self.l_uncorr)
     
 
     def l_c(self):
@@ -123,18 +143,17 @@ class PulleyBelt(_Dist):
         return (self.l_corr, self.b_type)
     
     
+    @instrument.stage('length.h_factor')
     def _h_factor(self):
         """Calculates and selects the appropriate correction factor for the center distance between pulleys."""
         adim_factor = (self.maj_diam - self.min_diam)/self._l_adj
-        for key in self.corr_dict:
-            last_factor = 0
-            if key == adim_factor:
-                self._h = self.corr_dict.get(key)
-            elif key > adim_factor:
-                self._h = self.interpol(adim_factor, last_factor, key, self.corr_dict.get(last_factor), self.corr_dict.get(key)).y_data()
-            last_factor = key
-        if self._h is None:
+        if not adim_factor >= 0:
             raise _OutOfRangeError('Value out of range for these parameters')
+        if self.corr_dict is h_factor and self.interpol is _Interpolate:
+            index = _h_index()
+        else:
+            index = _ChooseIndex(sorted(self.corr_dict), [self.corr_dict[key] for key in sorted(self.corr_dict)], self.interpol)
+        self._h = index.lookup(adim_factor)
 
 
     def _l_a(self):
@@ -169,4 +188,211 @@ class PulleyBelt(_Dist):
          .. [#] Claudino Alves, Claudemir. "Transmissão por Correias - Dimensionamento Atividade 2". **Fatec Itaquera**. Accessed September 16, 2020, http://claudemiralves.weebly.com/uploads/3/8/6/2/3862918/dimen._de_correias.pdf.
         """
         self.c_corr = (self._l_adj - self._h *(self.maj_diam - self.min_diam))/2
-        return self.c_corr
\ No newline at end of file
+        return self.c_corr
+
+
+def l_c_batch(min_diam, maj_diam, vbelt_model, vbelt_profile):
+    r"""Vectorized commercial length and v-belt type for many pulley systems at once.
+
+    Takes the same parameters as :class:`PulleyBelt`, as arrays or scalars that broadcast together, and selects the
+    length of every row with one binary search of the sorted lengths of its profile.
+
+    Parameters
+    ----------
+    min_diam : array_like
+        Smallest pulley, [mm]
+    maj_diam : array_like
+        Largest pulley, [mm]
+    vbelt_model : array_like
+        Belt model, [-]
+    vbelt_profile : array_like
+        Belt profile, [-]
+
+    Returns
+    -------
+    result : tuple
+        Contains the l_corr and b_type arrays, [-]
+    l_corr : numpy.ndarray
+        Length of the commercial belt chosen, nan where PulleyBelt would raise an error, [mm]
+    b_type : numpy.ndarray
+        Commercial v-belt type, empty where l_corr is nan, [-]
+
+    Examples
+    --------
+    >>> vbelts.length.l_c_batch([120, 200], 240, 'HiPower', 'a')
+    (array([1200., 1555.]), array(['A-46', 'A-60'], dtype='<U4'))
+
+    Notes
+    -----
+    Requires numpy. The results are the same as :meth:`PulleyBelt.l_c` row by row.
+    """
+    np = _numpy()
+    vbelt_model, vbelt_profile = (np.asarray(x, dtype=str) for x in (vbelt_model, vbelt_profile))
+    min_diam, maj_diam = (np.asarray(x, dtype=float) for x in (min_diam, maj_diam))
+    min_diam, maj_diam, vbelt_model, vbelt_profile = np.broadcast_arrays(min_diam, maj_diam, vbelt_model, vbelt_profile)
+    center_uncorr = (3 * min_diam + maj_diam)/2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        l_uncorr = 2 * center_uncorr + 1.57 * (maj_diam + min_diam) + ((maj_diam - min_diam)**2/(4 * center_uncorr))
+    l_corr = np.full(l_uncorr.shape, np.nan)
+    b_type = np.full(l_uncorr.shape, '', dtype=object)
+    for model in registry.names():
+        in_model = np.flatnonzero(vbelt_model.ravel() == model)
+        if not len(in_model):
+            continue
+        model_profiles = vbelt_profile.ravel()[in_model]
+        for profile, index in registry.get(model).catalog.items():
+            rows = in_model[model_profiles == profile]
+            if len(rows):
+                l_corr.flat[rows], b_type.flat[rows] = index.lookup_array(l_uncorr.ravel()[rows])
+    return (l_corr, b_type.astype(str))
+
+
+def corrected_center_distance(min_diam, maj_diam, l_corr):
+    r"""Vectorized corrected pulley center distance for many pulley systems and commercial belts at once.
+
+    Parameters
+    ----------
+    min_diam : array_like
+        Smallest pulley, [mm]
+    maj_diam : array_like
+        Largest pulley, [mm]
+    l_corr : array_like
+        Length of the commercial belt, [mm]
+
+    Returns
+    -------
+    c_corr : numpy.ndarray
+        Corrected center distance between the pulleys, nan where PulleyBelt would raise an error, [mm]
+
+    Examples
+    --------
+    >>> vbelts.length.corrected_center_distance(120, 240, [1200, 1225])
+    array([311.7289225 , 324.44380115])
+
+    Notes
+    -----
+    Requires numpy. The results are the same as :meth:`PulleyBelt.c_c` row by row, see it for the calculation.
+    """
+    np = _numpy()
+    min_diam, maj_diam, l_corr = (np.asarray(x, dtype=float) for x in (min_diam, maj_diam, l_corr))
+    l_adj = l_corr - 1.57 * (maj_diam + min_diam)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        adim_factor = (maj_diam - min_diam)/l_adj
+        h = np.where(adim_factor >= 0, _h_index().lookup_array(adim_factor), np.nan)
+        c_corr = (l_adj - h *(maj_diam - min_diam))/2
+    return c_corr
+
+
+class _Commercial(PulleyBelt):
+    """PulleyBelt of a given commercial length, the center distance of each length for the inverse selection."""
+    def __init__(self, min_diam:float, maj_diam:float, l_corr:float, b_type:str):
+        self.l_corr = l_corr
+        self.b_type = b_type
+        super().__init__(min_diam, maj_diam, None, None)
+
+
+    def _l_c(self):
+        """The length is given."""
+        pass
+
+
+class CenterFit(NamedTuple):
+    r"""Commercial belt that fits a center distance.
+
+    Attributes
+    ----------
+    l_corr : float
+        V-Belt corrected length, [mm]
+    vbelt_type : str
+        Commercial v-belt type, [-]
+    c_corr : float
+        Pulley corrected center distance with this belt, [mm]
+    """
+    l_corr: float
+    vbelt_type: str
+    c_corr: float
+
+
+def fit_center(min_diam:float, maj_diam:float, vbelt_model:str, vbelt_profile:str, center:float, tolerance:float):
+    r"""Commercial belts whose corrected center distance is within the tolerance of a fixed center distance, the inverse of :class:`PulleyBelt`.
+
+    Parameters
+    ----------
+    min_diam : float
+        Smallest pulley, [mm]
+    maj_diam : float
+        Largest pulley, [mm]
+    vbelt_model : str
+        Belt model, [-]
+    vbelt_profile : str
+        Belt profile, [-]
+    center : float
+        Center distance of the frame, [mm]
+    tolerance : float
+        Accepted difference of the corrected center distance to `center`, [mm]
+
+    Returns
+    -------
+    fits : list
+        CenterFit of each belt that fits, in ascending length, empty when none does, [-]
+
+    Notes
+    -----
+    The corrected center distance :math:`C_c` of :meth:`PulleyBelt.c_c` grows with the belt length, so the lengths of the
+    profile are searched by bisection, calculating the center distance of about two log2(n) of the n lengths.
+    Only the lengths with a correction factor `h` in the table are considered.
+
+    Examples
+    --------
+    >>> vbelts.length.fit_center(120, 240, 'HiPower', 'a', 320, 15)
+    [CenterFit(l_corr=1200.0, vbelt_type='A-46', c_corr=311.7289224952741), CenterFit(l_corr=1225.0, vbelt_type='A-47', c_corr=324.4438011518642)]
+    """
+    if not tolerance >= 0:
+        raise _NotValidError(f'The tolerance {tolerance} has to be positive or zero.')
+    index = registry.get(vbelt_model).catalog[vbelt_profile]
+    lengths, types = index.length, index.b_type
+
+    def c_corr(i):
+        return _Commercial(min_diam, maj_diam, lengths[i], types[i]).c_c()
+
+    # shortest length with a correction factor in the table, (D - d)/l_a up to the last factor
+    lo = bisect_left(lengths, 1.57 * (maj_diam + min_diam) + (maj_diam - min_diam) / max(h_factor))
+    if maj_diam == min_diam:
+        lo = bisect_right(lengths, 1.57 * (maj_diam + min_diam), lo)
+    first = _bisect_center(c_corr, center - tolerance, lo, len(lengths))
+    last = _bisect_center(c_corr, center + tolerance, first, len(lengths), right=True)
+    return [CenterFit(lengths[i], types[i], c_corr(i)) for i in range(first, last)]
+
+
+def _bisect_center(c_corr, center:float, lo:int, hi:int, right:bool=False):
+    """First position from lo with the center distance above `center`, or at it unless right, as bisect_left and bisect_right."""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        value = c_corr(mid)
+        if value < center or (right and value == center):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def fit_center_batch(cases):
+    r"""Commercial belts that fit the center distance of many retrofit cases, :func:`fit_center` for each one.
+
+    Parameters
+    ----------
+    cases : iterable
+        Tuples of the :func:`fit_center` parameters min_diam, maj_diam, vbelt_model, vbelt_profile, center and tolerance, [-]
+
+    Returns
+    -------
+    fits : list
+        For each case, the list of its CenterFit, or the exception raised by the case, [-]
+    """
+    results = []
+    for case in cases:
+        try:
+            results.append(fit_center(*case))
+        except Exception as error:
+            results.append(error)
+    return results
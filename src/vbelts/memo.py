@@ -0,0 +1,133 @@
+"""Opt-in memoization of PulleyBelt and TransPower for repetitive requests.
+
+The cached constructors return the same object for the same normalized inputs, so the objects are shared and
+must be treated as read only. The numbers of a key are floats and every nan is the same object, as nan != nan
+would make each call with a nan a miss.
+"""
+from collections import OrderedDict
+from threading import Lock
+
+from vbelts import length, power
+
+
+class LRUCache():
+    r"""LRUCache class is a bounded, thread-safe mapping that counts hits, misses and evictions.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries, not negative, [-]
+    policy : str
+        Eviction policy when full, 'lru' evicts the least recently used entry and 'fifo' the oldest one, [-]
+
+    Examples
+    --------
+    >>> cache = vbelts.memo.LRUCache(2)
+    >>> cache.get_or_create('a', lambda: 1)
+    1
+    >>> cache.get_or_create('a', lambda: 1)
+    1
+    >>> cache.stats()
+    {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 2}
+    """
+    def __init__(self, maxsize:int=4096, policy:str='lru'):
+        if policy not in ('lru', 'fifo'):
+            raise ValueError(f'Unknown eviction policy {policy}')
+        if maxsize < 0:
+            raise ValueError(f'The maximum size {maxsize} is negative')
+        self.maxsize = maxsize
+        self.policy = policy
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    def get_or_create(self, key, factory):
+        """Value of the key, calling factory() to create and store it on a miss."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if self.policy == 'lru':
+                    self._data.move_to_end(key)
+                return value
+        # create outside the lock, concurrent misses of the same key may both create it
+        value = factory()
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+
+    def resize(self, maxsize:int):
+        """Change the maximum number of entries, evicting the excess."""
+        if maxsize < 0:
+            raise ValueError(f'The maximum size {maxsize} is negative')
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+    def stats(self):
+        """Counters of the cache, to size it."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._data), 'maxsize': self.maxsize}
+
+
+    def __len__(self):
+        return len(self._data)
+
+
+pulley_belts = LRUCache()
+trans_powers = LRUCache()
+_nan = float('nan')  # the nan of every key
+
+
+def _floats(*values):
+    """Values of a key as floats, with the same nan object for all the nan values."""
+    return tuple(_nan if value != value else value for value in map(float, values))
+
+
+def pulley_belt(min_diam:float, maj_diam:float, belt:str, b_profile:str):
+    r"""Memoized :class:`vbelts.length.PulleyBelt`, shared by all the calls with the same inputs.
+
+    Examples
+    --------
+    >>> vbelts.memo.pulley_belt(120, 240, 'HiPower', 'a').l_c()
+    (1200.0, 'A-46')
+    """
+    key = (belt, b_profile, *_floats(min_diam, maj_diam))
+    return pulley_belts.get_or_create(key, lambda: length.PulleyBelt(min_diam, maj_diam, belt, b_profile))
+
+
+def trans_power(vbelt_model:str, vbelt_profile:str, vbelt_type:str, est_power:float, gear_ratio:float, belt_length_corr:float, min_diam:float, maj_diam:float, rpm:float):
+    r"""Memoized :class:`vbelts.power.TransPower`, shared by all the calls with the same inputs.
+
+    Examples
+    --------
+    >>> vbelts.memo.trans_power('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750).belt_qty()
+    0.5060451558976288
+    """
+    key = (vbelt_model, vbelt_profile, vbelt_type, *_floats(est_power, gear_ratio, belt_length_corr, min_diam, maj_diam, rpm))
+    return trans_powers.get_or_create(key, lambda: power.TransPower(vbelt_model, vbelt_profile, vbelt_type, est_power, gear_ratio, belt_length_corr, min_diam, maj_diam, rpm))
+
+
+def stats():
+    """Counters of the PulleyBelt and TransPower caches."""
+    return {'pulley_belt': pulley_belts.stats(), 'trans_power': trans_powers.stats()}
@@ -1,5 +1,72 @@
-from vbelts.util import _Pulley, _Iterate, _ReIterate, _ConvergenceError
-from time import time
+from bisect import bisect_left
+
+from vbelts import instrument
+from vbelts.util import _Pulley, _Iterate, _ReIterate, _ConvergenceError, _numpy
+
+base = 10  # step of the default commercial diameters, [mm]
+range_rpm = 100  # output speed range of the legacy iteration, [rpm]
+error_min = 0.01  # relative distance to the desired diameter the iteration stops at, [-]
+max_steps = 50000  # steps of the iteration before giving up, about 10 ms, see _converge
+batch_steps = 64  # steps of the vectorized iteration, the rows left go on one by one
+
+
+def _snap(diam:float, series:list=None):
+    """Nearest commercial diameter, from the multiples of the base or by bisection of a sorted series."""
+    if series is None:
+        return base * round(diam/base)
+    i = bisect_left(series, diam)
+    if i == 0:
+        return series[0]
+    if i == len(series):
+        return series[-1]
+    # if both are equally near, return the maximum
+    return series[i - 1] if diam - series[i - 1] < series[i] - diam else series[i]
+
+
+def _converge(driving_pulley:float, gear_ratio:float, rpm:float, desired_pulley_diam:float):
+    """Driven diameter of the legacy commercial iteration, raising _ConvergenceError when it cannot converge.
+
+    The iteration keeps the diameter when its gear ratio is in the range of the output speed +- 100 rpm, shrinks it
+    by 1 % of the error above the range and grows it by the error below it. Only the growing step, or the first step
+    when the diameter already is near enough, can converge: the others leave the diameter below 99 % of the desired
+    one. The inputs whose growing step cannot reach it, the output speeds below 100 rpm or the ranges below about 90 %
+    of the desired diameter, are rejected after the first step instead of looping.
+
+    The steps are replayed one by one because the diameter they end at has no closed form: each growing step squares
+    the error, so where the diameter lands depends on the rounding of every step before, and snapping a computed
+    diameter changes the legacy results. The iteration gives up after `max_steps` steps, about 10 ms, where the
+    legacy loop gave up after 4 s. Of random drives with a desired diameter of 80 to 110 % of the starting one, 99.5 %
+    converge or are rejected within 10000 steps, about 0.5 % do not converge within 200000 steps and run up to the
+    cap, and about 1 in 100000 converges only after the cap and is rejected, where the legacy loop converged.
+    """
+    rpm_output = rpm/gear_ratio
+    # below 100 rpm the range is negative and the iteration only shrinks the diameter
+    gear_ratio_max = rpm/(rpm_output - range_rpm) if rpm_output != range_rpm else -float('inf')
+    gear_ratio_min = rpm/(rpm_output + range_rpm)
+    diam_calc = gear_ratio * driving_pulley
+    error = 1
+    for step in range(max_steps):
+        gear_ratio_calc = diam_calc/driving_pulley
+        if gear_ratio_calc > gear_ratio_max:
+            diam_calc -= diam_calc * error * 0.01
+        elif gear_ratio_calc < gear_ratio_min:
+            diam_calc += diam_calc * error
+        else:
+            diam_calc *= error
+        error = 1-(diam_calc/desired_pulley_diam)
+        if not error > error_min:
+            return diam_calc
+        if step == 0 and _never(driving_pulley, gear_ratio_max, gear_ratio_min, desired_pulley_diam):
+            break
+    raise _ConvergenceError(f'The driven pulley of {gear_ratio * driving_pulley} mm cannot reach the desired diameter of {desired_pulley_diam} mm')
+
+
+def _never(driving_pulley, gear_ratio_max, gear_ratio_min, desired_pulley_diam):
+    """Whether the legacy iteration can never converge after an unconverged first step, for scalars or arrays."""
+    largest = gear_ratio_min * driving_pulley  # largest diameter the growing step starts from
+    grown = largest + largest * (1 - largest/desired_pulley_diam)
+    return (gear_ratio_max < 0) | ((largest < desired_pulley_diam) & (grown < desired_pulley_diam * (1 - error_min) * (1 - 1e-9)))
+
 
 class Driven(_Pulley):
     r"""Driven class stores essential properties of the driven pulley and calculates driving pulley properties. It also can select the appropriate commercial diameter for the driven pulley, updating the relevant properties like output rpm and gear ratio.
@@ -54,8 +121,18 @@ class Driven(_Pulley):
         return self.diam / self.gear_ratio
     
 
-    def commercial(self, driving_pulley:float, desired_pulley_diam:int):
-        r"""Selects an approximate to the commercial diameter of a pulley through iterator convergence.
+    @instrument.stage('pulley.commercial')
+    def commercial(self, driving_pulley:float, desired_pulley_diam:int, series:list=None):
+        r"""Selects the commercial diameter of the driven pulley nearest to the gear ratio.
+
+        Parameters
+        ----------
+        driving_pulley : float
+            Diameter of the driving pulley, [mm]
+        desired_pulley_diam : float
+            Desired driven pulley diameter, the iteration stops at 99 % of it, [mm]
+        series : list, optional
+            Sorted commercial diameters, by default the multiples of 10 mm, [mm]
 
         Returns
         -------
@@ -69,38 +146,17 @@ class Driven(_Pulley):
             Input rotational speed, [rpm]
         rpm_out : float
             Calculated output rotational speed for the commercial driven diameter, [rpm]
+
+        Notes
+        -----
+        The driven diameter starts at :math:`D = R \cdot d` and follows the legacy iteration, kept step by step so the
+        results do not change, until it is at least 99 % of the desired diameter, then it is snapped to the nearest
+        diameter of the series. The iteration is bounded by 50000 steps instead of the 4 s of the legacy loop, and the
+        inputs it can never converge for, such as output speeds below 100 rpm with a driven diameter below the desired
+        one, are rejected after the first step. The rare inputs converging after the last step are rejected too.
         """
-        # calculate gear ratio range
-        range_rpm = 100
-        rpm_output = self.rpm/self.gear_ratio
-        gear_ratio_max = self.rpm/(rpm_output - range_rpm)
-        gear_ratio_min = self.rpm/(rpm_output + range_rpm)
-        error_min = 0.01
-        driven_pulley = self.gear_ratio * driving_pulley
-        diam_calc = driven_pulley
-
-        # _Iterate
-        error = 1
-        t_i = time()
-        while error > error_min:
-            gear_ratio_calc = diam_calc/driving_pulley
-            # control iteration parameters
-            if gear_ratio_calc > gear_ratio_max:
-                diam_calc -= diam_calc * error * 0.01
-            elif gear_ratio_calc < gear_ratio_min:
-                diam_calc += diam_calc * error
-            else:
-                diam_calc *= error
-            error = 1-(diam_calc/desired_pulley_diam)
-            # control for infinite loops
-            t_f = time()
-            elapsed_time = t_f - t_i
-            if elapsed_time > 4:
-                raise _ConvergenceError('The function could not reach convergence, try again with a lower value')
-        
-        # recalculate rpm_output
-        base = 10
-        diam_out = base * round(diam_calc/base)  # round the number to nearest 5 integer
+        diam_calc = _converge(driving_pulley, self.gear_ratio, self.rpm, desired_pulley_diam)
+        diam_out = _snap(diam_calc, series)
         gear_ratio_comm = diam_out/driving_pulley
         rpm_out = self.rpm/gear_ratio_comm
         return [diam_out, gear_ratio_comm, self.rpm, rpm_out]
@@ -133,6 +189,7 @@ class Driving(_Pulley):
         super().__init__(diam, vbelt_profile, power, rpm, iterator)
         self.gear_ratio = gear_ratio
 
+    @instrument.stage('pulley.driven')
     def driven_pulley(self):
         r"""Calculated driven pulley diameter.
 
@@ -154,4 +211,77 @@ class Driving(_Pulley):
         ----------
         .. [#] Douglas Wright. 2005."DANotes: V-Belt drives: Introduction", **V-BELT DRIVES**. Accessed September 23, 2020, http://www-mdp.eng.cam.ac.uk/web/library/enginfo/textbooks_dvd_only/DAN/V-belts/intro/intro.html.
         """
-        return self.diam * self.gear_ratio
\ No newline at end of file
+        return self.diam * self.gear_ratio
+
+
+def commercial_batch(driving_pulley, gear_ratio, rpm, desired_pulley_diam, series:list=None):
+    r"""Vectorized commercial driven pulley selection of :meth:`Driven.commercial` for many pulleys.
+
+    Parameters
+    ----------
+    driving_pulley : array_like
+        Diameter of the driving pulley, [mm]
+    gear_ratio : array_like
+        Gear ratio of the pulleys in decimal form, [-]
+    rpm : array_like
+        Rotational speed of the driving axle, [rpm]
+    desired_pulley_diam : array_like
+        Smallest acceptable driven pulley diameter, [mm]
+    series : list, optional
+        Sorted commercial diameters, by default the multiples of 10 mm, [mm]
+
+    Returns
+    -------
+    result : tuple
+        Arrays of diam_out, gear_ratio_comm, rpm and rpm_out, nan where the input is infeasible, [-]
+
+    Examples
+    --------
+    >>> vbelts.pulley.commercial_batch(130, [1.846, 2.5], 1750, 120)[0]
+    array([240., 320.])
+    """
+    np = _numpy()
+    driving_pulley, gear_ratio, rpm, desired_pulley_diam = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (driving_pulley, gear_ratio, rpm, desired_pulley_diam)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rpm_output = rpm/gear_ratio
+        gear_ratio_max = np.where(rpm_output != range_rpm, rpm/(rpm_output - range_rpm), -np.inf)
+        gear_ratio_min = rpm/(rpm_output + range_rpm)
+        driven_pulley = np.full(driving_pulley.shape, np.nan)
+        # the rows still iterating, with their columns compressed to them
+        rows = np.arange(driving_pulley.size)
+        driving, desired, high, low = (x.ravel() for x in (driving_pulley, desired_pulley_diam, gear_ratio_max, gear_ratio_min))
+        diam_calc, error = gear_ratio.ravel() * driving, np.ones(driving.size)
+        for step in range(batch_steps):
+            gear_ratio_calc = diam_calc/driving
+            diam_calc = np.where(gear_ratio_calc > high, diam_calc - diam_calc * error * 0.01,
+                                 np.where(gear_ratio_calc < low, diam_calc + diam_calc * error, diam_calc * error))
+            error = 1-(diam_calc/desired)
+            done = ~(error > error_min)
+            driven_pulley.flat[rows[done]] = diam_calc[done]
+            keep = ~done
+            if step == 0:
+                keep &= ~_never(driving, high, low, desired)
+            rows, driving, desired, high, low, diam_calc, error = (x[keep] for x in (rows, driving, desired, high, low, diam_calc, error))
+            if not len(rows):
+                break
+    # the few rows left take many steps, they are faster one by one
+    for row in rows.tolist():
+        try:
+            driven_pulley.flat[row] = _converge(*(float(x.flat[row]) for x in (driving_pulley, gear_ratio, rpm, desired_pulley_diam)))
+        except _ConvergenceError:
+            pass
+    feasible = ~np.isnan(driven_pulley)
+    driven_pulley = np.where(feasible, driven_pulley, 0)
+    if series is None:
+        diam_out = base * np.round(driven_pulley/base)
+    else:
+        series = np.asarray(series, dtype=float)
+        i = np.clip(np.searchsorted(series, driven_pulley, 'left'), 1, len(series) - 1) if len(series) > 1 else np.zeros(driven_pulley.shape, dtype=int)
+        lower = series[np.maximum(i - 1, 0)]
+        upper = series[i]
+        diam_out = np.where(driven_pulley - lower < upper - driven_pulley, lower, upper)
+    diam_out = np.where(feasible, diam_out, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gear_ratio_comm = diam_out/driving_pulley
+        rpm_out = rpm/gear_ratio_comm
+    return (diam_out, gear_ratio_comm, rpm, rpm_out)
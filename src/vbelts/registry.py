@@ -0,0 +1,192 @@
+"""Registry of the v-belt models with their profiles, selection boundaries and tables.
+
+HiPower and SuperHC are registered on first use. Other manufacturers are added with :func:`register`, from data
+in memory or from the tables of a catalog added with :func:`vbelts.tables.add_catalog`. The tables are compiled
+to the lookup indexes once, when the model is registered, so the calculations fetch them by the model and profile
+without building any table name.
+
+Examples
+--------
+>>> hipower = vbelts.registry.get('HiPower')
+>>> vbelts.tables.add_catalog('catalogs')  # Acme_a_pb.vbt, Acme_a_pa.vbt, Acme_fcc.vbt and Acme_length.vbt
+>>> vbelts.registry.register('Acme', ('a',), (), hipower.limits)
+>>> vbelts.design.design('normal torque ac', 'mill', 10, 5, 1750, 900, 'Acme')
+"""
+from vbelts import tables
+from vbelts.util import _AdditionalIndex, _BasicGrid, _BasicIndex, _LengthIndex, _NotValidError
+
+_models = {}
+
+
+class BeltModel():
+    r"""BeltModel class holds a v-belt model and the compiled indexes of its tables, created by :func:`register`.
+
+    Parameters
+    ----------
+    name : str
+        Model of the v-belt, [-]
+    profiles : tuple
+        Profiles, from the one for the highest speeds to the one for the lowest, [-]
+    boundaries : tuple
+        For each profile but the last, the coefficients a, b, c and upper of its lowest rpm, a * est_power + b below `upper` hp and c from it on, [-]
+    limits : tuple
+        Lowest rpm, highest rpm, lowest and highest estimated power of the model, [-]
+    length : tuple
+        Rows of the commercial lengths with the profile, length and type keys, in ascending length for each profile, [-]
+    fcc : dict
+        Length correction factor of each v-belt type, [-]
+    pb : dict
+        Columns of the basic power table of each profile, diameter, rpm and power_b, [-]
+    pa : dict
+        Columns of the additional power table of each profile, gr_low, gr_high, rpm and power_a, [-]
+
+    Attributes
+    ----------
+    selection : tuple
+        The profiles but the last with the coefficients of their boundary, flattened for the profile selection, [-]
+    catalog : dict
+        Compiled length index of each profile, its lengths and types sorted by length, [-]
+    basic : dict
+        Compiled basic power index of each profile, [-]
+    additional : dict
+        Compiled additional power index of each profile, [-]
+    """
+    def __init__(self, name:str, profiles:tuple, boundaries:tuple, limits:tuple, length:tuple, fcc:dict, pb:dict, pa:dict):
+        self.name = name
+        self.profiles = profiles
+        self.boundaries = boundaries
+        self.limits = limits
+        self.selection = tuple((profile, *curve) for profile, curve in zip(profiles, boundaries))
+        self.length = length
+        self.catalog = {profile: _LengthIndex.from_rows(length, profile) for profile in dict.fromkeys((*profiles, *(line['profile'] for line in length)))}
+        self.fcc = fcc
+        self.pb = pb
+        self.pa = pa
+        self.basic = {profile: _BasicIndex(pb[profile]['diameter'], pb[profile]['rpm'], pb[profile]['power_b']) for profile in profiles}
+        self.additional = {profile: _AdditionalIndex(pa[profile]['gr_low'], pa[profile]['gr_high'], pa[profile]['rpm'], pa[profile]['power_a']) for profile in profiles}
+        self._grids = {}
+
+
+    def grid(self, profile:str):
+        """Bilinear basic power grid of the profile, compiled on first use."""
+        try:
+            return self._grids[profile]
+        except KeyError:
+            columns = self.pb[profile]
+            grid = self._grids[profile] = _BasicGrid(columns['diameter'], columns['rpm'], columns['power_b'])
+            return grid
+
+
+def _columns(data, schema:str, name:str):
+    """Columns of a table, from columns or rows, as lists with the numbers as floats, validated against the schema."""
+    kinds = tables.schemas[schema]
+    try:
+        if not isinstance(data, dict):  # rows as dicts
+            data = {column: [line[column] for line in data] for column, _ in kinds}
+        columns = {column: [float(value) for value in data[column]] if kind == 'd' else [str(value) for value in data[column]] for column, kind in kinds}
+    except KeyError as error:
+        raise ValueError(f'{name} misses the column {error}') from None
+    tables.validate(columns, kinds, name)
+    return columns
+
+
+def _load(name:str):
+    """Columns of a table of the data directory or the added catalogs."""
+    try:
+        return tables.load(name)
+    except KeyError:
+        raise _NotValidError(f'There is no table {name}, add its catalog with vbelts.tables.add_catalog.') from None
+
+
+def register(name:str, profiles:tuple, boundaries:tuple, limits:tuple, length=None, fcc=None, pb:dict=None, pa:dict=None):
+    r"""Register a v-belt model, compiling its tables, and replace the model of the same name if there is one.
+
+    Parameters
+    ----------
+    name : str
+        Model of the v-belt, [-]
+    profiles : tuple
+        Profiles, from the one for the highest speeds to the one for the lowest, [-]
+    boundaries : tuple
+        For each profile but the last, the coefficients a, b, c and upper of its lowest rpm, a * est_power + b below `upper` hp and c from it on, [-]
+    limits : tuple
+        Lowest rpm, highest rpm, lowest and highest estimated power of the model, [-]
+    length : dict or sequence, optional
+        Columns or rows of the commercial lengths, profile, length and type, by default the table <name>_length, [-]
+    fcc : dict or sequence, optional
+        Columns or rows of the length correction factors, type and fcc, by default the table <name>_fcc, [-]
+    pb : dict, optional
+        Columns or rows of the basic power table of each profile, by default the tables <name>_<profile>_pb, [-]
+    pa : dict, optional
+        Columns or rows of the additional power table of each profile, by default the tables <name>_<profile>_pa, [-]
+
+    Returns
+    -------
+    model : BeltModel
+        The registered model, [-]
+    """
+    profiles = tuple(profiles)
+    if not profiles or len(boundaries) != len(profiles) - 1:
+        raise ValueError(f'{name} needs a boundary for each profile but the last')
+    boundaries = tuple(tuple(float(value) for value in curve) for curve in boundaries)
+    if any(len(curve) != 4 for curve in boundaries):
+        raise ValueError(f'{name} boundaries need the a, b, c and upper coefficients')
+    limits = tuple(float(value) for value in limits)
+    if len(limits) != 4:
+        raise ValueError(f'{name} limits need the lowest and highest rpm and estimated power')
+    length = _columns(_load(f'{name}_length') if length is None else length, 'length', f'{name}_length')
+    length = tuple({'profile': profile, 'length': value, 'type': b_type} for profile, value, b_type in zip(length['profile'], length['length'], length['type']))
+    fcc = _columns(_load(f'{name}_fcc') if fcc is None else fcc, 'fcc', f'{name}_fcc')
+    pb = {profile: _columns(_load(f'{name}_{profile}_pb') if pb is None else pb[profile], 'pb', f'{name}_{profile}_pb') for profile in profiles}
+    pa = {profile: _columns(_load(f'{name}_{profile}_pa') if pa is None else pa[profile], 'pa', f'{name}_{profile}_pa') for profile in profiles}
+    model = _models[name] = BeltModel(name, profiles, boundaries, limits, length, dict(zip(fcc['type'], fcc['fcc'])), pb, pa)
+    return model
+
+
+def _hipower():
+    from vbelts import length, power
+    # profile boundaries of the CLASSICAL v-belt selection chart, see vbelts.belt.HiPower
+    return register('HiPower', ('a', 'b', 'c', 'd'), ((74.1950272674027, 47.215442190042, 3322, 50.7),
+                                                      (19.3889694765281, 32.2532889843209, 2151.4, 122.3),
+                                                      (4.94622293507244, 19.7301462298106, 1335.9, 277.35)),
+                    (100, 5000, 1, 500), length.HiPower_length, power.hipower_fcc)
+
+
+def _superhc():
+    from vbelts import length, power
+    # profile boundaries of the WEDGE v-belt selection chart, see vbelts.belt.SuperHC
+    return register('SuperHC', ('3v', '5v', '8v'), ((40.6961726224751, 11.8866879052094, 3316.25, 91),
+                                                    (4.30114168431602, 3.84423100031302, 1332.74, 309)),
+                    (100, 5000, 1, 1000), length.SuperHC_length, power.superhc_fcc)
+
+
+_builtin = {'HiPower': _hipower, 'SuperHC': _superhc}
+
+
+def get(name:str):
+    r"""Registered v-belt model, raising _NotValidError when there is none of the name.
+
+    Parameters
+    ----------
+    name : str
+        Model of the v-belt, [-]
+
+    Returns
+    -------
+    model : BeltModel
+        The model with its compiled indexes, [-]
+    """
+    try:
+        return _models[name]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable
+        raise _NotValidError(f'The value {name} is not a valid v-belt model.') from None
+    if name in _builtin:
+        return _builtin[name]()
+    raise _NotValidError(f'The value {name} is not a valid v-belt model.')
+
+
+def names():
+    """Names of the built-in and registered v-belt models."""
+    return list(dict.fromkeys([*_builtin, *_models]))
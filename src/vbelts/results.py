@@ -0,0 +1,199 @@
+"""Compact result records of the belt sizing, for keeping large result sets in memory.
+
+:class:`BeltResult` holds only the outputs of a :class:`vbelts.length.PulleyBelt` and a
+:class:`vbelts.power.TransPower`, without their inputs and injected helpers. :class:`ResultSet` stores many of
+them by column, the numbers in contiguous float arrays and the profiles and types as codes of their distinct values,
+so a result takes about 64 bytes and the columns convert to NumPy arrays without copying.
+
+Examples
+--------
+>>> result = vbelts.results.size(130, 240, 'HiPower', 'a', 2, 1750)
+>>> result.vbelt_type, result.belt_qty
+('A-47', 0.4466847965997988)
+>>> results = vbelts.results.size_many([(130, 240, 'HiPower', 'a', 2, 1750), (140, 294, 'HiPower', 'b', 12, 1150)])
+>>> results.to_numpy()['belt_qty']
+array([0.4466848 , 2.76055506])
+"""
+from array import array
+from typing import NamedTuple
+
+from vbelts import length, power
+from vbelts.util import _numpy
+
+
+class BeltResult(NamedTuple):
+    r"""Result of the sizing of a belt.
+
+    Attributes
+    ----------
+    vbelt_profile : str
+        Profile of the v-belt, [-]
+    vbelt_type : str
+        Selected v-belt type, [-]
+    l_corr : float
+        V-Belt corrected length, [mm]
+    c_corr : float
+        Pulley corrected center distance, [mm]
+    p_basic : float
+        Basic power transmitted by belt, [hp]
+    p_add : float
+        Additional power transmitted by belt, [hp]
+    fcc : float
+        Length correction factor, [-]
+    fcac : float
+        Contact arc correction factor, [-]
+    belt_qty : float
+        Calculated quantity of v-belts, [-]
+    """
+    vbelt_profile: str
+    vbelt_type: str
+    l_corr: float
+    c_corr: float
+    p_basic: float
+    p_add: float
+    fcc: float
+    fcac: float
+    belt_qty: float
+
+
+    @classmethod
+    def from_objects(cls, distance:length.PulleyBelt, trans_power:power.TransPower):
+        """Result of the PulleyBelt and TransPower of a drive, keeping none of their references."""
+        return cls(distance.b_profile, distance.b_type, float(distance.l_corr), distance.c_c(), trans_power._p_basic, trans_power._p_add,
+                   trans_power._fcc, trans_power._fcac, trans_power.belt_qty())
+
+
+_text_fields = ('vbelt_profile', 'vbelt_type')
+_float_fields = BeltResult._fields[2:]
+
+
+class ResultSet():
+    r"""ResultSet class stores belt results by column, a float array for each number and codes for the profiles and types.
+
+    Parameters
+    ----------
+    results : iterable, optional
+        BeltResult or tuples of its fields to add, [-]
+
+    Examples
+    --------
+    >>> results = vbelts.results.ResultSet()
+    >>> results.append(vbelts.results.size(130, 240, 'HiPower', 'a', 2, 1750))
+    >>> results[0].vbelt_type
+    'A-47'
+    """
+    __slots__ = ('columns', 'codes', 'values', '_index')
+
+    def __init__(self, results=()):
+        self.columns = {field: array('d') for field in _float_fields}
+        self.codes = {field: array('I') for field in _text_fields}
+        self.values = {field: [] for field in _text_fields}  # distinct values of the text columns, by code
+        self._index = {field: {} for field in _text_fields}
+        self.extend(results)
+
+
+    def append(self, result:BeltResult):
+        """Add a result."""
+        for field, value in zip(_float_fields, result[2:]):  # first, they raise BufferError while exported to numpy
+            self.columns[field].append(value)
+        for field, value in zip(_text_fields, result[:2]):
+            index = self._index[field]
+            try:
+                code = index[value]
+            except KeyError:
+                code = index[value] = len(index)
+                self.values[field].append(value)
+            self.codes[field].append(code)
+
+
+    def extend(self, results):
+        """Add the results of an iterable."""
+        for result in results:
+            self.append(result)
+
+
+    def __len__(self):
+        return len(self.columns['belt_qty'])
+
+
+    def __getitem__(self, i:int):
+        """BeltResult of a position."""
+        return BeltResult(*(self.values[field][self.codes[field][i]] for field in _text_fields), *(self.columns[field][i] for field in _float_fields))
+
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+    def nbytes(self):
+        """Bytes of the columns and the distinct text values, [B]"""
+        return sum(column.itemsize * len(column) for column in (*self.columns.values(), *self.codes.values())) + sum(
+            len(value) + 49 for values in self.values.values() for value in values)
+
+
+    def to_numpy(self):
+        r"""Columns as NumPy arrays.
+
+        Returns
+        -------
+        columns : dict
+            Array of each field, the float arrays share the memory of the set and the text arrays are built from the codes, [-]
+
+        Notes
+        -----
+        Requires numpy. The float arrays are read only views, adding results raises BufferError while they exist.
+        """
+        np = _numpy()
+        columns = {}
+        for field in _text_fields:
+            columns[field] = np.array(self.values[field], dtype=str)[np.frombuffer(self.codes[field], dtype=np.uintc)]
+        for field in _float_fields:
+            view = np.frombuffer(self.columns[field], dtype=np.float64)
+            view.flags.writeable = False
+            columns[field] = view
+        return {field: columns[field] for field in BeltResult._fields}
+
+
+def size(min_diam:float, maj_diam:float, vbelt_model:str, vbelt_profile:str, est_power:float, rpm:float):
+    r"""Size the belt of a drive, returning only the outputs.
+
+    Parameters
+    ----------
+    min_diam : float
+        Smallest pulley, [mm]
+    maj_diam : float
+        Largest pulley, [mm]
+    vbelt_model : str
+        Model of the v-belt, [-]
+    vbelt_profile : str
+        Profile of the v-belt, [-]
+    est_power : float
+        Estimated power, [hp]
+    rpm : float
+        Fastest axle rotation speed, [rpm]
+
+    Returns
+    -------
+    result : BeltResult
+        Type, lengths, powers, factors and quantity of the belt, [-]
+    """
+    distance = length.PulleyBelt(min_diam, maj_diam, vbelt_model, vbelt_profile)
+    trans_power = power.TransPower(vbelt_model, vbelt_profile, distance.b_type, est_power, maj_diam / min_diam, distance.l_corr, min_diam, maj_diam, rpm)
+    return BeltResult.from_objects(distance, trans_power)
+
+
+def size_many(drives):
+    r"""Size the belts of many drives into a ResultSet.
+
+    Parameters
+    ----------
+    drives : iterable
+        Tuples of the :func:`size` parameters min_diam, maj_diam, vbelt_model, vbelt_profile, est_power and rpm, [-]
+
+    Returns
+    -------
+    results : ResultSet
+        Result of each drive, in order, [-]
+    """
+    return ResultSet(size(*drive) for drive in drives)
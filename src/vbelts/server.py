@@ -0,0 +1,318 @@
+"""Local HTTP/JSON sizing service, run with ``python -m vbelts serve``.
+
+The service runs on asyncio with no external dependencies. Each endpoint takes a JSON object by POST and
+answers a JSON object:
+
+=========== ============================================================================================ ===========================================
+endpoint    request fields                                                                               response fields
+=========== ============================================================================================ ===========================================
+/profile    vbelt_model, est_power, rpm                                                                  vbelt_profile
+/length     min_diam, maj_diam, vbelt_model, vbelt_profile                                               l_corr, vbelt_type, c_corr
+/belts      vbelt_model, vbelt_profile, vbelt_type, est_power, gear_ratio, belt_length_corr, min_diam,   belt_qty
+            maj_diam, rpm
+=========== ============================================================================================ ===========================================
+
+``GET /stats`` answers the requests and batches of each endpoint. A calculation error or a result out of JSON, as
+an infinite quantity of belts, answers 422, a malformed request 400 and a body over the size limit 413, all as
+``{"error": ...}``. The connection is closed after a malformed request or a body over the limit.
+
+The requests arriving to an endpoint within the batching window are calculated together, when numpy is installed
+the profiles by :func:`vbelts.belt.select_profiles`, the lengths by :func:`vbelts.length.l_c_batch` and the belt
+quantities by :func:`vbelts.power.belt_qty_batch`, the rows they leave out of range calculated one by one for
+their error. A few milliseconds of latency buy a much higher throughput when many clients call at once.
+"""
+import asyncio
+import json
+import math
+
+from vbelts import belt, length, power, registry
+from vbelts.util import _NotValidError
+
+_reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Content Too Large', 422: 'Unprocessable Entity'}
+
+
+class _BadRequest(Exception):
+    """Raised when the request is malformed"""
+    pass
+
+
+class _Batcher():
+    """Batcher class collects the requests of an endpoint and calculates them together.
+
+    Parameters
+    ----------
+    compute : callable
+        Function of the list of request parameters returning the list of results, an exception for each failed row, [-]
+    window : float
+        Time the first request of a batch waits for others, [s]
+    max_batch : int
+        Requests that flush the batch before the window ends, [-]
+    """
+    def __init__(self, compute, window:float, max_batch:int):
+        self.compute = compute
+        self.window = window
+        self.max_batch = max_batch
+        self.pending = []
+        self.handle = None
+        self.requests = 0
+        self.batches = 0
+
+
+    async def submit(self, params:tuple):
+        """Result of the request parameters, once its batch is calculated."""
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((params, future))
+        if len(self.pending) >= self.max_batch:
+            self._flush()
+        elif self.handle is None:
+            self.handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await future
+
+
+    def _flush(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        self.requests += len(batch)
+        self.batches += 1
+        try:
+            results = self.compute([params for params, _ in batch])
+        except Exception as error:  # a bug in the batch path fails its requests, not the server
+            results = [error] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():  # the client went away
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_vector_min = 32  # below it the fixed cost of the numpy path is higher than the calculations row by row
+
+
+def _profile_rows(rows:list):
+    profiles = [None] * len(rows)
+    if len(rows) >= _vector_min:
+        positions = {}
+        for i, (vbelt_model, _, _) in enumerate(rows):
+            positions.setdefault(vbelt_model, []).append(i)
+        try:
+            for vbelt_model, model_rows in positions.items():
+                try:
+                    model_profiles = registry.get(vbelt_model).profiles
+                except _NotValidError:
+                    continue
+                codes, out_of_range = belt.select_profiles(vbelt_model, [rows[i][1] for i in model_rows], [rows[i][2] for i in model_rows])
+                for i, code, out in zip(model_rows, codes.tolist(), out_of_range.tolist()):
+                    if not out:
+                        profiles[i] = model_profiles[code]
+        except ImportError:
+            pass
+    results = []
+    for row, profile in zip(rows, profiles):
+        if profile is None:  # row by row, or to get the error of the row
+            try:
+                profile = belt.Registered(*row).profile
+            except Exception as error:
+                results.append(error)
+                continue
+        results.append({'vbelt_profile': profile})
+    return results
+
+
+def _length_rows(rows:list):
+    sized = [None] * len(rows)
+    if len(rows) >= _vector_min:
+        try:
+            min_diam, maj_diam, vbelt_model, vbelt_profile = zip(*rows)
+            l_corr, b_type = length.l_c_batch(min_diam, maj_diam, vbelt_model, vbelt_profile)
+            c_corr = length.corrected_center_distance(min_diam, maj_diam, l_corr)
+            sized = [None if math.isnan(c) else {'l_corr': l, 'vbelt_type': t, 'c_corr': c} for l, t, c in zip(l_corr.tolist(), b_type.tolist(), c_corr.tolist())]
+        except ImportError:
+            pass
+    done = {}  # the same pulleys are often sized by many work orders
+    results = []
+    for row, result in zip(rows, sized):
+        if result is None:  # row by row, or to get the error of the row
+            if row not in done:
+                try:
+                    distance = length.PulleyBelt(*row)
+                    done[row] = {'l_corr': distance.l_corr, 'vbelt_type': distance.b_type, 'c_corr': distance.c_c()}
+                except Exception as error:
+                    done[row] = error
+            result = done[row]
+        results.append(result)
+    return results
+
+
+def _belt_rows(rows:list):
+    b_qty = [math.nan] * len(rows)
+    if len(rows) >= _vector_min:
+        try:
+            b_qty = power.belt_qty_batch(*zip(*rows)).tolist()
+        except ImportError:
+            pass
+    results = []
+    for row, value in zip(rows, b_qty):
+        if math.isnan(value):  # row by row, or to get the error of the row
+            try:
+                value = power.TransPower(*row).belt_qty()
+            except Exception as error:
+                results.append(error)
+                continue
+        results.append({'belt_qty': value})
+    return results
+
+
+endpoints = {
+    '/profile': (('vbelt_model', 'est_power', 'rpm'), _profile_rows),
+    '/length': (('min_diam', 'maj_diam', 'vbelt_model', 'vbelt_profile'), _length_rows),
+    '/belts': (('vbelt_model', 'vbelt_profile', 'vbelt_type', 'est_power', 'gear_ratio', 'belt_length_corr', 'min_diam', 'maj_diam', 'rpm'), _belt_rows),
+}
+
+_text_fields = ('vbelt_model', 'vbelt_profile', 'vbelt_type')
+
+
+def _params(body:bytes, fields:tuple):
+    """Parameters of a request body in the order of the fields."""
+    try:
+        data = json.loads(body)
+        return tuple(str(data[field]) if field in _text_fields else float(data[field]) for field in fields)
+    except KeyError as error:
+        raise _BadRequest(f'missing field {error}') from None
+    except (ValueError, TypeError) as error:
+        raise _BadRequest(str(error)) from None
+
+
+async def _head(reader:asyncio.StreamReader, request_line:bytes):
+    """Method, path, version, headers and body size of a request, raising _BadRequest when it is malformed."""
+    try:
+        method, path, version = request_line.decode('latin-1').rstrip('\r\n').split(' ')
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, colon, value = line.decode('latin-1').partition(':')
+            if not colon:
+                raise ValueError(f'header line without a colon {line!r}')
+            headers[name.strip().lower()] = value.strip()
+        size = int(headers.get('content-length', 0))
+    except ValueError as error:  # also a line over the limit of the reader
+        raise _BadRequest(f'malformed request, {error}') from None
+    if size < 0:
+        raise _BadRequest('negative content length')
+    return method, path, version, headers, size
+
+
+async def _answer(writer:asyncio.StreamWriter, status:int, answer:dict, close:bool):
+    """Write the JSON answer of a request, 422 when it has a value out of JSON, as nan or infinity."""
+    try:
+        content = json.dumps(answer, allow_nan=False).encode()
+    except ValueError as error:
+        status, content = 422, json.dumps({'error': f'{type(error).__name__}: {error}'}).encode()
+    writer.write(f'HTTP/1.1 {status} {_reasons[status]}\r\nContent-Type: application/json\r\nContent-Length: {len(content)}\r\n'
+                 f'Connection: {"close" if close else "keep-alive"}\r\n\r\n'.encode() + content)
+    await writer.drain()
+
+
+class Server():
+    r"""Server class holds the batchers of the endpoints and answers the HTTP connections.
+
+    Parameters
+    ----------
+    window : float
+        Time the first request of a batch waits for others, [s]
+    max_batch : int
+        Requests that flush a batch before the window ends, [-]
+    max_body : int
+        Largest request body, a larger one answers 413, [bytes]
+
+    Examples
+    --------
+    >>> server = vbelts.server.Server(window=0.002)
+    >>> asyncio.run(server.serve('127.0.0.1', 8080))  # runs until cancelled
+    """
+    def __init__(self, window:float=0.002, max_batch:int=1024, max_body:int=65536):
+        self.max_body = max_body
+        self.batchers = {path: _Batcher(compute, window, max_batch) for path, (_, compute) in endpoints.items()}
+
+
+    def stats(self):
+        """Requests and batches of each endpoint."""
+        return {path: {'requests': batcher.requests, 'batches': batcher.batches} for path, batcher in self.batchers.items()}
+
+
+    async def respond(self, method:str, path:str, body:bytes):
+        """Status and JSON answer of a request."""
+        if path == '/stats':
+            return 200, self.stats()
+        if path not in endpoints:
+            return 404, {'error': f'unknown path {path}'}
+        if method != 'POST':
+            return 405, {'error': 'use POST'}
+        try:
+            result = await self.batchers[path].submit(_params(body, endpoints[path][0]))
+        except _BadRequest as error:
+            return 400, {'error': str(error)}
+        except Exception as error:
+            return 422, {'error': f'{type(error).__name__}: {error}'}
+        return 200, result
+
+
+    async def handle(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter):
+        """Answer the requests of a connection, kept alive until the client closes it or sends a malformed request."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version, headers, size = await _head(reader, request_line)
+                except _BadRequest as error:  # the next request cannot be found, so the connection is closed
+                    await _answer(writer, 400, {'error': str(error)}, True)
+                    break
+                if size > self.max_body:  # the body is not read, so the connection is closed
+                    await _answer(writer, 413, {'error': f'the body is over {self.max_body} bytes'}, True)
+                    break
+                status, answer = await self.respond(method, path, await reader.readexactly(size))
+                close = headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0'
+                await _answer(writer, status, answer, close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # the client went away
+        finally:
+            writer.close()
+
+
+    async def serve(self, host:str='127.0.0.1', port:int=8080):
+        """Accept connections until cancelled."""
+        async with await asyncio.start_server(self.handle, host, port) as server:
+            await server.serve_forever()
+
+
+def serve(host:str='127.0.0.1', port:int=8080, window:float=0.002, max_batch:int=1024, max_body:int=65536):
+    r"""Run the sizing service until interrupted.
+
+    Parameters
+    ----------
+    host : str
+        Address to listen on, [-]
+    port : int
+        Port to listen on, [-]
+    window : float
+        Time the first request of a batch waits for others, [s]
+    max_batch : int
+        Requests that flush a batch before the window ends, [-]
+    max_body : int
+        Largest request body, a larger one answers 413, [bytes]
+    """
+    try:
+        asyncio.run(Server(window, max_batch, max_body).serve(host, port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,220 @@
+"""Design-space sweep ranking every feasible v-belt profile, pulley diameter and belt length of a drive."""
+import os
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from math import ceil
+
+from vbelts import length, power, pulley, registry
+from vbelts.design import DriveDesign
+from vbelts.util import _OutOfRangeError
+
+
+class _Limits():
+    """Limits class holds the ranges of the tables of a v-belt model and profile, used to prune the candidates before calculating them.
+
+    Parameters
+    ----------
+    vbelt_model : str
+        Model of the v-belt, [-]
+    vbelt_profile : str
+        Profile of the v-belt, [-]
+    """
+    def __init__(self, vbelt_model:str, vbelt_profile:str):
+        model = registry.get(vbelt_model)
+        self.index_pb = model.basic[vbelt_profile]
+        self.index_pa = model.additional[vbelt_profile]
+        self.fcc = model.fcc
+        self.index_length = model.catalog[vbelt_profile]
+        # highest rpm rated from each diameter on, the basic power lookup continues on the larger diameters
+        rpm = self.index_pb.rpm
+        starts = self.index_pb.starts
+        self.rpm_pb = [max(rpm[starts[group]:]) for group in range(len(self.index_pb.diams))]
+        self.h_max = max(length.h_factor)
+        self.fcac_max = power._fcac_index().factor[-1]
+
+
+    def feasible(self, min_diam:float, maj_diam:float, gear_ratio:float, rpm:float):
+        """Check every table range of the candidate, returning False for those that TransPower or PulleyBelt would reject."""
+        index_pb, index_pa = self.index_pb, self.index_pa
+        # basic power
+        group = bisect_left(index_pb.diams, min_diam)
+        if group == len(index_pb.diams) or rpm > self.rpm_pb[group]:
+            return False
+        temp_result, adjust = index_pb.lookup(min_diam, rpm)
+        if adjust and not 0.3 < temp_result <= 120:
+            return False
+        # additional power, within a gear ratio band and its rpm rows
+        band = bisect_right(index_pa.lows, gear_ratio) - 1
+        if band < 0 or not gear_ratio < index_pa.highs[band]:
+            return False
+        rpm_low = index_pa.rpm[0] if band == 0 else 0  # below the first row of a band it interpolates from the previous band
+        if not rpm_low <= rpm <= index_pa.rpm[index_pa.starts[band + 1] - 1]:
+            return False
+        # belt length
+        dist = length._Dist(min_diam, maj_diam)
+        try:
+            l_corr, b_type = self.index_length.lookup(dist.l_uncorr)
+        except _OutOfRangeError:
+            return False
+        if b_type not in self.fcc:
+            return False
+        l_adj = l_corr - 1.57 * (maj_diam + min_diam)
+        return 0 < l_adj and (maj_diam - min_diam) / l_adj <= self.h_max and (maj_diam - min_diam) / l_corr <= self.fcac_max
+
+
+def _evaluate(candidates:list):
+    """Calculate the feasible candidates of a chunk, returning the drive position and the design of each one."""
+    limits = {}
+    results = []
+    for drive, est_power, rpm_input, rpm_output, vbelt_model, vbelt_profile, min_diam, maj_diam in candidates:
+        if (vbelt_model, vbelt_profile) not in limits:
+            limits[(vbelt_model, vbelt_profile)] = _Limits(vbelt_model, vbelt_profile)
+        gear_ratio = maj_diam / min_diam
+        rpm_fastest = max(rpm_input, rpm_output)
+        if not limits[(vbelt_model, vbelt_profile)].feasible(min_diam, maj_diam, gear_ratio, rpm_fastest):
+            continue
+        rpm_out = rpm_input / gear_ratio
+        if rpm_input < rpm_output:
+            gear_ratio, rpm_out = 1 / gear_ratio, rpm_input * gear_ratio
+        distance = length.PulleyBelt(min_diam, maj_diam, vbelt_model, vbelt_profile)
+        c_corr = distance.c_c()
+        belt_qty = power.TransPower(vbelt_model, vbelt_profile, distance.b_type, est_power, gear_ratio, distance.l_corr, min_diam, maj_diam, rpm_fastest).belt_qty()
+        results.append((drive, DriveDesign(est_power, vbelt_model, vbelt_profile, distance.b_type, min_diam, maj_diam, gear_ratio, rpm_out, distance.l_corr, c_corr, belt_qty, ceil(belt_qty))))
+    return results
+
+
+def _chunks(iterable, size:int):
+    """Generator of the lists of `size` items of an iterable, the last one shorter."""
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _evaluated(chunks, processes:int):
+    """Generator of the evaluated chunks in order, with at most two chunks per worker in flight."""
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_evaluate, chunk))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def candidates(drives, vbelt_models:tuple=None, step:float=None, series:list=None):
+    r"""Enumerate the candidates of the drives, before pruning.
+
+    Parameters
+    ----------
+    drives : iterable
+        Tuples of estimated power, input rpm and output rpm of each drive, [-]
+    vbelt_models : tuple, optional
+        Models of the v-belt to sweep, by default all of vbelts.registry, [-]
+    step : float, optional
+        Step between the smallest pulley diameters, by default the rated diameters of each profile, [mm]
+    series : list, optional
+        Sorted commercial diameters of the largest pulley, by default the multiples of 10 mm, [mm]
+
+    Returns
+    -------
+    candidates : generator
+        Tuples of drive position, estimated power, input rpm, output rpm, model, profile, smallest and largest pulley diameters, [-]
+    """
+    diameters = {}
+    for vbelt_model in registry.names() if vbelt_models is None else vbelt_models:
+        model = registry.get(vbelt_model)
+        for vbelt_profile in model.profiles:
+            diams = model.basic[vbelt_profile].diams
+            if step is None:
+                diameters[(vbelt_model, vbelt_profile)] = list(diams)
+            else:
+                diameters[(vbelt_model, vbelt_profile)] = [diams[0] + i * step for i in range(int((diams[-1] - diams[0]) / step) + 1)]
+    for drive, (est_power, rpm_input, rpm_output) in enumerate(drives):
+        ratio = rpm_input / rpm_output if rpm_input >= rpm_output else rpm_output / rpm_input
+        for (vbelt_model, vbelt_profile), diams in diameters.items():
+            for min_diam in diams:
+                yield (drive, est_power, rpm_input, rpm_output, vbelt_model, vbelt_profile, min_diam, pulley._snap(min_diam * ratio, series))
+
+
+def sweep_many(drives, vbelt_models:tuple=None, step:float=None, series:list=None, processes:int=None, chunksize:int=2048):
+    r"""Rank every feasible design of many drives, fanning the candidates across a process pool.
+
+    Parameters
+    ----------
+    drives : iterable
+        Tuples of estimated power, input rpm and output rpm of each drive, [-]
+    vbelt_models : tuple, optional
+        Models of the v-belt to sweep, by default all of vbelts.registry, [-]
+    step : float, optional
+        Step between the smallest pulley diameters, by default the rated diameters of each profile, [mm]
+    series : list, optional
+        Sorted commercial diameters of the largest pulley, by default the multiples of 10 mm, [mm]
+    processes : int, optional
+        Worker processes, by default the number of cores, 1 calculates in the calling process, [-]
+    chunksize : int
+        Candidates sent to a worker at once, [-]
+
+    Returns
+    -------
+    results : list
+        For each drive, the list of its feasible DriveDesign ranked by belts and then by center distance, [-]
+
+    Notes
+    -----
+    The candidates are enumerated as the workers take them, so at most two chunks per worker are held at once
+    besides the feasible designs.
+    """
+    drives = list(drives)
+    chunks = _chunks(candidates(drives, vbelt_models, step, series), chunksize)
+    processes = processes or os.cpu_count() or 1
+    head = list(islice(chunks, 2))  # a single chunk is calculated in the calling process
+    if processes == 1 or len(head) == 1:
+        evaluated = map(_evaluate, chain(head, chunks))
+    else:
+        evaluated = _evaluated(chain(head, chunks), processes)
+    results = [[] for _ in drives]
+    for chunk in evaluated:
+        for drive, result in chunk:
+            results[drive].append(result)
+    for ranked in results:
+        ranked.sort(key=lambda result: (result.belts, result.c_corr))
+    return results
+
+
+def sweep(est_power:float, rpm_input:float, rpm_output:float, vbelt_models:tuple=None, step:float=None, series:list=None, processes:int=1):
+    r"""Rank every feasible profile, pulley diameter and belt length combination of a drive.
+
+    Parameters
+    ----------
+    est_power : float
+        Estimated power, [hp]
+    rpm_input : float
+        Input (driving) axle speed, [rpm]
+    rpm_output : float
+        Desired output (driven) axle speed, [rpm]
+    vbelt_models : tuple, optional
+        Models of the v-belt to sweep, by default all of vbelts.registry, [-]
+    step : float, optional
+        Step between the smallest pulley diameters, by default the rated diameters of each profile, [mm]
+    series : list, optional
+        Sorted commercial diameters of the largest pulley, by default the multiples of 10 mm, [mm]
+    processes : int
+        Worker processes, [-]
+
+    Returns
+    -------
+    results : list
+        Feasible DriveDesign ranked by belts and then by center distance, [-]
+
+    Examples
+    --------
+    >>> best = vbelts.sweep.sweep(6.5, 1750, 900)[0]
+    >>> best.vbelt_type, best.min_diam, best.belts
+    ('B-55', 150.0, 1)
+    """
+    return sweep_many([(est_power, rpm_input, rpm_output)], vbelt_models, step, series, processes)[0]
@@ -0,0 +1,321 @@
+"""Rating tables and catalogs stored as compact columnar binary files.
+
+The shipped tables are in the package data directory, catalogs of other manufacturers can be compiled from CSV
+with ``python -m vbelts compile`` and added with :func:`add_catalog`. Each table is memory-mapped on first access
+and kept for the rest of the process, its numeric columns are read in place, so the worker processes of a machine
+share the same pages.
+
+The file layout, little endian, is:
+
+====== ========================================================================
+magic  4 bytes, ``VBT1``
+nrows  uint32, number of rows
+ncols  uint16, number of columns
+header for each column: uint8 name length, ascii name, the 1 byte kind code ``d`` (float64) or ``s`` (text)
+       and for text an uint8 width
+pad    zeros up to a multiple of 8 bytes
+data   for each column, nrows contiguous values, the text padded with zeros to the width, and zeros up to a
+       multiple of 8 bytes
+====== ========================================================================
+"""
+import csv
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+data_dir = os.path.join(os.path.dirname(__file__), 'data')
+extension = '.vbt'
+catalog_dirs = [data_dir]
+
+_MAGIC = b'VBT1'
+_loaded = {}
+
+# columns and kinds of each kind of table, by the suffix of its name
+schemas = {
+    'pb': (('diameter', 'd'), ('rpm', 'd'), ('power_b', 'd')),
+    'pa': (('gr_low', 'd'), ('gr_high', 'd'), ('rpm', 'd'), ('power_a', 'd')),
+    'fcc': (('type', 's'), ('fcc', 'd')),
+    'length': (('profile', 's'), ('length', 'd'), ('type', 's')),
+}
+
+
+class _TextColumn():
+    """TextColumn class reads the values of a text column of a table on access.
+
+    Parameters
+    ----------
+    buffer : memoryview
+        Bytes of the column, [-]
+    width : int
+        Bytes of each value, [-]
+    """
+    def __init__(self, buffer:memoryview, width:int):
+        self.buffer = buffer
+        self.width = width
+
+
+    def __len__(self):
+        return len(self.buffer) // self.width
+
+
+    def __getitem__(self, i:int):
+        if not -len(self) <= i < len(self):
+            raise IndexError('text column index out of range')
+        i %= len(self)
+        return bytes(self.buffer[i * self.width:(i + 1) * self.width]).rstrip(b'\0').decode('utf-8')
+
+
+    def tolist(self):
+        return [self[i] for i in range(len(self))]
+
+
+def write(path:str, columns:dict):
+    r"""Write columns to a table file, the columns of str values as text and the others as floats.
+
+    Parameters
+    ----------
+    path : str
+        Path of the table file, [-]
+    columns : dict
+        Column name and the sequence of its values, all with the same length, [-]
+    """
+    nrows = len(next(iter(columns.values())))
+    header = bytearray(_MAGIC + struct.pack('<IH', nrows, len(columns)))
+    data = []
+    for name, values in columns.items():
+        if len(values) != nrows:
+            raise ValueError(f'Column {name} has {len(values)} rows, expected {nrows}')
+        header += struct.pack('<B', len(name)) + name.encode('ascii')
+        if nrows and all(isinstance(value, str) for value in values):
+            encoded = [value.encode('utf-8') for value in values]
+            width = max(1, *(len(value) for value in encoded))
+            if width > 255:
+                raise ValueError(f'Column {name} has values longer than 255 bytes')
+            header += b's' + struct.pack('<B', width)
+            content = b''.join(value.ljust(width, b'\0') for value in encoded)
+        else:
+            header += b'd'
+            values = array('d', (float(value) for value in values))
+            if sys.byteorder == 'big':
+                values.byteswap()
+            content = values.tobytes()
+        data.append(content + bytes(-len(content) % 8))
+    header += bytes(-len(header) % 8)
+    with open(path, 'wb') as table_file:
+        table_file.write(header)
+        table_file.writelines(data)
+
+
+def _parse(buffer, path:str, copy:bool):
+    """Columns of the bytes of a table file, views of the buffer or copies."""
+    if buffer[:4] != _MAGIC:
+        raise ValueError(f'{path} is not a vbelts table file')
+    nrows, ncols = struct.unpack_from('<IH', buffer, 4)
+    offset = 10
+    header = []
+    for _ in range(ncols):
+        size = buffer[offset]
+        name = bytes(buffer[offset + 1:offset + 1 + size]).decode('ascii')
+        kind = bytes(buffer[offset + 1 + size:offset + 2 + size])
+        offset += size + 2
+        if kind == b'd':
+            width = 8
+        elif kind == b's':
+            width = buffer[offset]
+            offset += 1
+        else:
+            raise ValueError(f'{path} has a column of unknown kind')
+        header.append((name, kind, width))
+    offset += -offset % 8
+    view = memoryview(buffer)
+    columns = {}
+    for name, kind, width in header:
+        end = offset + width * nrows
+        if end > len(buffer):
+            raise ValueError(f'{path} is truncated')
+        if kind == b's':
+            columns[name] = _TextColumn(view[offset:end], width)
+            if copy:
+                columns[name] = columns[name].tolist()
+        elif copy or sys.byteorder == 'big':
+            values = array('d')
+            values.frombytes(view[offset:end])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            columns[name] = values
+        else:
+            columns[name] = view[offset:end].cast('d')  # zero-copy
+        offset = end + (-end % 8)
+    return columns
+
+
+def read(path:str):
+    r"""Read the columns of a table file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the table file, [-]
+
+    Returns
+    -------
+    columns : dict
+        Column name and its values, an array of floats or a list of str, in file order, [-]
+    """
+    with open(path, 'rb') as table_file:
+        content = table_file.read()
+    return _parse(content, path, copy=True)
+
+
+def open_mapped(path:str):
+    r"""Memory-map a table file, without copying its columns.
+
+    Parameters
+    ----------
+    path : str
+        Path of the table file, [-]
+
+    Returns
+    -------
+    columns : dict
+        Column name and its values, a memoryview of floats or a sequence of str, [-]
+    """
+    with open(path, 'rb') as table_file:
+        if not os.fstat(table_file.fileno()).st_size:
+            raise ValueError(f'{path} is not a vbelts table file')
+        buffer = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)  # stays valid after the file is closed
+    return _parse(buffer, path, copy=False)
+
+
+def schema_of(name:str):
+    """Schema of a table from the suffix of its name, None when it has no known suffix."""
+    return schemas.get(name.rsplit('_', 1)[-1])
+
+
+def validate(columns:dict, schema:tuple, name:str='table'):
+    r"""Check the columns, kinds, values and order of a table, raising ValueError for the first problem found.
+
+    Parameters
+    ----------
+    columns : dict
+        Column name and its values, [-]
+    schema : tuple
+        Pairs of column name and kind, ``d`` or ``s``, as the values of `schemas`, [-]
+    name : str
+        Table name for the messages, [-]
+    """
+    if [column for column, _ in schema] != list(columns):
+        raise ValueError(f'{name} has the columns {list(columns)}, expected {[column for column, _ in schema]}')
+    nrows = len(next(iter(columns.values())))
+    if not nrows:
+        raise ValueError(f'{name} has no rows')
+    for column, kind in schema:
+        values = columns[column]
+        if kind == 's':
+            if not all(isinstance(value, str) and value for value in values):
+                raise ValueError(f'{name} column {column} has to be text without empty values')
+        elif not all(isinstance(value, float) and math.isfinite(value) and value >= 0 for value in values):
+            raise ValueError(f'{name} column {column} has to be finite numbers, not negative')
+    names = [column for column, _ in schema]
+    # the lookups bisect the rows, grouped by the first column and sorted by rpm in each group
+    if names in (['diameter', 'rpm', 'power_b'], ['gr_low', 'gr_high', 'rpm', 'power_a']):
+        group, rpm = columns[names[0]], columns['rpm']
+        for i in range(1, nrows):
+            if group[i] < group[i - 1]:
+                raise ValueError(f'{name} column {names[0]} is not sorted at row {i}')
+            if group[i] == group[i - 1] and rpm[i] < rpm[i - 1]:
+                raise ValueError(f'{name} column rpm is not sorted at row {i}')
+    if names[:2] == ['gr_low', 'gr_high'] and not all(high > low for low, high in zip(columns['gr_low'], columns['gr_high'])):
+        raise ValueError(f'{name} has a gear ratio band with gr_high not above gr_low')
+    if names == ['type', 'fcc'] and len(set(columns['type'])) != nrows:
+        raise ValueError(f'{name} has repeated types')
+
+
+def compile_csv(csv_path:str, path:str, schema:str):
+    r"""Compile a CSV catalog into a table file, after validating it.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path of the CSV file, with a header row of the column names, [-]
+    path : str
+        Path of the table file to write, [-]
+    schema : str
+        Kind of the table, a key of `schemas` as ``pb`` or ``fcc``, [-]
+
+    Examples
+    --------
+    >>> vbelts.tables.compile_csv('acme_a_pb.csv', 'catalogs/Acme_a_pb.vbt', 'pb')
+    """
+    kinds = schemas[schema]
+    with open(csv_path, newline='', encoding='utf-8') as csv_file:
+        reader = csv.DictReader(csv_file)
+        missing = [column for column, _ in kinds if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f'{csv_path} misses the columns {missing}')
+        columns = {column: [] for column, _ in kinds}
+        for line_number, line in enumerate(reader, 2):
+            for column, kind in kinds:
+                try:
+                    columns[column].append(line[column].strip() if kind == 's' else float(line[column]))
+                except (TypeError, ValueError):
+                    raise ValueError(f'{csv_path} line {line_number} has an invalid {column}: {line[column]!r}') from None
+    validate(columns, kinds, csv_path)
+    write(path, columns)
+
+
+def add_catalog(directory:str):
+    """Add a directory of table files, searched before the ones already added, so its tables take precedence.
+
+    Add the catalogs before the first calculation, the indexes built from a table are kept for the process.
+    """
+    catalog_dirs.insert(0, os.fspath(directory))
+    _loaded.clear()
+
+
+def names():
+    """Names of the tables in the data directory and the added catalogs."""
+    return sorted({filename[:-len(extension)] for directory in catalog_dirs if os.path.isdir(directory)
+                   for filename in os.listdir(directory) if filename.endswith(extension)})
+
+
+def load(name:str):
+    r"""Columns of a table, memory-mapped on first access and validated against the schema of its name suffix.
+
+    Parameters
+    ----------
+    name : str
+        Table name, as `HiPower_a_pb`, [-]
+
+    Returns
+    -------
+    columns : dict
+        Column name and its values, a memoryview of floats or a sequence of str, [-]
+    """
+    try:
+        return _loaded[name]
+    except KeyError:
+        pass
+    for directory in catalog_dirs:
+        path = os.path.join(directory, f'{name}{extension}')
+        if os.path.isfile(path):
+            break
+    else:
+        raise KeyError(name)
+    columns = open_mapped(path)
+    schema = schema_of(name)
+    if schema is not None:
+        validate(columns, schema, path)
+    _loaded[name] = columns
+    return columns
+
+
+def rows(name:str):
+    """Rows of a table as a tuple of dicts with string values, the form of the tables before the data files."""
+    columns = load(name)
+    text = {column: [value if isinstance(value, str) else repr(value)[:-2] if repr(value).endswith('.0') else repr(value) for value in values]
+            for column, values in columns.items()}
+    return tuple(dict(zip(text, line)) for line in zip(*text.values()))
@@ -1,8 +1,9 @@
-import csv
-import os
 import re
+from bisect import bisect_left, bisect_right
 from abc import ABC, abstractmethod
 
+from vbelts import instrument, tables
+
 mach_group_data = [
     ['stirrer', '1'],
     ['small blower', '1'],
@@ -94,9 +95,46 @@ class _Interpolate():
         x : float
             Interpolated output data point
         """
+        if instrument._tally is not None:
+            instrument._tally[1] += 1
         return self.y_max-((self.x_max - self.x_data)/(self.x_max - self.x_min))*(self.y_max - self.y_min)
 
 
+def _numpy():
+    """Import numpy on demand, it is only needed by the vectorized functions."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('The vectorized functions need numpy, install it with: pip install vbelts[numpy]') from None
+    return numpy
+
+
+def _ranked_arrays(groups:list, starts:list, rpm:list, power:list, carry:bool):
+    """Numpy columns of a grouped rating table and a dense table of the first row matching each group and rpm rank.
+
+    The rank of a query rpm in the distinct rpm values keeps the comparisons exact, so the row found for a
+    group and a rank is the first row of the group with an rpm at or above the query. With carry, a group
+    without such a row continues on the next groups, otherwise the row is past the end of the table.
+    """
+    np = _numpy()
+    rpm_values = sorted(set(rpm))
+    row_rank = [bisect_left(rpm_values, value) for value in rpm]
+    first_row = [[len(rpm)] * (len(rpm_values) + 1) for _ in range(len(groups) + 1)]  # the extra group is past the table
+    for group in reversed(range(len(groups))):
+        for rank in range(len(rpm_values) + 1):
+            i = bisect_left(row_rank, rank, starts[group], starts[group + 1])
+            if i < starts[group + 1]:
+                first_row[group][rank] = i
+            elif carry:
+                first_row[group][rank] = first_row[group + 1][rank]
+    return (np.asarray(groups, dtype=float), np.asarray(rpm, dtype=float), np.asarray(power, dtype=float), np.asarray(rpm_values, dtype=float), np.asarray(first_row))
+
+
+def _interpolate_array(x_data, x_min, x_max, y_min, y_max):
+    """Vectorized form of _Interpolate.y_data, with the same operation order."""
+    return y_max-((x_max - x_data)/(x_max - x_min))*(y_max - y_min)
+
+
 class _MinDist():
     """MinDist class selects the nearest data value from a point in between.
 
@@ -141,7 +179,12 @@ class _ReIterate():
 
 
     def read(self, dict_master_list):
+        tally = instrument._tally
+        if tally is None:
+            yield from dict_master_list
+            return
         for line in dict_master_list:
+            tally[0] += 1  # rows scanned by the running stage
             yield line
 
     def three_rows(self, dict_list, param_1, param_2):
@@ -213,6 +256,432 @@ class _ReIterate():
             last_type = line['type']
         raise _OutOfRangeError('Value out of range for these')
 
+class _BasicIndex():
+    """BasicIndex class compiles a basic power table into sorted numeric columns searched by bisection.
+
+    The lookup returns the same values as `_ReIterate.three_rows`, without parsing or scanning the rows before the match.
+
+    Parameters
+    ----------
+    diameter : list
+        Pulley diameter column in table order, [mm]
+    rpm : list
+        Rotational speed column in table order, [rpm]
+    power_b : list
+        Basic power column in table order, [hp]
+    """
+    def __init__(self, diameter:list, rpm:list, power_b:list, interpol:_Interpolate=_Interpolate):
+        self.diameter = diameter
+        self.rpm = rpm
+        self.power_b = power_b
+        self.interpol = interpol
+        # distinct diameters and the position where each one starts in the table
+        self.diams = []
+        self.starts = []
+        for i, diam in enumerate(diameter):
+            if not self.diams or diam != self.diams[-1]:
+                self.diams.append(diam)
+                self.starts.append(i)
+        self.starts.append(len(diameter))
+
+
+    @classmethod
+    def from_rows(cls, dict_list, interpol:_Interpolate=_Interpolate):
+        """Compile a tuple of rows with the diameter, rpm and power_b keys."""
+        return cls([float(line['diameter']) for line in dict_list],
+                   [float(line['rpm']) for line in dict_list],
+                   [float(line['power_b']) for line in dict_list], interpol)
+
+
+    def lookup(self, param_1:float, param_2:float):
+        """Basic power for a diameter and rpm, _Interpolated or not, and if it needs adjusting."""
+        if param_1 != param_1 or param_2 != param_2:  # nan never matches a row
+            raise _OutOfRangeError('Value out of range for these parameters')
+        group = bisect_left(self.diams, param_1)
+        while group < len(self.diams):
+            end = self.starts[group + 1]
+            i = bisect_left(self.rpm, param_2, self.starts[group], end)
+            if i < end:
+                break
+            group += 1
+        else:
+            raise _OutOfRangeError('Value out of range for these parameters')
+        if instrument._tally is not None:
+            instrument.count(rows=len(self.diams).bit_length() + (end - self.starts[group]).bit_length())  # bisection probes
+        adjust = self.diams[group] != param_1
+        if self.rpm[i] == param_2:
+            return (self.power_b[i], adjust)
+        last_row_1, last_row_2 = (self.rpm[i - 1], self.power_b[i - 1]) if i else (0, 0)
+        return (self.interpol(param_2, last_row_1, self.rpm[i], last_row_2, self.power_b[i]).y_data(), adjust)
+
+
+    def arrays(self):
+        """Numpy arrays of the compiled columns, created on first use."""
+        try:
+            return self._arrays
+        except AttributeError:
+            np = _numpy()
+            row_group = np.repeat(np.arange(len(self.diams)), np.diff(self.starts))
+            self._arrays = _ranked_arrays(self.diams, self.starts, self.rpm, self.power_b, carry=True) + (row_group,)
+            return self._arrays
+
+
+    def lookup_array(self, param_1, param_2):
+        """Vectorized lookup over arrays of diameters and rpm.
+
+        Returns
+        -------
+        result : tuple
+            Basic power array, with nan where the lookup is out of range, and the adjusting array, [-]
+        """
+        np = _numpy()
+        diams, rpm, power_b, rpm_values, first_row, row_group = self.arrays()
+        param_1, param_2 = np.broadcast_arrays(np.asarray(param_1, dtype=float), np.asarray(param_2, dtype=float))
+        # rpm above the last row of a diameter continues on the next diameter, as the scan does
+        i = first_row[np.searchsorted(diams, param_1, 'left'), np.searchsorted(rpm_values, param_2, 'left')]
+        valid = (i < len(rpm)) & ~np.isnan(param_1) & ~np.isnan(param_2)
+        safe = np.where(valid, i, 0)
+        adjust = valid & (diams[row_group[safe]] != param_1)
+        exact = rpm[safe] == param_2
+        prev = np.maximum(safe - 1, 0)
+        last_row_1 = np.where(safe > 0, rpm[prev], 0)
+        last_row_2 = np.where(safe > 0, power_b[prev], 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.where(exact, power_b[safe], _interpolate_array(param_2, last_row_1, rpm[safe], last_row_2, power_b[safe]))
+        result = np.where(valid & np.isfinite(result), result, np.nan)
+        return (result, adjust)
+
+
+class _BasicGrid():
+    """BasicGrid class compiles a basic power table into a dense grid over the diameter and rpm, interpolated bilinearly.
+
+    Each diameter row of the grid holds the basic power at every rpm of the table, linearly interpolated along the
+    rows of that diameter from zero power at zero rpm, and nan above its last rpm. Between two diameters the power
+    is interpolated instead of taken from the larger one and reduced by a fixed amount, as `_BasicIndex` does.
+
+    Parameters
+    ----------
+    diameter : list
+        Pulley diameter column in table order, [mm]
+    rpm : list
+        Rotational speed column in table order, [rpm]
+    power_b : list
+        Basic power column in table order, [hp]
+    """
+    def __init__(self, diameter:list, rpm:list, power_b:list):
+        index = _BasicIndex(diameter, rpm, power_b)
+        self.diams = index.diams
+        self.rpms = sorted(set(rpm) | {0.0})
+        self.grid = []
+        for group in range(len(self.diams)):
+            # the first row of each rpm, as the exact lookup of the table
+            points = {0.0: 0.0}
+            for i in range(index.starts[group], index.starts[group + 1]):
+                points.setdefault(rpm[i], power_b[i])
+            xs = sorted(points)
+            row = []
+            for x_data in self.rpms:
+                k = bisect_left(xs, x_data)
+                if k == len(xs):
+                    row.append(float('nan'))
+                elif xs[k] == x_data:
+                    row.append(points[x_data])
+                else:
+                    row.append(_Interpolate(x_data, xs[k - 1], xs[k], points[xs[k - 1]], points[xs[k]]).y_data())
+            self.grid.append(row)
+
+
+    @staticmethod
+    def _cell(axis:list, value:float):
+        """Cell of the axis holding the value and the fraction of the value across it."""
+        i = min(max(bisect_right(axis, value) - 1, 0), len(axis) - 2)
+        return i, (value - axis[i]) / (axis[i + 1] - axis[i])
+
+
+    @staticmethod
+    def _lerp(y_min:float, y_max:float, fraction:float):
+        """Linear interpolation, exact on the nodes so a nan neighbour does not spread."""
+        if fraction == 0:
+            return y_min
+        if fraction == 1:
+            return y_max
+        return y_min + (y_max - y_min) * fraction
+
+
+    def lookup(self, param_1:float, param_2:float):
+        """Basic power for a diameter and rpm, interpolated bilinearly."""
+        i, t = self._cell(self.diams, param_1)
+        j, u = self._cell(self.rpms, param_2)
+        if instrument._tally is not None:
+            instrument.count(rows=len(self.diams).bit_length() + len(self.rpms).bit_length(), interpolations=1)
+        if not (0 <= t <= 1 and 0 <= u <= 1):  # also false for nan
+            raise _OutOfRangeError('Value out of range for these parameters')
+        result = self._lerp(self._lerp(self.grid[i][j], self.grid[i][j + 1], u), self._lerp(self.grid[i + 1][j], self.grid[i + 1][j + 1], u), t)
+        if result != result:
+            raise _OutOfRangeError('Value out of range for these parameters')
+        return result
+
+
+    def arrays(self):
+        """Numpy arrays of the axes and the grid, created on first use."""
+        try:
+            return self._arrays
+        except AttributeError:
+            np = _numpy()
+            self._arrays = (np.asarray(self.diams, dtype=float), np.asarray(self.rpms, dtype=float), np.asarray(self.grid, dtype=float))
+            return self._arrays
+
+
+    def lookup_array(self, param_1, param_2):
+        """Vectorized lookup over arrays of diameters and rpm, with nan where the lookup is out of range."""
+        np = _numpy()
+        diams, rpms, grid = self.arrays()
+        param_1, param_2 = np.broadcast_arrays(np.asarray(param_1, dtype=float), np.asarray(param_2, dtype=float))
+        i = np.clip(np.searchsorted(diams, param_1, 'right') - 1, 0, len(diams) - 2)
+        j = np.clip(np.searchsorted(rpms, param_2, 'right') - 1, 0, len(rpms) - 2)
+        t = (param_1 - diams[i]) / (diams[i + 1] - diams[i])
+        u = (param_2 - rpms[j]) / (rpms[j + 1] - rpms[j])
+
+        def lerp(y_min, y_max, fraction):
+            with np.errstate(invalid='ignore'):
+                return np.where(fraction == 0, y_min, np.where(fraction == 1, y_max, y_min + (y_max - y_min) * fraction))
+
+        result = lerp(lerp(grid[i, j], grid[i, j + 1], u), lerp(grid[i + 1, j], grid[i + 1, j + 1], u), t)
+        return np.where((t >= 0) & (t <= 1) & (u >= 0) & (u <= 1), result, np.nan)
+
+
+class _AdditionalIndex():
+    """AdditionalIndex class compiles an additional power table into sorted numeric columns searched by bisection.
+
+    The lookup returns the same values as `_ReIterate.four_rows`, without parsing or scanning the rows before the match.
+
+    Parameters
+    ----------
+    gr_low : list
+        Lower gear ratio limit column in table order, [-]
+    gr_high : list
+        Upper gear ratio limit column in table order, [-]
+    rpm : list
+        Rotational speed column in table order, [rpm]
+    power_a : list
+        Additional power column in table order, [hp]
+    """
+    def __init__(self, gr_low:list, gr_high:list, rpm:list, power_a:list, interpol:_Interpolate=_Interpolate):
+        self.gr_low = gr_low
+        self.gr_high = gr_high
+        self.rpm = rpm
+        self.power_a = power_a
+        self.interpol = interpol
+        # distinct gear ratio bands and the position where each one starts in the table
+        self.lows = []
+        self.highs = []
+        self.starts = []
+        for i, low in enumerate(gr_low):
+            if not self.lows or low != self.lows[-1]:
+                self.lows.append(low)
+                self.highs.append(gr_high[i])
+                self.starts.append(i)
+        self.starts.append(len(gr_low))
+
+
+    @classmethod
+    def from_rows(cls, dict_list, interpol:_Interpolate=_Interpolate):
+        """Compile a tuple of rows with the gr_low, gr_high, rpm and power_a keys."""
+        return cls([float(line['gr_low']) for line in dict_list],
+                   [float(line['gr_high']) for line in dict_list],
+                   [float(line['rpm']) for line in dict_list],
+                   [float(line['power_a']) for line in dict_list], interpol)
+
+
+    def lookup(self, param_1:float, param_2:float):
+        """Additional power for a gear ratio and rpm, _Interpolated or not."""
+        if param_2 != param_2:  # nan never matches a row
+            raise _OutOfRangeError('Value out of range for these parameters')
+        band = bisect_right(self.lows, param_1) - 1
+        # below the first band or in a gap after the band, where the next band starts above the gear ratio
+        if band < 0 or not param_1 < self.highs[band]:
+            raise _OutOfRangeError('Value out of range for these parameters')
+        end = self.starts[band + 1]
+        i = bisect_left(self.rpm, param_2, self.starts[band], end)
+        if instrument._tally is not None:
+            instrument.count(rows=len(self.lows).bit_length() + (end - self.starts[band]).bit_length())  # bisection probes
+        if i == end or (i == 0 and self.rpm[i] != param_2):
+            raise _OutOfRangeError('Value out of range for these parameters')
+        if self.rpm[i] == param_2:
+            return self.power_a[i]
+        return self.interpol(param_2, self.rpm[i - 1], self.rpm[i], self.power_a[i - 1], self.power_a[i]).y_data()
+
+
+    def arrays(self):
+        """Numpy arrays of the compiled columns, created on first use."""
+        try:
+            return self._arrays
+        except AttributeError:
+            np = _numpy()
+            self._arrays = (np.asarray(self.highs, dtype=float),) + _ranked_arrays(self.lows, self.starts, self.rpm, self.power_a, carry=False)
+            return self._arrays
+
+
+    def lookup_array(self, param_1, param_2):
+        """Vectorized lookup over arrays of gear ratios and rpm.
+
+        Returns
+        -------
+        power_a : numpy.ndarray
+            Additional power, with nan where the lookup is out of range, [hp]
+        """
+        np = _numpy()
+        highs, lows, rpm, power_a, rpm_values, first_row = self.arrays()
+        param_1, param_2 = np.broadcast_arrays(np.asarray(param_1, dtype=float), np.asarray(param_2, dtype=float))
+        band = np.searchsorted(lows, param_1, 'right') - 1
+        # below the first band or in a gap after the band the scan meets a band starting above the gear ratio
+        valid = (band >= 0) & (param_1 < highs[band]) & ~np.isnan(param_2)
+        i = first_row[np.where(valid, band, -1), np.searchsorted(rpm_values, param_2, 'left')]
+        valid &= i < len(rpm)
+        safe = np.where(valid, i, 0)
+        exact = rpm[safe] == param_2
+        valid &= exact | (safe > 0)
+        prev = np.maximum(safe - 1, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.where(exact, power_a[safe], _interpolate_array(param_2, rpm[prev], rpm[safe], power_a[prev], power_a[safe]))
+        return np.where(valid & np.isfinite(result), result, np.nan)
+
+
+class _ChooseIndex():
+    """ChooseIndex class compiles a factor table of one input column for bisection lookups.
+
+    The lookup returns the same values as `_ReIterate.three_rows_choose`.
+
+    Parameters
+    ----------
+    factor : list
+        Sorted input column, [-]
+    value : list
+        Chosen output column, [-]
+    """
+    def __init__(self, factor:list, value:list, interpol:_Interpolate=_Interpolate):
+        self.factor = factor
+        self.value = value
+        self.interpol = interpol
+
+
+    @classmethod
+    def from_rows(cls, dict_list, w_column:str, interpol:_Interpolate=_Interpolate):
+        """Compile a tuple of rows with the factor key and the chosen column."""
+        return cls([float(line['factor']) for line in dict_list], [float(line[w_column]) for line in dict_list], interpol)
+
+
+    def lookup(self, param:float):
+        """Chosen column value for the factor, _Interpolated or not."""
+        i = bisect_left(self.factor, param)
+        if instrument._tally is not None:
+            instrument.count(rows=len(self.factor).bit_length())  # bisection probes
+        if i == len(self.factor) or param != param:
+            raise _OutOfRangeError('Value out of range for these parameters')
+        if self.factor[i] == param:
+            return self.value[i]
+        last_row_1, last_row_chosed = (self.factor[i - 1], self.value[i - 1]) if i else (0, 0)
+        return self.interpol(param, last_row_1, self.factor[i], last_row_chosed, self.value[i]).y_data()
+
+
+    def arrays(self):
+        """Numpy arrays of the factor and value columns, created on first use."""
+        try:
+            return self._arrays
+        except AttributeError:
+            np = _numpy()
+            self._arrays = (np.asarray(self.factor, dtype=float), np.asarray(self.value, dtype=float))
+            return self._arrays
+
+
+    def lookup_array(self, param):
+        """Vectorized lookup over an array of factors, with nan where it is out of range."""
+        np = _numpy()
+        factor, value = self.arrays()
+        param = np.asarray(param, dtype=float)
+        i = np.searchsorted(factor, param, 'left')
+        valid = (i < len(factor)) & ~np.isnan(param)
+        safe = np.where(valid, i, 0)
+        last_row_1 = np.where(safe > 0, factor[safe - 1], 0)
+        last_row_chosed = np.where(safe > 0, value[safe - 1], 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.where(factor[safe] == param, value[safe], _interpolate_array(param, last_row_1, factor[safe], last_row_chosed, value[safe]))
+        return np.where(valid & np.isfinite(result), result, np.nan)
+
+
+class _LengthIndex():
+    """LengthIndex class compiles the commercial lengths of a profile into a sorted length column and a type column searched by bisection.
+
+    The lookup returns the commercial length of `_ReIterate.belt_type`, the first length not below the uncorrected
+    one, and raises _OutOfRangeError where the scan would pick no belt, past the longest length or when the next
+    length is more than twice the uncorrected one.
+
+    It is not the nearest length. The scan resets the previous length to zero on every row of the profile, so
+    `_MinDist` only weighs the next length against zero, and the results of :class:`vbelts.length.PulleyBelt`, of
+    the designs and of the tests are the ones of the first length not below. Picking the nearest one, the previous
+    length when it is closer, would change about half of them, so the index keeps the results of the scan.
+
+    Parameters
+    ----------
+    length : list
+        Commercial lengths in ascending order, [mm]
+    b_type : list
+        V-belt type of each length, [-]
+    """
+    def __init__(self, length:list, b_type:list):
+        self.length = length
+        self.b_type = b_type
+
+
+    @classmethod
+    def from_rows(cls, dict_list, profile:str):
+        """Compile the rows of a profile with the profile, length and type keys, each one only when longer than the previous kept row, as the scan reaches no other."""
+        length, b_type = [], []
+        for line in dict_list:
+            if line['profile'] == profile and (not length or float(line['length']) > length[-1]):
+                length.append(float(line['length']))
+                b_type.append(line['type'])
+        return cls(length, b_type)
+
+
+    def lookup(self, param:float):
+        """Commercial length and type for an uncorrected length, the first length not below it as the scan, not the nearest one."""
+        i = bisect_left(self.length, param)
+        if instrument._tally is not None:
+            instrument.count(rows=len(self.length).bit_length())  # bisection probes
+        if i == len(self.length) or not 0 < param or self.length[i] > 2 * param:
+            raise _OutOfRangeError('Value out of range for these')
+        return (self.length[i], self.b_type[i])
+
+
+    def arrays(self):
+        """Numpy arrays of the length and type columns, created on first use."""
+        try:
+            return self._arrays
+        except AttributeError:
+            np = _numpy()
+            self._arrays = (np.asarray(self.length, dtype=float), np.asarray(self.b_type, dtype=str))
+            return self._arrays
+
+
+    def lookup_array(self, param):
+        """Vectorized lookup over an array of uncorrected lengths.
+
+        Returns
+        -------
+        result : tuple
+            Commercial length array, with nan where the lookup is out of range, and the type array, empty there, [-]
+        """
+        np = _numpy()
+        length, b_type = self.arrays()
+        param = np.asarray(param, dtype=float)
+        i = np.searchsorted(length, param, 'left')
+        valid = (i < len(length)) & (param > 0)
+        safe = np.where(valid, i, 0)
+        valid &= length[safe] <= 2 * param
+        return (np.where(valid, length[safe], np.nan), np.where(valid, b_type[safe], ''))
+
+
 class _CSV(ABC):
     """Abstract class for handling csv files"""
     @abstractmethod
@@ -220,14 +689,14 @@ class _CSV(ABC):
 
 
 class _Iterate(_CSV):
-    """Iterate class is responsible for iterating through the multiple csv files in the package.
+    """Iterate class is responsible for iterating through the rows of the tables of the package and of the added catalogs, see vbelts.tables.
     
     Parameters
     ----------
     filename : str
-        Filename of the csv file without the extension, [-]
+        Name of the table, [-]
     row : str
-        Rows of data of the csv file, [-]
+        Columns of data of the table, [-]
     """
     def __init__(self, filename:str, *row:str, interpol:_Interpolate=_Interpolate, m_dist:_MinDist=_MinDist):
         self.filename = filename
@@ -236,19 +705,16 @@ class _Iterate(_CSV):
         self.m_dist = m_dist
 
     def read(self):
-        """Read csv data and return a generator function.
+        """Read the table rows and return a generator function.
         
         Returns
         -------
         x : generator
-            Generator data, [-]
+            Generator data, dicts with the numeric values as floats, [-]
         """
-        file_path = os.path.join(os.path.dirname(__file__), 'data', self.filename)  # fetch full path
-        with open(f'{file_path}.csv', mode='r', encoding="utf-8") as csv_file:
-            reader = csv.DictReader(csv_file, quoting=csv.QUOTE_NONNUMERIC)  # not quoted values are floats
-            # next(reader)
-            for line in reader:
-                yield line
+        columns = tables.load(self.filename)  # memory-mapped once per process
+        for line in zip(*columns.values()):
+            yield dict(zip(columns, line))
     
 
     def fcc(self, vbelt_model:str, vbelt_type:str):
@@ -261,6 +727,8 @@ class _Iterate(_CSV):
     def three_rows(self, *param:float):
         """_Iterate through a file with a list of three rows using two parameters and return the last one, _Interpolated or not
         """
+        last_row_1 = 0
+        last_row_2 = 0
         for line in self.read():
             if line[self.row[0]] == param[0]:
                 if line[self.row[1]] == param[1]:
@@ -271,7 +739,7 @@ class _Iterate(_CSV):
                 if line[self.row[1]] == param[1]:
                     return (self.interpol(param[1], last_row_1, line[self.row[1]], last_row_2, line[self.row[2]]).y_data(), True)
                 elif line[self.row[1]] > param[1]:
-                    return (self.interpol(), True)
+                    return (self.interpol(param[1], last_row_1, line[self.row[1]], last_row_2, line[self.row[2]]).y_data(), True)
             last_row_1 = line[self.row[1]]
             last_row_2 = line[self.row[2]]
         raise _OutOfRangeError('Value out of range for these parameters')
@@ -349,22 +817,92 @@ class _Device():
         self.group = self._grp()
     
 
+    @instrument.stage('util.device')
     def _grp(self):
         r"""Classifies the device group based on the name using the self.li_group.
 
         Returns
         -------
         group : int
-            Device group
+            Device group of the first name of the list containing the name, None if no name contains it
         """
-        data_regex = re.compile(r'(\w+).?(\w+)?.?(\w+)?')
-        try:
-            for item in self.li_group:
-                m = data_regex.search(item[0])  # search the first item
-                if self.name in m.group(0):
-                    return int(item[1])
-        except:  # stop the execution if nothing is found
+        if not isinstance(self.name, str):
             raise ValueError
+        return _name_index(self.li_group).get(self.name)
+
+
+_name_regex = re.compile(r'(\w+).?(\w+)?.?(\w+)?')
+_name_indexes = {}
+
+
+def _name_index(li_group:list):
+    """Index of every substring of the device names to the group of the first name containing it, built once per group list."""
+    try:
+        return _name_indexes[id(li_group)][1]
+    except KeyError:
+        pass
+    index = {}
+    for item in li_group:
+        name = _name_regex.search(item[0]).group(0)
+        for start in range(len(name)):
+            for end in range(start, len(name) + 1):
+                index.setdefault(name[start:end], int(item[1]))
+    _name_indexes[id(li_group)] = (li_group, index)  # keeps the list alive, so its id stays unique
+    return index
+
+
+def _classify(names, li_group:list):
+    """Group array and unknown mask of the names."""
+    np = _numpy()
+    index = _name_index(li_group)
+    groups = np.array([index.get(name, 0) if isinstance(name, str) else 0 for name in names], dtype=int)
+    return groups, groups == 0
+
+
+def classify_motors(names):
+    r"""Classify many motor names at once, the batch form of :class:`Motor`.
+
+    Parameters
+    ----------
+    names : iterable
+        Motor names, [-]
+
+    Returns
+    -------
+    groups : numpy.ndarray
+        Motor group of each name, 0 for the unknown names, [-]
+    unknown : numpy.ndarray
+        Boolean mask of the names without a group, [-]
+
+    Examples
+    --------
+    >>> vbelts.util.classify_motors(['multiple cylinders', 'high torque', 'turbine'])
+    (array([1, 2, 0]), array([False, False,  True]))
+    """
+    return _classify(names, drive_group_data)
+
+
+def classify_machines(names):
+    r"""Classify many machine names at once, the batch form of :class:`Machine`.
+
+    Parameters
+    ----------
+    names : iterable
+        Machine names, [-]
+
+    Returns
+    -------
+    groups : numpy.ndarray
+        Machine group of each name, 0 for the unknown names, [-]
+    unknown : numpy.ndarray
+        Boolean mask of the names without a group, [-]
+
+    Examples
+    --------
+    >>> vbelts.util.classify_machines(['reciprocating compressor', 'crane', 'turbine'])
+    (array([3, 4, 0]), array([False, False,  True]))
+    """
+    return _classify(names, mach_group_data)
 
 
 class Motor(_Device):
@@ -442,7 +980,7 @@ class Machine(_Device):
 
 
 class _Belt():
-    """Belt is a blueprint class for the HiPower and SuperHC v-belt classes"""
+    """Belt is a blueprint class for the v-belt model classes"""
     def __init__(self, est_power:float, rpm_fastest:float):
         self.est_power = est_power
         self.rpm_fastest = rpm_fastest
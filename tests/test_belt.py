@@ -29,6 +29,12 @@ def test_hipower_fail():
         eval_hipower(None, 150)
 
 
+def test_hipower_out_of_range():
+    for power, rpm in [(3, 5001), (501, 150), (3, 99), (0.9, 500), (float('nan'), 500)]:
+        with pytest.raises(b._OutOfRangeError):
+            eval_hipower(power, rpm)
+
+
 # SuperHC Class
 
 def eval_superhc(power, rpm):
@@ -51,4 +57,23 @@ def test_superhc_fail():
         eval_superhc(3, 5001)
         eval_superhc(1001, 150)
         eval_superhc(3, 99)
-        eval_superhc(0.9, 500)
\ No newline at end of file
+        eval_superhc(0.9, 500)
+
+# Vectorized selection
+
+def test_select_profiles():
+    np = pytest.importorskip('numpy')
+    rnd = np.random.default_rng(0)
+    for model in ('HiPower', 'SuperHC'):
+        est_power, rpm = rnd.uniform(0, 1100, 2000), rnd.uniform(50, 5100, 2000)
+        codes, out_of_range = b.select_profiles(model, est_power, rpm)
+        profiles = b.registry.get(model).profiles
+        for code, out, power, speed in zip(codes, out_of_range, est_power, rpm):
+            try:
+                profile = b.Registered(model, power, speed).profile
+            except b._OutOfRangeError:
+                assert out and code == -1
+            else:
+                assert not out and profiles[code] == profile
+    codes, out_of_range = b.select_profiles('SuperHC', [4, 30, 150, float('nan')], [1160, 690, 575, 600])
+    assert codes.tolist() == [0, 1, 2, -1] and out_of_range.tolist() == [False, False, False, True]
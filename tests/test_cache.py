@@ -0,0 +1,119 @@
+from vbelts import cache as c
+from vbelts import cli, design, length, power, registry
+from vbelts.util import _NotValidError
+from threading import Thread
+import sqlite3
+import pytest
+
+spec = ('normal torque ac', 'mill', 10, 5, 1750, 900)
+
+
+def acme(fcc):
+    hipower = registry.get('HiPower')
+    return registry.register('Acme', ('a', 'b'), hipower.boundaries[:1], hipower.limits, length.HiPower_length, fcc,
+                             {profile: hipower.pb[profile] for profile in ('a', 'b')}, {profile: hipower.pa[profile] for profile in ('a', 'b')})
+
+
+def eval_design(cache, *args, **kwargs):
+    before = cache.stats()
+    result = cache.design(*args, **kwargs)
+    after = cache.stats()
+    return result, after['hits'] - before['hits'], after['misses'] - before['misses']
+
+
+def test_design(tmp_path):
+    with c.ResultCache(tmp_path / 'results.sqlite') as cache:
+        drive = design.design(*spec, min_diam=100)
+        assert eval_design(cache, *spec, min_diam=100) == (drive, 0, 1)
+        assert eval_design(cache, *spec, min_diam=100) == (drive, 1, 0)
+        assert eval_design(cache, 'normal torque ac', 'mill', 10.0, 5.0, 1750, 900, 'HiPower', 100.0) == (drive, 1, 0)  # normalized
+        assert eval_design(cache, *spec)[2] == 1
+        with pytest.raises(_NotValidError):
+            cache.design('steam engine', *spec[1:])
+    with c.ResultCache(tmp_path / 'results.sqlite') as cache:  # persistent
+        assert eval_design(cache, *spec, min_diam=100) == (drive, 1, 0)
+        assert len(cache) == 2
+
+
+def test_fingerprint(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, '_models', {})
+    assert c.fingerprint('HiPower') == c.fingerprint('HiPower') != c.fingerprint('SuperHC')
+    first = acme(power.hipower_fcc)
+    digest = c.fingerprint('Acme')
+    assert acme(power.hipower_fcc) is not first and c.fingerprint('Acme') == digest  # same tables
+    with c.ResultCache(tmp_path / 'results.sqlite') as cache:
+        cache.design(*spec, 'Acme', 100)
+        acme([dict(line, fcc=1) for line in power.hipower_fcc])  # changed tables
+        assert c.fingerprint('Acme') != digest
+        result, hits, misses = eval_design(cache, *spec, 'Acme', 100)
+        assert (hits, misses) == (0, 1) and result.belt_qty != design.design(*spec, 'HiPower', 100).belt_qty
+        assert cache.stats()['stale'] == 1
+        assert cache.prune() == 1 and len(cache) == 1
+
+
+def test_stale(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, '_models', {})
+    acme(power.hipower_fcc)
+    with c.ResultCache(tmp_path / 'results.sqlite') as cache:
+        cache.design(*spec, 'Acme', 100)
+        cache.design(*spec, 'HiPower', 100)
+        monkeypatch.setattr(registry, '_models', {})  # Acme registered by another process only
+        assert cache.stats()['stale'] == 0
+        assert cache.prune() == 0 and len(cache) == 2
+
+
+def test_version(tmp_path):
+    path = tmp_path / 'results.sqlite'
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute('CREATE TABLE results (key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, value TEXT NOT NULL, accessed REAL NOT NULL)')
+        connection.execute("INSERT INTO results VALUES ('key', 'fingerprint', '[]', 0)")
+    connection.close()
+    with c.ResultCache(path) as cache:  # emptied, the entries of another version are never read
+        assert len(cache) == 0
+        cache.put('key', 'HiPower', c.fingerprint('HiPower'), [1])
+        cache.put('key', 'HiPower', c.fingerprint('HiPower'), [2])  # updated, still one entry
+        assert len(cache) == 1 and cache.get('key') == [2]
+    with c.ResultCache(path) as cache:
+        assert len(cache) == 1
+
+
+def test_eviction(tmp_path):
+    with c.ResultCache(tmp_path / 'results.sqlite', max_entries=2) as cache:
+        for engine_power in (5, 6, 7):
+            cache.design('normal torque ac', 'mill', 10, engine_power, 1750, 900)
+        assert len(cache) == 2 and cache.stats()['evictions'] == 1
+        assert eval_design(cache, 'normal torque ac', 'mill', 10, 7, 1750, 900)[1:] == (1, 0)
+        assert eval_design(cache, 'normal torque ac', 'mill', 10, 5, 1750, 900)[1:] == (0, 1)  # the least recently used
+        assert cache.prune(max_entries=1) == 1 and len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0 and cache.stats()['misses'] == 0
+    with pytest.raises(ValueError):
+        c.ResultCache(tmp_path / 'results.sqlite', max_entries=0)
+
+
+def test_threads(tmp_path):
+    with c.ResultCache(tmp_path / 'results.sqlite') as cache:
+        other = c.ResultCache(tmp_path / 'results.sqlite')  # another reader of the file
+        def work():
+            for i in range(50):
+                (cache, other)[i % 2].design('normal torque ac', 'mill', 10, 5 + i % 10, 1750, 900)
+        threads = [Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(cache) == 10
+        assert cache.stats()['hits'] + other.stats()['hits'] + cache.stats()['misses'] + other.stats()['misses'] == 200
+        other.close()
+
+
+def test_cli(tmp_path, capsys):
+    path = str(tmp_path / 'results.sqlite')
+    source, target = tmp_path / 'specs.csv', tmp_path / 'results.csv'
+    source.write_text('motor,machine,hours_service,engine_power,rpm_input,rpm_output\nnormal torque ac,mill,10,5,1750,900\n')
+    assert cli.main(['batch', str(source), str(target), '--cache', path]) == 0
+    assert cli.main(['cache', 'stats', '--path', path]) == 0
+    assert ': 1 entries, 0 stale' in capsys.readouterr().out
+    assert cli.main(['cache', 'prune', '--path', path, '--max-entries', '0']) == 0
+    assert ': 0 entries' in capsys.readouterr().out
@@ -0,0 +1,62 @@
+from vbelts import cli as c
+import json
+import pytest
+
+specs = ('motor,machine,hours_service,engine_power,rpm_input,rpm_output,min_diam\n'
+         'normal torque ac,mill,10,5,1750,900,100\n'
+         'steam engine,mill,10,5,1750,900,\n'
+         'normal torque ac,mill,30,5,1750,900,\n')
+
+
+def eval_batch(tmp_path, output, *options):
+    source = tmp_path / 'specs.csv'
+    source.write_text(specs)
+    target = tmp_path / output
+    assert c.main(['batch', str(source), str(target), *options]) == 0
+    return target.read_text()
+
+
+def test_batch_csv(tmp_path):
+    lines = eval_batch(tmp_path, 'results.csv', '--chunk-size', '2').splitlines()
+    assert lines[0].endswith('belt_qty,belts,error')
+    assert len(lines) == 4
+    assert ',A-37,190,' in lines[1] and lines[1].endswith(',3,')
+    assert lines[2].endswith('_NotValidError: The name steam engine is not a valid motor.')
+    assert '_OutOfRangeError' in lines[3]
+
+
+def test_batch_jsonl(tmp_path):
+    results = [json.loads(line) for line in eval_batch(tmp_path, 'results.jsonl').splitlines()]
+    assert [result['vbelt_type'] for result in results] == ['A-37', '', '']
+    assert results[0]['error'] == '' and results[1]['motor'] == 'steam engine'
+
+
+def test_batch_columns(tmp_path):
+    source = tmp_path / 'specs.jsonl'
+    source.write_text('{"motor": "normal torque ac", "machine": "mill", "hours_service": 10, "engine_power": 5, "rpm_input": 1750, "rpm_output": 900}\n'
+                      '[1, 2]\n'
+                      '{"motor": "normal torque ac", "machine": "mill", "hours_service": 10, "engine_power": 5, "rpm_input": 1750,\n'
+                      '{"motor": "normal torque ac", "machine": "mill", "hours_service": 10, "engine_power": 5, "rpm_input": 1750, "rpm_output": 900, '
+                      '"min_diam": 100, "vbelt_model": "HiPower", "tag": "x"}\n')
+    target = tmp_path / 'results.csv'
+    assert c.main(['batch', str(source), str(target), '--chunk-size', '1']) == 0
+    lines = target.read_text().splitlines()
+    assert lines[0].startswith('motor,machine,hours_service,engine_power,rpm_input,rpm_output,vbelt_model,min_diam,est_power')
+    assert len(lines) == 5
+    assert lines[2].endswith(',"TypeError: the spec row is a list, not an object"')
+    assert 'JSONDecodeError' in lines[3]
+    assert ',HiPower,100.0,' in lines[4] and lines[4].endswith(',3,')
+
+
+def test_batch_fail(tmp_path):
+    with pytest.raises(SystemExit):
+        c.main(['batch', str(tmp_path / 'specs.csv')])
+    assert next(c.batch([{'motor': 'normal torque ac'}]))[0]['error'] == "missing field 'machine'"
+
+
+def test_compile(tmp_path):
+    source = tmp_path / 'acme.csv'
+    source.write_text('type,fcc\nA-26,0.75\nA-27,0.76\n')
+    assert c.main(['compile', str(source), str(tmp_path / 'Acme_fcc.vbt')]) == 0
+    assert c.main(['compile', str(source), str(tmp_path / 'acme.vbt')]) == 2
+    assert c.main(['compile', str(source), str(tmp_path / 'acme.vbt'), '--schema', 'pb']) == 1
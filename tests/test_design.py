@@ -0,0 +1,39 @@
+from vbelts import design as d
+import pytest
+
+
+def eval_design(motor, machine, h_service, power, rpm_input, rpm_output, b_model='HiPower', min_diam=None):
+    return d.design(motor, machine, h_service, power, rpm_input, rpm_output, b_model, min_diam)
+
+
+def test_design():
+    drive = eval_design('normal torque ac', 'mill', 10, 5, 1750, 900, min_diam=100)
+    assert (drive.vbelt_profile, drive.vbelt_type, drive.maj_diam, drive.l_corr, drive.belts) == ('a', 'A-37', 190, 975, 3)
+    assert drive.c_corr == 255.95352126226672
+    assert eval_design('normal torque ac', 'mill', 10, 5, 900, 1750, min_diam=100).rpm_output == 1710
+    assert eval_design('high torque', 'crusher', 20, 40, 1750, 600, 'SuperHC').vbelt_profile == '5v'
+
+
+def test_design_fail():
+    with pytest.raises(Exception):
+        eval_design('steam engine', 'mill', 10, 5, 1750, 900)
+    with pytest.raises(Exception):
+        eval_design('normal torque ac', 'mill', 10, 5, 1750, 0)
+    with pytest.raises(Exception):
+        eval_design('normal torque ac', 'mill', 10, 5, 1750, 900, 'Other')
+
+
+def test_design_batch():
+    specs = [('normal torque ac', 'mill', 10, 5, 1750, 900), ('high torque', 'crusher', 20, 40, 1750, 600)]
+    assert d.design_batch(specs) == [eval_design(*spec) for spec in specs]
+
+
+def test_design_batch_errors():
+    specs = [('normal torque ac', 'mill', 10, 5, 1750, 900), ('steam engine', 'mill', 10, 5, 1750, 900), ('normal torque ac', 'mill', 10, 5, 1750, 0)]
+    with pytest.raises(Exception):
+        d.design_batch(specs)
+    results = d.design_batch(specs, errors='return')
+    assert results[0] == eval_design(*specs[0])
+    assert all(isinstance(result, Exception) for result in results[1:])
+    with pytest.raises(Exception):
+        d.design_batch(specs, errors='ignore')
@@ -0,0 +1,50 @@
+from vbelts import fleet as f
+from vbelts import length, power, registry
+import pytest
+
+np = pytest.importorskip('numpy')
+
+
+def drives(size):
+    rnd = np.random.default_rng(0)
+    min_diam = rnd.uniform(65, 400, size)
+    vbelt_profile = np.array(['a', 'b', 'c', '3v', '5v'])[rnd.integers(0, 5, size)]
+    vbelt_model = np.where(np.isin(vbelt_profile, ['3v', '5v']), 'SuperHC', 'HiPower')
+    vbelt_model[::50] = 'Acme'
+    return min_diam, min_diam * rnd.uniform(1, 3, size), vbelt_model, vbelt_profile, rnd.uniform(1, 50, size), rnd.uniform(500, 3000, size)
+
+
+def eval_rerate(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm):
+    results = f.rerate([min_diam], [maj_diam], vbelt_model, vbelt_profile, est_power, rpm, processes=1)
+    return results['vbelt_type'][0], results['c_corr'][0], results['belt_qty'][0]
+
+
+def test_rerate():
+    distance = length.PulleyBelt(130, 240, 'HiPower', 'a')
+    belt_qty = power.TransPower('HiPower', 'a', distance.b_type, 2, 240/130, distance.l_corr, 130, 240, 1750).belt_qty()
+    assert eval_rerate(130, 240, 'HiPower', 'a', 2, 1750) == (distance.b_type, distance.c_c(), belt_qty)
+
+
+def test_rerate_processes():
+    columns = drives(1000)
+    single = f.rerate(*columns, processes=1)
+    shared = f.rerate(*columns, processes=2, chunksize=128)  # chunks finish out of order, the rows keep the input order
+    for name in ('l_corr', 'c_corr', 'belt_qty'):
+        assert np.array_equal(single[name], shared[name], equal_nan=True)
+    assert shared['vbelt_type'].tolist() == single['vbelt_type'].tolist()
+    assert (shared['vbelt_type'][::50] == '').all() and np.isnan(shared['belt_qty'][::50]).all()
+
+
+def test_rerate_registered(monkeypatch):
+    monkeypatch.setattr(registry, '_models', dict(registry._models))
+    hipower = registry.get('HiPower')
+    registry.register('Acme', ('a', 'b'), hipower.boundaries[:1], hipower.limits, length.HiPower_length, power.hipower_fcc,
+                      {profile: hipower.pb[profile] for profile in ('a', 'b')}, {profile: hipower.pa[profile] for profile in ('a', 'b')})
+    columns = drives(1000)
+    columns[3][::50] = 'a'
+    single = f.rerate(*columns, processes=1)
+    shared = f.rerate(*columns, processes=2, chunksize=128)  # the workers register Acme as the caller did
+    for name in ('l_corr', 'c_corr', 'belt_qty'):
+        assert np.array_equal(single[name], shared[name], equal_nan=True)
+    assert shared['vbelt_type'].tolist() == single['vbelt_type'].tolist()
+    assert (shared['vbelt_type'][::50] != '').all()
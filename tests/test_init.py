@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import vbelts
+import pytest
+
+STARTUP = '''
+import sys, time, tracemalloc
+tracemalloc.start()
+start = time.perf_counter()
+import vbelts
+print(time.perf_counter() - start, tracemalloc.get_traced_memory()[0], sorted(name for name in sys.modules if name.startswith('vbelts.')))
+'''
+
+
+def test_lazy_submodules():
+    assert vbelts.power.TransPower('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750).belt_qty() == 0.5060451558976288
+    assert vbelts.speed is sys.modules['vbelts.speed'] and vbelts.analysis.tolerance.monte_carlo
+    from vbelts import pulley
+    assert pulley is vbelts.pulley
+    assert {'power', 'speed', 'registry'} <= set(dir(vbelts))
+    with pytest.raises(AttributeError):
+        vbelts.missing
+    namespace = {}
+    exec('from vbelts import *', namespace)
+    assert vbelts.__all__ == list(vbelts._submodules)
+    assert all(namespace[name] is getattr(vbelts, name) for name in vbelts.__all__)
+
+
+def test_startup():
+    for _ in range(2):  # the first run may compile the bytecode
+        stdout = subprocess.run([sys.executable, '-c', STARTUP], capture_output=True, text=True, check=True).stdout
+    seconds, allocated, submodules = stdout.split(' ', 2)
+    assert submodules.strip() == '[]'  # no submodule, so none of the rating data, is loaded
+    assert float(seconds) < 0.05
+    assert int(allocated) < 512 * 1024  # about 1.5 MB when the package imported all the submodules
@@ -0,0 +1,29 @@
+from vbelts import instrument as i
+from vbelts import design, power
+
+
+def test_recording():
+    plain = power.TransPower._basic
+    with i.recording() as recorder:
+        assert power.TransPower._basic is not plain
+        design.design('normal torque ac', 'mill', 10, 5, 1750, 900, min_diam=100)
+    assert power.TransPower._basic is plain
+    stats = recorder.stats
+    assert {'design', 'power.basic', 'power.additional', 'length.belt_type', 'length.h_factor', 'pulley.commercial'} <= set(stats)
+    assert stats['power.fc_arc'] == dict(stats['power.fc_arc'], calls=1, rows=2, interpolations=1)
+    assert stats['design']['rows'] >= stats['length.belt_type']['rows'] > 0  # the inner stages add up
+    assert sum(stats['design']['histogram']) == 1
+    assert recorder.percentile('design', 50) >= stats['design']['seconds'] / 10
+    assert recorder.report().splitlines()[1].startswith('design')
+
+
+def test_hook():
+    calls = []
+    hook = lambda *report: calls.append(report)
+    i.add_hook(hook)
+    try:
+        power.EstPower(2, 1, 1, 4)
+    finally:
+        i.remove_hook(hook)
+    power.EstPower(2, 1, 1, 4)
+    assert [report[0] for report in calls] == ['power.service_factor']
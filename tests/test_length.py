@@ -9,6 +9,31 @@ def eval_pulleybelt_lc(min_diam, max_diam, belt_model, b_profile):
 
 def test_pulleybelt_lc():
     assert eval_pulleybelt_lc(120, 240, 'HiPower', 'a') == (1200, 'A-46')
+    with pytest.raises(l._OutOfRangeError):
+        eval_pulleybelt_lc(1200, 2400, 'HiPower', 'a')  # longer than the longest belt
+    with pytest.raises(l._OutOfRangeError):
+        eval_pulleybelt_lc(120, 240, 'HiPower', '3v')
+
+
+def test_length_index():
+    # the bisection selects the same length as the scan of the rows, for every model and profile
+    for belt_model, length_list in [('HiPower', l.HiPower_length), ('SuperHC', l.SuperHC_length)]:
+        catalog = l.registry.get(belt_model).catalog
+        for b_profile, index in catalog.items():
+            for l_uncorr in [index.length[0] / 1.9, *index.length, *(length + 0.5 for length in index.length[:-1])]:
+                assert index.lookup(l_uncorr) == l._ReIterate().belt_type(length_list, b_profile, l_uncorr)
+    assert 'C-120' not in l.registry.get('HiPower').catalog['c'].b_type
+
+
+def test_l_c_batch():
+    pytest.importorskip('numpy')
+    min_diam, max_diam = [120, 200, 1200, 140], [240, 240, 2400, 294]
+    l_corr, b_type = l.l_c_batch(min_diam, max_diam, 'HiPower', ['a', 'a', 'a', 'b'])
+    for i in (0, 1, 3):
+        assert (l_corr[i], b_type[i]) == eval_pulleybelt_lc(min_diam[i], max_diam[i], 'HiPower', 'ab'[i // 3])
+    assert l_corr[2] != l_corr[2] and b_type[2] == ''
+    l_corr, b_type = l.l_c_batch(120, 240, ['HiPower', 'Acme'], 'a')
+    assert l_corr[0] == 1200 and l_corr[1] != l_corr[1]
 
 # PulleyBelt cc
 
@@ -17,4 +42,41 @@ def eval_pulleybelt_ca(min_diam, max_diam, belt_model, b_profile):
 
 
 def test_pulleybelt_ca():
-    assert eval_pulleybelt_ca(120, 240, 'HiPower', 'a') == 310.72814411208714
\ No newline at end of file
+    assert eval_pulleybelt_ca(120, 240, 'HiPower', 'a') == 311.7289224952741
+    # (D - d)/l_a of 0.1890 between the factors 0.18 and 0.2
+    assert eval_pulleybelt_ca(120, 240, 'HiPower', 'a') == pytest.approx((634.8 - (0.09 + 0.01 * (120 / 634.8 - 0.18) / 0.02) * 120) / 2)
+    assert l._Commercial(100, 200, 100 / 0.2 + 1.57 * 300, 'A-38').c_c() == pytest.approx((500 - 0.1 * 100) / 2)
+    with pytest.raises(l._OutOfRangeError):
+        l._Commercial(100, 600, 1200, 'A-46')  # (D - d)/l_a above the last factor
+
+
+def test_corrected_center_distance():
+    pytest.importorskip('numpy')
+    min_diam, max_diam, l_corr = [120, 120, 200, 100, 240], [240, 240, 450, 600, 120], [1200, 1225, 2000, 1200, 1200]
+    c_corr = l.corrected_center_distance(min_diam, max_diam, l_corr)
+    for i in range(3):
+        assert c_corr[i] == l._Commercial(min_diam[i], max_diam[i], l_corr[i], None).c_c()
+    assert c_corr[3] != c_corr[3] and c_corr[4] != c_corr[4]
+
+
+# Center distance fit
+
+def eval_fit_center(min_diam, max_diam, belt_model, b_profile, center, tolerance):
+    return [(fit.vbelt_type, fit.c_corr) for fit in l.fit_center(min_diam, max_diam, belt_model, b_profile, center, tolerance)]
+
+
+def test_fit_center():
+    assert eval_fit_center(120, 240, 'HiPower', 'a', 311.7289224952741, 0) == [('A-46', 311.7289224952741)]
+    assert eval_fit_center(120, 240, 'HiPower', 'a', 320, 15) == [('A-46', 311.7289224952741), ('A-47', 324.4438011518642)]
+    assert eval_fit_center(120, 240, 'HiPower', 'a', 5000, 10) == []
+    fits = l.fit_center(200, 450, 'HiPower', 'c', 1000, 400)
+    assert [fit.l_corr for fit in fits] == sorted(fit.l_corr for fit in fits) and 'C-120' not in [fit.vbelt_type for fit in fits]
+    assert all(600 <= fit.c_corr <= 1400 for fit in fits)
+    for fit in fits:
+        assert l._Commercial(200, 450, fit.l_corr, fit.vbelt_type).c_c() == fit.c_corr
+
+
+def test_fit_center_batch():
+    results = l.fit_center_batch([(120, 240, 'HiPower', 'a', 320, 15), (120, 240, 'HiPower', 'a', 320, -1), (120, 240, 'Acme', 'a', 320, 15)])
+    assert results[0] == l.fit_center(120, 240, 'HiPower', 'a', 320, 15)
+    assert isinstance(results[1], l._NotValidError) and isinstance(results[2], l._NotValidError)
@@ -0,0 +1,58 @@
+from vbelts import memo as m
+from threading import Thread
+import pytest
+
+
+def test_lrucache():
+    cache = m.LRUCache(2)
+    assert cache.get_or_create('a', lambda: 1) == 1
+    assert cache.get_or_create('b', lambda: 2) == 2
+    assert cache.get_or_create('a', lambda: None) == 1
+    cache.get_or_create('c', lambda: 3)  # evicts b, the least recently used
+    assert cache.get_or_create('b', lambda: 4) == 4
+    assert cache.stats() == {'hits': 1, 'misses': 4, 'evictions': 2, 'size': 2, 'maxsize': 2}
+
+
+def test_lrucache_fifo():
+    cache = m.LRUCache(2, 'fifo')
+    for key in ['a', 'b', 'a', 'c']:
+        cache.get_or_create(key, lambda: key)
+    assert cache.get_or_create('a', lambda: 'new') == 'new'
+    with pytest.raises(ValueError):
+        m.LRUCache(2, 'random')
+
+
+def test_lrucache_negative():
+    with pytest.raises(ValueError):
+        m.LRUCache(-1)
+    cache = m.LRUCache(2)
+    cache.get_or_create('a', lambda: 1)
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+    cache.resize(0)
+    assert cache.stats() == {'hits': 0, 'misses': 1, 'evictions': 1, 'size': 0, 'maxsize': 0}
+
+
+def test_lrucache_threads():
+    cache = m.LRUCache(50)
+    def work():
+        for i in range(1000):
+            cache.get_or_create(i % 100, lambda: i)
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 4000
+    assert stats['size'] == 50
+
+
+def test_memo():
+    m.pulley_belts.clear()
+    assert m.pulley_belt(120, 240, 'HiPower', 'a') is m.pulley_belt(120.0, 240, 'HiPower', 'a')
+    assert m.pulley_belt(120, 240, 'HiPower', 'a').c_c() == 311.7289224952741
+    assert m.trans_power('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750).belt_qty() == 0.5060451558976288
+    assert m.stats()['pulley_belt']['hits'] == 2
+    nan_power = ('HiPower', 'a', 'A-32', float('nan'), 130/240, 850, 130, 240, 1750)
+    assert m.trans_power(*nan_power) is m.trans_power(*nan_power[:3], float('nan'), *nan_power[4:])  # nan != nan
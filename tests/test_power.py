@@ -1,4 +1,5 @@
 from vbelts import power as p
+from vbelts.util import _ReIterate, _OutOfRangeError, _NotValidError
 import pytest
 
 # EstPower
@@ -45,6 +46,26 @@ def test_estpower_fail():
         eval_estpower(1, 1, 1, 2)
 
 
+def test_estpower_range():
+    with pytest.raises(_OutOfRangeError):
+        eval_estpower(2, 1, 1, 25)
+    with pytest.raises(_OutOfRangeError):
+        eval_estpower(2, 1, 1, 0)
+    with pytest.raises(_NotValidError):
+        eval_estpower(2, 1, 5, 8)
+
+
+def test_est_power_batch():
+    np = pytest.importorskip('numpy')
+    rows = [(2, d_group, m_group, h_service) for d_group in (1, 2) for m_group in (0, 1, 2, 3, 4, 5) for h_service in (0, 4, 5, 8, 10, 18, 24, 25)]
+    result = p.est_power_batch(*zip(*rows))
+    for row, pp in zip(rows, result):
+        try:
+            assert pp == eval_estpower(*row)
+        except (_OutOfRangeError, _NotValidError):
+            assert np.isnan(pp)
+
+
 # TransPower
 
 def eval_transpower(b_model, b_profile, b_type, est_power, g_ratio, l_corr, min_diam, max_diam, rpm):
@@ -57,4 +78,68 @@ def test_transpower():
 
 def test_transpower_fail():
     with pytest.raises(Exception):
-        eval_transpower(1, 'a', 'A-32', 2, 120/240, 850, 130, 240, 1750)
\ No newline at end of file
+        eval_transpower(1, 'a', 'A-32', 2, 120/240, 850, 130, 240, 1750)
+
+# Compiled rating indexes
+
+def eval_scan(f, *param):
+    try:
+        return f(*param)
+    except Exception:
+        return None
+
+
+def test_transpower_index():
+    iterator = _ReIterate()
+    for model, profile in [('HiPower', 'a'), ('SuperHC', '8v')]:
+        table_pb = getattr(p, f'{model}_{profile}_pb')
+        table_pa = getattr(p, f'{model}_{profile}_pa')
+        for diam in range(0, 700, 13):
+            for rpm in range(0, 6000, 190):
+                assert eval_scan(p._pb_index(model, profile).lookup, diam, rpm) == eval_scan(iterator.three_rows, table_pb, diam, rpm)
+        for g_ratio in [0.9, 1, 1.01, 1.02, 1.3, 1.5, 2, 3.385, 9.99, 10, 12]:
+            for rpm in range(0, 6000, 190):
+                assert eval_scan(p._pa_index(model, profile).lookup, g_ratio, rpm) == eval_scan(iterator.four_rows, table_pa, g_ratio, rpm)
+
+
+def test_transpower_bilinear():
+    drive = ('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750)
+    assert p.TransPower(*drive, basic_power='bilinear').belt_qty() == 0.5121666698802615
+    grid = p._pb_grid('HiPower', 'd')
+    for diam in grid.diams:
+        for rpm in range(950, 1950, 97):  # above the first rpm of every diameter, away from the duplicated rows
+            expected = eval_scan(p._pb_index('HiPower', 'd').lookup, diam, rpm)
+            if expected is not None:
+                assert abs(eval_scan(grid.lookup, diam, rpm) - expected[0]) < 1e-12
+    with pytest.raises(Exception):
+        p.TransPower(*drive, basic_power='cubic')
+    with pytest.raises(Exception):
+        grid.lookup(700, 1000)
+
+
+# belt_qty_batch
+
+def test_belt_qty_batch():
+    np = pytest.importorskip('numpy')
+    drives = [('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750),
+              ('HiPower', 'b', 'B-60', 12, 2.1, 1565, 140, 294, 1150),
+              ('HiPower', 'd', 'D-120', 80, 1.4, 3130, 355, 500, 870),
+              ('SuperHC', '3v', '3V500', 4, 1.8, 1270, 90, 162, 1160),
+              ('SuperHC', '8v', '8V1600', 150, 1.3, 4065, 400, 520, 575),
+              ('HiPower', 'a', 'A-32', 2, 130/240, 850, 130, 240, 9000),
+              ('HiPower', 'a', 'X-00', 2, 130/240, 850, 130, 240, 1750),
+              ('Other', 'a', 'A-32', 2, 130/240, 850, 130, 240, 1750)]
+    result = p.belt_qty_batch(*zip(*drives))
+    for drive, b_qty in zip(drives, result):
+        expected = eval_scan(eval_transpower, *drive)
+        if expected is None:
+            assert np.isnan(b_qty)
+        else:
+            assert b_qty == expected
+    bilinear = p.belt_qty_batch(*zip(*drives), basic_power='bilinear')
+    for drive, b_qty in zip(drives, bilinear):
+        expected = eval_scan(lambda *param: p.TransPower(*param, basic_power='bilinear').belt_qty(), *drive)
+        if expected is None:
+            assert np.isnan(b_qty)
+        else:
+            assert abs(b_qty - expected) < 1e-12
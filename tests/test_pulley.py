@@ -1,4 +1,6 @@
 from vbelts import pulley as p
+import random
+import pytest
 
 
 # Driven
@@ -26,4 +28,78 @@ def eval_driving(diam, b_profile, power, rpm, gear_ratio):
 
 
 def test_driving():
-    assert eval_driving(130, 'a', 3, 1000, 1.846) == 239.98000000000002
\ No newline at end of file
+    assert eval_driving(130, 'a', 3, 1000, 1.846) == 239.98000000000002
+
+def test_driven_commercial_series():
+    assert eval_driven_commercial(245, 'a', 3, 1750, 1.846, 130, 120)[0] == 240
+    assert p.Driven(245, 'a', 3, 1750, 1.846).commercial(130, 120, [100, 250, 315])[0] == 250
+
+
+def test_driven_commercial_fail():
+    with pytest.raises(p._ConvergenceError):
+        eval_driven_commercial(245, 'a', 3, 1750, 1.846, 130, 300)
+
+
+def test_commercial_batch():
+    np = pytest.importorskip('numpy')
+    result = p.commercial_batch(130, [1.846, 1.846], 1750, [120, 300])
+    assert [x[0] for x in result] == eval_driven_commercial(245, 'a', 3, 1750, 1.846, 130, 120)
+    assert np.isnan(result[0][1])
+
+
+
+def legacy_commercial(rpm, gear_ratio, driving_pulley, desired_pulley_diam, steps=20000):
+    """The time-bounded iteration Driven.commercial replaced, bounded by steps."""
+    rpm_output = rpm/gear_ratio
+    gear_ratio_max, gear_ratio_min = rpm/(rpm_output - 100), rpm/(rpm_output + 100)
+    diam_calc, error = gear_ratio * driving_pulley, 1
+    for _ in range(steps):
+        if not error > 0.01:
+            diam_out = 10 * round(diam_calc/10)
+            return [diam_out, diam_out/driving_pulley, rpm, rpm/(diam_out/driving_pulley)]
+        if diam_calc/driving_pulley > gear_ratio_max:
+            diam_calc -= diam_calc * error * 0.01
+        elif diam_calc/driving_pulley < gear_ratio_min:
+            diam_calc += diam_calc * error
+        else:
+            diam_calc *= error
+        error = 1-(diam_calc/desired_pulley_diam)
+    return None
+
+
+def eval_commercial_or_none(rpm, gear_ratio, driving_pulley, desired_pulley_diam):
+    try:
+        return eval_driven_commercial(245, 'a', 3, rpm, gear_ratio, driving_pulley, desired_pulley_diam)
+    except p._ConvergenceError:
+        return None
+
+
+def test_driven_commercial_legacy():
+    assert eval_driven_commercial(1, 'a', 3, 198.26, 3.81, 271.26, 138.96)[0] == 1020  # below 100 rpm the diameter shrinks 1 % first
+    assert eval_driven_commercial(1, 'a', 3, 4657, 1.80, 323.2, 608.7)[0] == 600  # converges from 96 % of the desired diameter
+    assert eval_commercial_or_none(1750, 1.846, 130, 300) is None
+    rnd = random.Random(0)
+    cases = [(rnd.uniform(100, 5000), rnd.uniform(1, 4), rnd.uniform(50, 400), rnd.uniform(0.8, 1.1)) for _ in range(500)]
+    for rpm, gear_ratio, driving_pulley, fraction in cases:
+        desired_pulley_diam = gear_ratio * driving_pulley * fraction
+        assert eval_commercial_or_none(rpm, gear_ratio, driving_pulley, desired_pulley_diam) == legacy_commercial(rpm, gear_ratio, driving_pulley, desired_pulley_diam)
+
+
+def test_driven_commercial_cap():
+    converging = (3675.386270893203, 1.905249367939708, 367.4766125932218, 739.4985482536935)  # at the step 46619
+    late = (4185.730353024954, 3.1664074455633573, 255.814336472327, 836.69665212564)  # at the step 69221
+    # the legacy loop bounded by the steps of the iteration and its check of the starting diameter
+    assert eval_commercial_or_none(*converging) == legacy_commercial(*converging, p.max_steps + 1) == [730, 1.9865209784331868, 3675.386270893203, 1850.1623243828321]
+    assert eval_commercial_or_none(*late) is legacy_commercial(*late, p.max_steps + 1) is None
+    assert legacy_commercial(*late, 100000) is not None  # converges after the cap
+
+
+def test_commercial_batch_legacy():
+    np = pytest.importorskip('numpy')
+    rnd = np.random.default_rng(0)
+    rpm, gear_ratio, driving_pulley = rnd.uniform(100, 5000, 500), rnd.uniform(1, 4, 500), rnd.uniform(50, 400, 500)
+    desired_pulley_diam = gear_ratio * driving_pulley * rnd.uniform(0.8, 1.1, 500)
+    diam_out = p.commercial_batch(driving_pulley, gear_ratio, rpm, desired_pulley_diam)[0]
+    for i in range(500):
+        scalar = eval_commercial_or_none(rpm[i], gear_ratio[i], driving_pulley[i], desired_pulley_diam[i])
+        assert (np.isnan(diam_out[i]) and scalar is None) or diam_out[i] == scalar[0]
\ No newline at end of file
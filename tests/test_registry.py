@@ -0,0 +1,47 @@
+from vbelts import belt, design, length, power, registry as r
+from vbelts.util import _NotValidError
+import pytest
+
+
+@pytest.fixture
+def acme(monkeypatch):
+    """Acme model, the HiPower tables with only the a and b profiles."""
+    monkeypatch.setattr(r, '_models', {})
+    hipower = r.get('HiPower')
+    return r.register('Acme', ('a', 'b'), hipower.boundaries[:1], hipower.limits, length.HiPower_length, power.hipower_fcc,
+                      {profile: hipower.pb[profile] for profile in ('a', 'b')},
+                      {profile: power.__getattr__(f'HiPower_{profile}_pa') for profile in ('a', 'b')})
+
+
+def test_get():
+    assert r.get('HiPower') is r.get('HiPower')
+    assert r.get('SuperHC').profiles == ('3v', '5v', '8v')
+    assert {'HiPower', 'SuperHC'} <= set(r.names())
+    with pytest.raises(_NotValidError):
+        r.get('Acme')
+    with pytest.raises(_NotValidError):
+        r.get(['HiPower'])
+
+
+def test_register(acme):
+    assert r.get('Acme') is acme and 'Acme' in r.names()
+    assert acme.basic['b'].diams == r.get('HiPower').basic['b'].diams
+    assert belt.Registered('Acme', 3, 500).profile == 'a'
+    assert belt.Registered('Acme', 90, 400).profile == 'b'  # d for HiPower
+    drive = ('a', 'A-32', 2, 130/240, 850, 130, 240, 1750)
+    assert power.TransPower('Acme', *drive).belt_qty() == power.TransPower('HiPower', *drive).belt_qty()
+    assert power.belt_qty_batch(['Acme', 'HiPower'], *drive).tolist() == [power.TransPower('HiPower', *drive).belt_qty()] * 2
+    result = design.design('normal torque ac', 'mill', 10, 5, 1750, 900, 'Acme', 100)
+    assert result._replace(vbelt_model='HiPower') == design.design('normal torque ac', 'mill', 10, 5, 1750, 900, 'HiPower', 100)
+
+
+def test_register_fail(monkeypatch):
+    monkeypatch.setattr(r, '_models', {})
+    hipower = r.get('HiPower')
+    with pytest.raises(ValueError):
+        r.register('Acme', ('a', 'b'), (), hipower.limits, hipower.length, power.hipower_fcc)
+    with pytest.raises(ValueError):
+        r.register('Acme', ('a',), (), hipower.limits, [{'profile': 'a', 'length': 695}], power.hipower_fcc)
+    with pytest.raises(_NotValidError):
+        r.register('Acme', ('a',), (), hipower.limits, hipower.length, power.hipower_fcc)  # no Acme_a_pb table
+    assert 'Acme' not in r.names()
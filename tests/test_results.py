@@ -0,0 +1,40 @@
+from vbelts import length, power, results as r
+import pytest
+
+drives = [(130, 240, 'HiPower', 'a', 2, 1750), (140, 294, 'HiPower', 'b', 12, 1150), (150, 290, 'SuperHC', '3v', 4, 1160)]
+
+
+def eval_size(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm):
+    distance = length.PulleyBelt(min_diam, maj_diam, vbelt_model, vbelt_profile)
+    trans_power = power.TransPower(vbelt_model, vbelt_profile, distance.b_type, est_power, maj_diam / min_diam, distance.l_corr, min_diam, maj_diam, rpm)
+    return distance.b_type, distance.c_c(), trans_power.belt_qty()
+
+
+def test_size():
+    for drive in drives:
+        result = r.size(*drive)
+        assert (result.vbelt_type, result.c_corr, result.belt_qty) == eval_size(*drive)
+        assert result.vbelt_profile == drive[3]
+
+
+def test_result_set():
+    result_set = r.size_many(drives + drives[:1])
+    assert len(result_set) == 4 and list(result_set) == [r.size(*drive) for drive in drives + drives[:1]]
+    assert result_set.values['vbelt_profile'] == ['a', 'b', '3v']
+    assert result_set.nbytes() < 4 * 64 + 6 * 60
+    assert not hasattr(result_set, '__dict__')
+
+
+def test_to_numpy():
+    pytest.importorskip('numpy')
+    result_set = r.size_many(drives)
+    columns = result_set.to_numpy()
+    assert list(columns) == list(r.BeltResult._fields)
+    assert columns['vbelt_type'].tolist() == [result.vbelt_type for result in result_set]
+    assert columns['belt_qty'].tolist() == [result.belt_qty for result in result_set]
+    with pytest.raises(BufferError):
+        result_set.append(result_set[0])
+    assert len(result_set) == 3 and len(result_set.codes['vbelt_type']) == 3
+    del columns
+    result_set.append(result_set[0])
+    assert len(result_set) == 4
@@ -0,0 +1,73 @@
+from vbelts import server as s
+import asyncio
+import json
+
+
+async def eval_requests(paths_bodies, window=0.005):
+    service = s.Server(window=window)
+    listener = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+
+    async def request(path, body):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        content = json.dumps(body).encode()
+        writer.write(f'POST {path} HTTP/1.1\r\nContent-Length: {len(content)}\r\nConnection: close\r\n\r\n'.encode() + content)
+        status = int((await reader.readline()).split()[1])
+        answer = json.loads((await reader.read()).split(b'\r\n\r\n', 1)[1])
+        writer.close()
+        return status, answer
+
+    answers = await asyncio.gather(*(request(path, body) for path, body in paths_bodies))
+    listener.close()
+    return answers, service.stats()
+
+
+def test_server():
+    belts = {'vbelt_model': 'HiPower', 'vbelt_profile': 'a', 'vbelt_type': 'A-32', 'est_power': 2, 'gear_ratio': 130/240,
+             'belt_length_corr': 850, 'min_diam': 130, 'maj_diam': 240, 'rpm': 1750}
+    requests = [('/belts', belts)] * 40 + [('/length', {'min_diam': 120, 'maj_diam': 240, 'vbelt_model': 'HiPower', 'vbelt_profile': 'a'}),
+                                           ('/profile', {'vbelt_model': 'SuperHC', 'est_power': 150, 'rpm': 575})]
+    answers, stats = asyncio.run(eval_requests(requests))
+    assert answers[0] == (200, {'belt_qty': 0.5060451558976288})
+    assert answers[40] == (200, {'l_corr': 1200.0, 'vbelt_type': 'A-46', 'c_corr': 311.7289224952741})
+    assert answers[41] == (200, {'vbelt_profile': '8v'})
+    assert stats['/belts']['requests'] == 40 and stats['/belts']['batches'] < 40
+
+
+def test_server_batches():
+    lengths = [(min_diam, maj_diam, model, 'a') for min_diam in range(60, 140, 4) for maj_diam in (240, 5000) for model in ('HiPower', 'Other')]
+    profiles = [(model, est_power, 1750) for est_power in range(1, 600, 15) for model in ('HiPower', 'Other')]
+    for compute, rows in ((s._length_rows, lengths), (s._profile_rows, profiles)):
+        single = [compute([row])[0] for row in rows]  # below the numpy batch size
+        batched = compute(rows)
+        assert [result for result in batched if isinstance(result, dict)] == [result for result in single if isinstance(result, dict)]
+        assert [type(result) for result in batched] == [type(result) for result in single]
+
+
+async def eval_raw(data, max_body=65536):
+    service = s.Server(max_body=max_body)
+    listener = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+    reader, writer = await asyncio.open_connection('127.0.0.1', listener.sockets[0].getsockname()[1])
+    writer.write(data)
+    status = int((await reader.readline()).split()[1])
+    answer = json.loads((await reader.read()).split(b'\r\n\r\n', 1)[1])
+    writer.close()
+    listener.close()
+    return status, answer
+
+
+def test_server_http():
+    belts = b'{"vbelt_model": "HiPower", "vbelt_profile": "a", "vbelt_type": "A-32", "est_power": Infinity, "gear_ratio": 0.5, "belt_length_corr": 850, "min_diam": 130, "maj_diam": 240, "rpm": 1750}'
+    assert asyncio.run(eval_raw(b'POST /belts HTTP/1.1\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s' % (len(belts), belts)))[0] == 422
+    assert asyncio.run(eval_raw(b'POST /belts HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s' % (len(belts), belts), max_body=100))[0] == 413
+    assert asyncio.run(eval_raw(b'POST/belts\r\n\r\n'))[0] == 400
+    assert asyncio.run(eval_raw(b'POST /belts HTTP/1.1\r\nContent-Length: ten\r\n\r\n'))[0] == 400
+
+
+def test_server_fail():
+    answers, _ = asyncio.run(eval_requests([('/belts', {'vbelt_model': 'HiPower'}),
+                                            ('/belts', {'vbelt_model': 'HiPower', 'vbelt_profile': 'a', 'vbelt_type': 'A-32', 'est_power': 2, 'gear_ratio': 0.5,
+                                                        'belt_length_corr': 850, 'min_diam': 130, 'maj_diam': 240, 'rpm': 9000}),
+                                            ('/profile', {'vbelt_model': 'Other', 'est_power': 1, 'rpm': 1}),
+                                            ('/other', {})]))
+    assert [status for status, _ in answers] == [400, 422, 422, 404]
@@ -0,0 +1,24 @@
+from vbelts import sweep as s
+from vbelts import length as l
+
+
+def test_sweep():
+    ranked = s.sweep(6.5, 1750, 900)
+    assert (ranked[0].vbelt_type, ranked[0].min_diam, ranked[0].belts) == ('B-55', 150, 1)
+    assert ranked == sorted(ranked, key=lambda result: (result.belts, result.c_corr))
+    for result in ranked[:10]:
+        dist = l.PulleyBelt(result.min_diam, result.maj_diam, result.vbelt_model, result.vbelt_profile)
+        assert (dist.l_corr, dist.b_type, dist.c_c()) == (result.l_corr, result.vbelt_type, result.c_corr)
+
+
+def test_sweep_prune():
+    limits = s._Limits('HiPower', 'a')
+    assert limits.feasible(100, 190, 1.9, 1750)
+    assert not limits.feasible(100, 190, 1.9, 9000)
+    assert not limits.feasible(100, 190, 12, 1750)
+    assert not limits.feasible(100, 900, 9, 1750)
+
+
+def test_sweep_many():
+    drives = [(6.5, 1750, 900), (40, 1750, 600)]
+    assert s.sweep_many(drives, step=10, processes=2, chunksize=50) == s.sweep_many(drives, step=10, processes=1)
@@ -0,0 +1,82 @@
+from vbelts import tables as t
+import pytest
+
+
+def test_write_read(tmp_path):
+    path = str(tmp_path / 'custom.vbt')
+    t.write(path, {'diameter': [65, 65.5], 'rpm': [200, 400], 'power_b': [0.19, 0.33]})
+    columns = t.read(path)
+    assert list(columns) == ['diameter', 'rpm', 'power_b']
+    assert columns['power_b'].tolist() == [0.19, 0.33]
+
+
+def test_read_fail(tmp_path):
+    path = tmp_path / 'custom.vbt'
+    path.write_bytes(b'diameter,rpm\n')
+    with pytest.raises(ValueError):
+        t.read(str(path))
+
+
+def test_load():
+    assert t.load('HiPower_a_pb') is t.load('HiPower_a_pb')
+    assert t.rows('HiPower_a_pb')[0] == {'diameter': '65', 'rpm': '200', 'power_b': '0.19'}
+    with pytest.raises(KeyError):
+        t.load('HiPower_z_pb')
+
+
+def test_text_columns(tmp_path):
+    path = str(tmp_path / 'Acme_fcc.vbt')
+    t.write(path, {'type': ['A-26', 'A-105'], 'fcc': [0.75, 1.12]})
+    assert t.read(path)['type'] == ['A-26', 'A-105']
+    columns = t.open_mapped(path)
+    assert isinstance(columns['fcc'], memoryview) and columns['fcc'].tolist() == [0.75, 1.12]
+    assert list(columns['type']) == ['A-26', 'A-105'] and columns['type'][-1] == 'A-105'
+
+
+def test_validate():
+    schema = t.schemas['pb']
+    t.validate({'diameter': [65.0, 65.0, 70.0], 'rpm': [200.0, 400.0, 200.0], 'power_b': [0.19, 0.33, 0.21]}, schema)
+    for columns in ({'diameter': [65.0], 'rpm': [200.0]},
+                    {'diameter': [65.0, 60.0], 'rpm': [200.0, 400.0], 'power_b': [0.19, 0.33]},
+                    {'diameter': [65.0, 65.0], 'rpm': [400.0, 200.0], 'power_b': [0.19, 0.33]},
+                    {'diameter': [65.0], 'rpm': [200.0], 'power_b': [float('nan')]}):
+        with pytest.raises(ValueError):
+            t.validate(columns, schema)
+    with pytest.raises(ValueError):
+        t.validate({'gr_low': [1.0], 'gr_high': [1.0], 'rpm': [200.0], 'power_a': [0.01]}, t.schemas['pa'])
+    with pytest.raises(ValueError):
+        t.validate({'type': ['A-26', 'A-26'], 'fcc': [0.75, 0.76]}, t.schemas['fcc'])
+
+
+def test_compile_csv(tmp_path):
+    source = tmp_path / 'acme.csv'
+    source.write_text('diameter,rpm,power_b\n65,200,0.19\n65,x,0.33\n')
+    with pytest.raises(ValueError, match='line 3'):
+        t.compile_csv(str(source), str(tmp_path / 'Acme_a_pb.vbt'), 'pb')
+    source.write_text('diameter,power_b\n65,0.19\n')
+    with pytest.raises(ValueError, match='rpm'):
+        t.compile_csv(str(source), str(tmp_path / 'Acme_a_pb.vbt'), 'pb')
+
+
+def test_add_catalog(tmp_path, monkeypatch):
+    from vbelts import length, power, registry
+    monkeypatch.setattr(t, 'catalog_dirs', list(t.catalog_dirs))
+    monkeypatch.setattr(t, '_loaded', {})
+    monkeypatch.setattr(registry, '_models', {})
+    for kind in ('pb', 'pa'):
+        source = tmp_path / f'{kind}.csv'
+        rows = t.rows(f'HiPower_a_{kind}')
+        source.write_text(','.join(rows[0]) + '\n' + ''.join(','.join(row.values()) + '\n' for row in rows))
+        t.compile_csv(str(source), str(tmp_path / f'Acme_a_{kind}.vbt'), kind)
+    source = tmp_path / 'fcc.csv'
+    source.write_text('type,fcc\n' + ''.join(f'{row["type"]},{row["fcc"]}\n' for row in power.hipower_fcc))
+    t.compile_csv(str(source), str(tmp_path / 'Acme_fcc.vbt'), 'fcc')
+    source = tmp_path / 'length.csv'
+    source.write_text('profile,length,type\n' + ''.join(f'{row["profile"]},{row["length"]},{row["type"]}\n' for row in length.HiPower_length))
+    t.compile_csv(str(source), str(tmp_path / 'Acme_length.vbt'), 'length')
+    t.add_catalog(tmp_path)
+    assert {'Acme_a_pa', 'Acme_a_pb', 'Acme_fcc', 'Acme_length', 'HiPower_a_pb'} <= set(t.names())
+    registry.register('Acme', ('a',), (), registry.get('HiPower').limits)
+    drive = ('a', 'A-32', 2, 130/240, 850, 130, 240, 1750)
+    assert power.TransPower('Acme', *drive).belt_qty() == power.TransPower('HiPower', *drive).belt_qty()
+    assert length.PulleyBelt(120, 240, 'Acme', 'a').l_c() == length.PulleyBelt(120, 240, 'HiPower', 'a').l_c()
@@ -0,0 +1,46 @@
+from vbelts.analysis import tolerance as t
+from vbelts import length, power
+from vbelts.util import _NotValidError, _OutOfRangeError
+import pytest
+
+np = pytest.importorskip('numpy')
+
+
+def eval_monte_carlo(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm, **kwargs):
+    report = t.monte_carlo(min_diam, maj_diam, vbelt_model, vbelt_profile, est_power, rpm, samples=1000, seed=0, **kwargs)
+    return report.belts, report.shortfall, report.out_of_range, report.belt_counts
+
+
+def test_monte_carlo_nominal():
+    distance = length.PulleyBelt(140, 294, 'HiPower', 'b')
+    belt_qty = power.TransPower('HiPower', 'b', distance.b_type, 12, 294/140, distance.l_corr, 140, 294, 1150).belt_qty()
+    report = t.monte_carlo(140, 294, 'HiPower', 'b', 12, 1150, samples=10, diam_tol=0, rpm_tol=0, power_tol=0)
+    assert report.belts == 3 and report.shortfall == 0 and report.belt_counts == {3: 1.0}
+    assert np.allclose(report.belt_qty, belt_qty) and np.allclose(report.c_corr, distance.c_c())
+    assert report.belt_qty_pct[50] == pytest.approx(belt_qty) and report.c_corr_pct[5] == pytest.approx(distance.c_c())
+
+
+def test_monte_carlo():
+    assert eval_monte_carlo(130, 240, 'HiPower', 'a', 2, 1750) == (1, 0.0, 0.0, {1: 1.0})
+    assert eval_monte_carlo(130, 240, 'HiPower', 'a', 2, 1750, belts=0)[1] == 1.0
+    belts, shortfall, out_of_range, belt_counts = eval_monte_carlo(140, 294, 'HiPower', 'b', 12, 1150, power_tol=0.1)
+    assert belts == 3 and 0 < shortfall < 1 and out_of_range == 0
+    assert sum(belt_counts.values()) == pytest.approx(1) and shortfall == pytest.approx(sum(v for k, v in belt_counts.items() if k > 3))
+    assert eval_monte_carlo(140, 294, 'HiPower', 'b', 12, 1150, power_tol=0.1) == (belts, shortfall, out_of_range, belt_counts)  # seeded
+
+
+def test_monte_carlo_reselect():
+    report = t.monte_carlo(140, 294, 'HiPower', 'b', 12, 1150, samples=1000, seed=0, wear=0.05, reselect=True)
+    fixed = t.monte_carlo(140, 294, 'HiPower', 'b', 12, 1150, samples=1000, seed=0, wear=0.05)
+    assert report.c_corr_pct[50] < fixed.c_corr_pct[50]  # the worn pulleys get a shorter belt
+
+
+def test_monte_carlo_out_of_range():
+    report = t.monte_carlo(100, 200, 'HiPower', 'a', 1, 5000, samples=1000, seed=0, rpm_tol=0.1)  # the fastest samples are out of the table
+    assert 0 < report.out_of_range < 1 and np.isnan(report.belt_qty).sum() == report.out_of_range * 1000
+    with pytest.raises(_NotValidError):
+        t.monte_carlo(130, 240, 'HiPower', 'a', 2, 1750, samples=0)
+    with pytest.raises(_NotValidError):
+        t.monte_carlo(130, 240, 'HiPower', 'a', 2, 1750, rpm_tol=-0.1)
+    with pytest.raises((_NotValidError, _OutOfRangeError)):
+        t.monte_carlo(130, 240, 'HiPower', 'x', 2, 1750)
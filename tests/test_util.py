@@ -0,0 +1,43 @@
+from vbelts import util as u
+import pytest
+
+
+def eval_motor(name):
+    return u.Motor(name, 3).group
+
+
+def eval_machine(name):
+    return u.Machine(name, 8).group
+
+
+def test_device():
+    assert eval_motor('multiple cylinders') == 1
+    assert eval_motor('high torque') == 2
+    assert eval_motor('ac') == 1  # the first name containing it
+    assert eval_motor('turbine') is None
+    assert eval_machine('reciprocating compressor') == 3
+    assert eval_machine('tire shop machine') == 4
+
+
+def test_device_fail():
+    with pytest.raises(ValueError):
+        eval_motor(3)
+
+
+def test_classify():
+    np = pytest.importorskip('numpy')
+    names = ['multiple cylinders', 'high torque', 'ac', 'turbine', 3]
+    groups, unknown = u.classify_motors(names)
+    assert groups.tolist() == [1, 2, 1, 0, 0]
+    assert unknown.tolist() == [False, False, False, True, True]
+    names = [line[0] for line in u.mach_group_data] + ['turbine']
+    groups, unknown = u.classify_machines(names)
+    assert groups.tolist() == [eval_machine(name) or 0 for name in names]
+    assert np.count_nonzero(unknown) == 1
+
+
+def test_iterate_three_rows():
+    from vbelts import power
+    iterator = u._Iterate('HiPower_a_pb', 'diameter', 'rpm', 'power_b')
+    for diam, rpm in [(65, 950), (67, 950), (67, 1000), (130, 1725), (131, 1725)]:  # on and between the diameters and speeds of the table
+        assert iterator.three_rows(diam, rpm) == u._ReIterate().three_rows(power.HiPower_a_pb, diam, rpm)